@@ -1,131 +1,425 @@
+import os
+import time
+import queue
+import argparse
+import threading
+import logging
+import multiprocessing as mp
+from functools import partial
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import time
 from tqdm import tqdm
-import logging
+from http_cache import CachedSession, HttpCache
+from rate_limit import HostLimiter
+from sink import RowSink
+from page_archive import PageArchive
+from html_parser import parse_html
+from crawl_state import CrawlState
+from dedup import Deduper
+from metrics import METRICS, LiveSummary
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+CATEGORY_URL = 'https://techcrunch.com/category/artificial-intelligence/'
+OUTPUT_CSV = 'techcrunch_ai_articles.csv'
+COLUMNS = ['title', 'date', 'content', 'keywords', 'url']
+SUMMARY_COLUMNS = ['title', 'date', 'content', 'keywords']  # 값이 있는 기사 수를 세는 열
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+RATE = 2.0            # techcrunch.com 초당 요청 수 (예전 요청 간격 0.5초와 같은 예의 범위)
+FETCH_WORKERS = 4     # 기사 수집 스레드 수 (속도 제한을 공유하므로 대기 시간을 겹치는 용도)
+PARSE_WORKERS = 2     # 파싱 프로세스 수
+QUEUE_SIZE = 64       # 목록 → 수집 워커 URL 큐 크기 (목록이 너무 앞서 나가지 않게)
+CHECKPOINT_ROWS = 30  # 이 행 수마다 flush + 완료 기록
+LISTING_CSS = '.wp-block-post-template.is-layout-flow.wp-block-post-template-is-layout-flow > li'
+
+
+def parse_article(html, article_url):
+    """기사 상세 페이지 HTML → 행 dict"""
+    doc = parse_html(html)
+
+    # 제목
+    head = doc.select_one('.article-hero__title.wp-block-post-title')
+    title = head.text(strip=True) if head else "제목 없음"
+
+    # 날짜
+    date_tag = doc.select_one('.wp-block-post-date > time')
+    date = date_tag.get('datetime') if date_tag else None
+
+    # 본문
+    content_tags = doc.select(
+        '.entry-content.wp-block-post-content.is-layout-constrained.wp-block-post-content-is-layout-constrained > p'
+    )
+    content = "\n".join(
+        p.text(strip=True) for p in content_tags) if content_tags else "본문 없음"
+
+    # 키워드
+    keywords_tag = doc.select_one('.wp-block-tc23-post-relevant-terms > div')
+    keywords = keywords_tag.text(", ", strip=True) if keywords_tag else None  # 용어별로 구분 (붙어서 한 덩어리가 되지 않게)
+
+    return {
+        'title': title,
+        'date': date,
+        'content': content,
+        'keywords': keywords,
+        'url': article_url
+    }
+
+
+def parse_listing_items(html):
+    """카테고리 목록 페이지 HTML → [{'url', 'label', 'date'}] (태그와 무관하게 카드 전부, date는 카드의 datetime 속성)"""
+    doc = parse_html(html)
+    items = []
+    for article in doc.select(LISTING_CSS):
+        title_link = article.select_one('div > div > div > h3 > a')
+        if not (title_link and title_link.get('href')):
+            continue
+        label_link = article.select_one('div > div > div > div > a')
+        time_tag = article.select_one('time[datetime]')
+        items.append({
+            'url': title_link.get('href'),
+            'label': label_link.text().strip() if label_link else None,
+            'date': time_tag.get('datetime') if time_tag else None,
+        })
+    return items
+
+
+def parse_listing(html):
+    """카테고리 목록 페이지 HTML → 'AI' 태그가 붙은 기사 URL 목록 (html: 문자열 또는 parse_html() 결과)"""
+    return [item['url'] for item in parse_listing_items(html) if item['label'] == 'AI']
+
+
+# =========================
+# 증분 수집: 기존 출력의 최신 날짜 + URL 집합
+# =========================
+def parse_date(s):
+    """ISO 8601 문자열 → 시간대 있는 datetime (시간대가 없으면 UTC로 간주, 못 읽으면 None)"""
+    if not s or not isinstance(s, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(s.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def load_high_water_mark(path):
+    """기존 출력 파일 → (가장 최근 date 또는 None, 저장된 URL 집합). 파일이 없으면 (None, 빈 집합)."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None, set()
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.jsonl':
+        df = pd.read_json(path, lines=True, dtype=False)[['date', 'url']]
+    elif ext == '.parquet':
+        df = pd.read_parquet(path, columns=['date', 'url'])
+    else:
+        df = pd.read_csv(path, usecols=['date', 'url'], dtype=str, encoding='utf-8-sig')
+    dates = [d for d in (parse_date(s) for s in df['date']) if d is not None]
+    return (max(dates) if dates else None), set(df['url'].dropna())
 
-def scrape_techcrunch_ai_articles(start_page=1, end_page=50):
-    """TechCrunch AI 카테고리에서 기사를 수집하는 함수"""
 
-    # 저장용 리스트
-    data = []
-    failed_urls = []
+def is_stale_page(items, known_urls, mark):
+    """
+    이미 본 페이지인지: AI 기사가 전부 저장된 URL이고, 카드 날짜가 모두 mark 이전(같음 포함).
+    목록은 최신순이므로 이런 페이지가 나오면 그 뒤 페이지도 전부 이미 수집한 구간.
+    """
+    if any(item['label'] == 'AI' and item['url'] not in known_urls for item in items):
+        return False
+    if mark is None:
+        return True
+    dates = [parse_date(item['date']) for item in items]
+    return all(d <= mark for d in dates if d is not None)
 
-    # 세션 사용으로 연결 효율성 향상
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    })
 
-    # 페이지 진행률 바
-    page_progress = tqdm(range(start_page, end_page + 1), desc="페이지 진행", unit="페이지")
+def row_from_page(html, meta):
+    """아카이브 레코드(원본 HTML + URL) → 출력 행"""
+    return parse_article(html, meta.get('url'))
 
-    for page in page_progress:
-        try:
-            url = f'https://techcrunch.com/category/artificial-intelligence/page/{page}/'
-            page_progress.set_description(f"페이지 {page} 처리 중")
 
-            response = session.get(url, timeout=10)
-            response.raise_for_status()  # HTTP 에러 발생시 예외 발생
+# =========================
+# 파이프라인: 목록 → (URL 큐) → 수집 워커 → (프로세스 풀) 파싱 → 싱크
+# =========================
+def listing_url(page):
+    return f'{CATEGORY_URL}page/{page}/'
 
-            soup = BeautifulSoup(response.text, 'html.parser')
 
-            # 기사 목록 선택
-            articles = soup.select('.wp-block-post-template.is-layout-flow.wp-block-post-template-is-layout-flow > li')
+def _parse_timed(html, article_url):
+    """파싱 프로세스에서 실행 (최상위 함수여야 피클 가능) → (행, 파싱 ms)"""
+    t0 = time.perf_counter()
+    row = parse_article(html, article_url)
+    return row, (time.perf_counter() - t0) * 1000
 
-            if not articles:
-                logger.warning(f"페이지 {page}에서 기사를 찾을 수 없습니다.")
-                continue
 
-            # 각 페이지의 기사 진행률 바
-            article_progress = tqdm(articles, desc=f"페이지 {page} 기사", leave=False, unit="기사")
+def _put(q, item, stop):
+    """bounded 큐에 넣되 중단 요청이 오면 포기 (가득 찬 큐에서 영원히 막히지 않게)"""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _new_session(cache, limiter):
+    session = CachedSession(cache=cache, limiter=limiter)
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+
+def _listing_stage(pages, cache, limiter, url_q, result_q, stop, n_fetchers, known_urls=None, mark=None):
+    """
+    목록 페이지를 순서대로 받아 AI 기사 URL을 큐로 흘려보냄 (큐가 차면 수집 워커가 따라올 때까지 대기)
+    known_urls가 있으면(증분 수집) 저장된 URL은 건너뛰고, 이미 본 페이지(is_stale_page)가 나오면 페이지 넘김 중단
+    증분 수집에서는 목록 페이지를 캐시 TTL과 상관없이 재검증 (6시간 안에 올라온 새 기사를 놓치지 않도록)
+    """
+    session = _new_session(cache, limiter)
+    headers = {"Cache-Control": "no-cache"} if known_urls is not None else None
+    seen = set(known_urls or ())
+    try:
+        for page in pages:
+            if stop.is_set():
+                break
+            url = listing_url(page)
+            try:
+                response = session.get(url, timeout=10, headers=headers)
+                response.raise_for_status()  # HTTP 에러 발생시 예외 발생
+                with METRICS.timer("parse_listing", "techcrunch", url):
+                    items = parse_listing_items(response.text)
+                article_urls = [item['url'] for item in items if item['label'] == 'AI']
+            except requests.RequestException as e:
+                result_q.put(("page_error", page, f"페이지 {page} 요청 실패: {e}"))
+                continue
+            except Exception as e:
+                result_q.put(("page_error", page, f"페이지 {page} 처리 중 오류: {e}"))
+                continue
+            new = [u for u in article_urls if u not in seen]
+            seen.update(new)
+            result_q.put(("page", page, len(new)))
+            for article_url in new:
+                if not _put(url_q, article_url, stop):
+                    break
+            if known_urls is not None and is_stale_page(items, known_urls, mark):
+                result_q.put(("stale", page, None))
+                break
+    finally:
+        session.close()
+        for _ in range(n_fetchers):
+            _put(url_q, None, stop)
+        result_q.put(("listing_done", None, None))
+
+
+def _fetch_stage(cache, limiter, url_q, result_q, stop):
+    """URL 큐에서 기사 URL을 꺼내 받아 옴 (호스트별 속도 제한은 모든 워커가 공유)"""
+    session = _new_session(cache, limiter)
+    try:
+        while not stop.is_set():
+            try:
+                article_url = url_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if article_url is None:
+                break
+            try:
+                t0 = time.perf_counter()
+                response = session.get(article_url, timeout=10)
+                response.raise_for_status()
+                result_q.put(("fetched", article_url, (response.text, (time.perf_counter() - t0) * 1000)))
+            except Exception as e:
+                result_q.put(("fetch_error", article_url, e))
+    finally:
+        session.close()
+        result_q.put(("fetcher_done", None, None))
+
+
+def scrape_techcrunch_ai_articles(start_page=1, end_page=50, archive_path='techcrunch_ai_articles.warc.gz',
+                                  output_path=OUTPUT_CSV, fetch_workers=FETCH_WORKERS,
+                                  parse_workers=PARSE_WORKERS, rate=RATE, incremental=False):
+    """
+    TechCrunch AI 카테고리에서 기사를 수집하는 함수 (archive_path: 원본 HTML 보관, None이면 보관 안 함)
+
+    단계별로 겹쳐 실행:
+    - 목록 스레드: 목록 페이지 → AI 기사 URL → bounded 큐 (queue_size)
+    - 수집 워커 fetch_workers개: 큐에서 URL을 꺼내 GET (techcrunch.com 전체 초당 rate 요청, 캐시 적중은 대기 없음)
+    - 파싱 프로세스 풀 parse_workers개 (0이면 메인 스레드에서 파싱)
+    - 메인 스레드: 끝나는 순서대로 아카이브 · 싱크(output_path) · 상태 · 중복 인덱스에 기록
+    → 전체 소요 시간이 왕복 시간의 합이 아니라 요청 예산(rate)으로 정해짐
+
+    incremental=True: 기존 output_path의 최신 date와 URL 집합을 기준으로 새 기사만 받아 파일 끝에 덧붙이고,
+    이미 본 목록 페이지가 나오면 end_page 전이라도 멈춤 (매일 갱신이 목록 몇 쪽 + 새 기사 몇 건으로 끝남)
+
+    반환: (summary, failed_urls) — 행은 싱크로만 내보내고 메모리에는 열별 건수와 첫 행 샘플만 남김
+    """
+
+    # 요약 통계 (전체 행은 output_path에만 있음)
+    summary = {"rows": 0, **{col: 0 for col in SUMMARY_COLUMNS}, "sample": None}
+    failed_urls = []
 
-            for article in article_progress:
+    # 디스크 캐시는 공유, 세션은 스레드마다 (속도 제한은 HostLimiter 하나를 공유)
+    cache = HttpCache()
+    limiter = HostLimiter(rate, burst=1)
+
+    # 원본 HTML 아카이브 (reparse.py로 재파싱)
+    archive = PageArchive(archive_path) if archive_path else None
+
+    # 증분 수집 기준 (전체 수집은 출력을 새로 쓰므로 기준 없음)
+    known_urls, mark = (None, None)
+    if incremental:
+        mark, known_urls = load_high_water_mark(output_path)
+        logger.info(f"증분 수집: 저장된 기사 {len(known_urls)}개, 최신 날짜 {mark.isoformat() if mark else '없음'}")
+
+    # URL별 상태·소요 시간 기록 (전체 수집은 출력을 매번 새로 쓰므로 완료 URL 스킵은 하지 않음)
+    state = CrawlState()
+
+    # 유사 중복 인덱스 (재게시·신디케이션 기사는 지우지 않고 클러스터로 기록)
+    dedup = Deduper()
+
+    # 완료되는 대로 CSV 끝에 덧붙임 (체크포인트마다 flush 후 상태 저장소에 완료 기록)
+    sink = RowSink(output_path, columns=COLUMNS, append=incremental)
+
+    pages = range(start_page, end_page + 1)
+    url_q = queue.Queue(maxsize=QUEUE_SIZE)
+    result_q = queue.Queue()
+    stop = threading.Event()
+    # 파싱 프로세스는 spawn으로 시작: 워커가 첫 submit 때 뒤늦게 만들어지는데, 그때는 수집 스레드가 이미 돌고 있어
+    # fork하면 다른 스레드가 잡고 있던 락(로깅·SQLite·큐)이 자식에 잠긴 채 복사되어 멈출 수 있음
+    pool = (ProcessPoolExecutor(max_workers=parse_workers, mp_context=mp.get_context("spawn"))
+            if parse_workers > 0 else None)
+
+    threads = [threading.Thread(target=_listing_stage, daemon=True,
+                                args=(pages, cache, limiter, url_q, result_q, stop, fetch_workers, known_urls, mark))]
+    threads += [threading.Thread(target=_fetch_stage, daemon=True, args=(cache, limiter, url_q, result_q, stop))
+                for _ in range(fetch_workers)]
+
+    # 페이지 진행률 바 + 기사 진행률 바 + 30초마다 단계별 소요 시간 요약 (진행률 바를 깨지 않게 tqdm.write로 출력)
+    page_progress = tqdm(total=len(pages), desc="페이지 진행", unit="페이지")
+    article_progress = tqdm(total=0, desc="기사", unit="기사", leave=False)
+    live = LiveSummary(interval=30, write=tqdm.write).start()
+
+    def on_parsed(article_url, fetch_ms, future):
+        result_q.put(("parsed", article_url, (future, fetch_ms)))
+
+    def record(article_url, row, fetch_ms, parse_ms):
+        METRICS.observe("parse", parse_ms, "techcrunch", article_url)
+        METRICS.incr("pages", site="techcrunch")
+        summary["rows"] += 1
+        for col in SUMMARY_COLUMNS:
+            summary[col] += row.get(col) is not None
+        if summary["sample"] is None:
+            summary["sample"] = row
+        sink.write(row)
+        state.defer_parsed(article_url, "techcrunch", fetch_ms=fetch_ms, parse_ms=parse_ms)
+        if sink.count % CHECKPOINT_ROWS == 0:
+            sink.flush()
+            state.commit_deferred()
+        matches = dedup.add_row(row, "techcrunch")
+        if matches:
+            logger.info(f"유사 기사 ({article_url}): {matches[0][0]} (유사도 {matches[0][1]:.2f})")
+        article_progress.update(1)
+        article_progress.set_description(f"수집된 기사: {summary['rows']}개")
+
+    def fail(article_url, e, what):
+        logger.error(f"{what} ({article_url}): {e}")
+        failed_urls.append(article_url)
+        state.mark_failed(article_url, "techcrunch", e)
+        METRICS.incr("failed", site="techcrunch")
+        article_progress.update(1)
+
+    for t in threads:
+        t.start()
+
+    running = 1 + fetch_workers  # 목록 스레드 + 수집 워커
+    pending = 0                  # 파싱 프로세스에 넘긴 뒤 아직 안 돌아온 기사 수
+    try:
+        while running or pending:
+            kind, key, payload = result_q.get()
+            if kind == "page":
+                page_progress.update(1)
+                article_progress.total += payload
+                article_progress.refresh()
+                if not payload:
+                    logger.warning(f"페이지 {key}에서 기사를 찾을 수 없습니다.")
+            elif kind == "stale":
+                tqdm.write(f"⏹️ 페이지 {key}: 이미 수집한 구간 → 목록 넘김 중단")
+            elif kind == "page_error":
+                page_progress.update(1)
+                logger.error(payload)
+            elif kind == "fetched":
+                html, fetch_ms = payload
+                if archive is not None:
+                    archive.append(key, html)
+                if pool is None:
+                    try:
+                        row, parse_ms = _parse_timed(html, key)
+                    except Exception as e:
+                        fail(key, e, "기사 파싱 중 오류")
+                        continue
+                    record(key, row, fetch_ms, parse_ms)
+                else:
+                    pending += 1
+                    pool.submit(_parse_timed, html, key).add_done_callback(partial(on_parsed, key, fetch_ms))
+            elif kind == "parsed":
+                pending -= 1
+                future, fetch_ms = payload
                 try:
-                    # 'AI' 태그가 있는 기사만
-                    label_link = article.select_one('div > div > div > div > a')
-                    if label_link and label_link.text.strip() == 'AI':
-                        # 기사 링크 추출
-                        title_link = article.select_one('div > div > div > h3 > a')
-                        if title_link and title_link.get('href'):
-                            article_url = title_link.get('href')
-
-                            try:
-                                response2 = session.get(article_url, timeout=10)
-                                response2.raise_for_status()
-
-                                soup2 = BeautifulSoup(response2.text, 'html.parser')
-
-                                # 제목
-                                head = soup2.select_one('.article-hero__title.wp-block-post-title')
-                                title = head.get_text(strip=True) if head else "제목 없음"
-
-                                # 날짜
-                                date_tag = soup2.select_one('.wp-block-post-date > time')
-                                date = date_tag.get('datetime') if date_tag else None
-
-                                # 본문
-                                content_tags = soup2.select(
-                                    '.entry-content.wp-block-post-content.is-layout-constrained.wp-block-post-content-is-layout-constrained > p'
-                                )
-                                content = "\n".join(
-                                    p.get_text(strip=True) for p in content_tags) if content_tags else "본문 없음"
-
-                                # 키워드
-                                keywords_tag = soup2.select_one('.wp-block-tc23-post-relevant-terms > div')
-                                keywords = keywords_tag.get_text(strip=True) if keywords_tag else None
-
-                                # 누적 저장
-                                data.append({
-                                    'title': title,
-                                    'date': date,
-                                    'content': content,
-                                    'keywords': keywords,
-                                    'url': article_url
-                                })
-
-                                article_progress.set_description(f"수집된 기사: {len(data)}개")
-
-                            except requests.RequestException as e:
-                                logger.error(f"기사 상세 페이지 요청 실패 ({article_url}): {e}")
-                                failed_urls.append(article_url)
-                            except Exception as e:
-                                logger.error(f"기사 파싱 중 오류 ({article_url}): {e}")
-                                failed_urls.append(article_url)
-
-                            # 예의상 딜레이
-                            time.sleep(0.5)
-
+                    row, parse_ms = future.result()
                 except Exception as e:
-                    logger.error(f"기사 처리 중 오류: {e}")
+                    fail(key, e, "기사 파싱 중 오류")
                     continue
-
-        except requests.RequestException as e:
-            logger.error(f"페이지 {page} 요청 실패: {e}")
-            continue
-        except Exception as e:
-            logger.error(f"페이지 {page} 처리 중 오류: {e}")
-            continue
-
-    return data, failed_urls
+                record(key, row, fetch_ms, parse_ms)
+            elif kind == "fetch_error":
+                fail(key, payload, "기사 상세 페이지 요청 실패")
+            elif kind in ("listing_done", "fetcher_done"):
+                running -= 1
+    finally:
+        stop.set()
+        for t in threads:
+            t.join(timeout=30)
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        live.stop()
+        page_progress.close()
+        article_progress.close()
+        sink.close()
+        state.commit_deferred()
+        if archive is not None:
+            archive.close()
+        dedup.close()
+        cache.close()
+
+    return summary, failed_urls
 
 
 def main():
     """메인 실행 함수"""
+    ap = argparse.ArgumentParser(description="TechCrunch AI 기사 수집")
+    ap.add_argument("--start", type=int, default=1, help="시작 목록 페이지")
+    ap.add_argument("--end", type=int, default=50, help="마지막 목록 페이지")
+    ap.add_argument("--out", default=OUTPUT_CSV, help="출력 파일 (.csv/.jsonl/.parquet)")
+    ap.add_argument("--workers", type=int, default=FETCH_WORKERS, help="기사 수집 워커 수")
+    ap.add_argument("--parse-workers", type=int, default=PARSE_WORKERS, help="파싱 프로세스 수 (0=메인 스레드)")
+    ap.add_argument("--rate", type=float, default=RATE, help="techcrunch.com 초당 요청 수")
+    ap.add_argument("--incremental", action="store_true",
+                    help="기존 출력의 최신 날짜·URL 이후 새 기사만 덧붙이고 이미 본 목록 페이지에서 멈춤")
+    args = ap.parse_args()
+
     print("TechCrunch AI 기사 수집을 시작합니다...")
 
     # 기사 수집 실행
-    data, failed_urls = scrape_techcrunch_ai_articles(start_page=1, end_page=50)
+    summary, failed_urls = scrape_techcrunch_ai_articles(
+        start_page=args.start, end_page=args.end, output_path=args.out,
+        fetch_workers=args.workers, parse_workers=args.parse_workers, rate=args.rate,
+        incremental=args.incremental,
+    )
+    json_path, prom_path = METRICS.export("techcrunch_metrics")
+    print(f"단계별 소요 시간 저장: {json_path}, {prom_path}")
 
     # 결과 출력
     print(f"\n수집 완료!")
-    print(f"총 {len(data)}개의 기사를 수집했습니다.")
+    print(f"총 {summary['rows']}개의 {'새 ' if args.incremental else ''}기사를 수집했습니다.")
 
     if failed_urls:
         print(f"실패한 URL {len(failed_urls)}개:")
@@ -134,26 +428,21 @@ def main():
         if len(failed_urls) > 5:
             print(f"  ... 그 외 {len(failed_urls) - 5}개")
 
-    if data:
-        # 데이터프레임으로 변환
-        df = pd.DataFrame(data)
-
+    if summary["rows"]:
         # 기본 통계 정보
         print(f"\n데이터 정보:")
-        print(f"  - 제목이 있는 기사: {df['title'].notna().sum()}개")
-        print(f"  - 날짜가 있는 기사: {df['date'].notna().sum()}개")
-        print(f"  - 본문이 있는 기사: {df['content'].notna().sum()}개")
-        print(f"  - 키워드가 있는 기사: {df['keywords'].notna().sum()}개")
+        print(f"  - 제목이 있는 기사: {summary['title']}개")
+        print(f"  - 날짜가 있는 기사: {summary['date']}개")
+        print(f"  - 본문이 있는 기사: {summary['content']}개")
+        print(f"  - 키워드가 있는 기사: {summary['keywords']}개")
 
-        # CSV 파일로 저장
-        filename = 'techcrunch_ai_articles.csv'
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"\n결과가 '{filename}' 파일로 저장되었습니다.")
+        # 수집하면서 이미 저장됨 (완료 순서)
+        print(f"\n결과가 '{args.out}' 파일로 저장되었습니다.")
 
         # 샘플 데이터 출력
-        if len(df) > 0:
+        if summary["sample"] is not None:
             print(f"\n첫 번째 기사 샘플:")
-            first_article = df.iloc[0]
+            first_article = summary["sample"]
             print(f"  제목: {first_article['title'][:100]}...")
             print(f"  날짜: {first_article['date']}")
             print(f"  키워드: {first_article['keywords']}")
@@ -163,4 +452,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
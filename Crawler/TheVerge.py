@@ -5,26 +5,48 @@ The Verge AI 아카이브 크롤러 (링크 수집 + 기사 파싱 + CSV 저장)
 사용 예:
 python theverge_ai_scraper.py --start 2025-09-01 --end 2025-09-01 --output ./TheVerge.csv
 python theverge_ai_scraper.py --start 2025-01-01 --end 2025-09-01 --section ai-artificial-intelligence --output ~/Downloads/theverge_ai.csv
+python theverge_ai_scraper.py --start 2025-01-01 --end 2025-09-01 --output ./TheVerge.csv --reparse   # 아카이브에서 CSV 재생성
+python theverge_ai_scraper.py --output ./TheVerge.csv --compact   # url 중복 행 정리 (평소 실행은 덧붙이기만)
 """
 
-import os, re, sys, json, time, argparse
+import os, re, sys, json, time, sqlite3, argparse, threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from html import unescape
 from urllib.parse import urljoin, urlparse
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
 from tqdm import tqdm
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from http_cache import CachedSession
+from page_archive import PageArchive, archive_path_for
+from html_parser import Document, parse_html
+from crawl_state import CrawlState, DEFAULT_STATE_DB
+from sink import RowSink, UrlIndex, compact_output, read_output
+from rate_limit import HostLimiter
+from dedup import Deduper
+from metrics import METRICS, LiveSummary
+
+try:
+    import orjson  # JSON-LD 파싱 가속 (없으면 표준 json)
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # =========================
 # 설정
 # =========================
 BASE = "https://www.theverge.com"
 DEFAULT_SECTION = "ai-artificial-intelligence"  # 아카이브 섹션
-PAUSE = 1.2  # 서버 예의상 대기
+SITE = "theverge"  # 크롤 상태 저장소(crawl_state.py)의 사이트 이름
+PAUSE = 1.2  # 서버 예의상 대기 (실제 네트워크 요청 간 최소 간격, 캐시 적중 시 대기 없음)
+DISCOVERY_WORKERS = 4  # 월별 링크 수집 동시 작업 수 (요청 간격 PAUSE는 공유)
+CHECKPOINT_ROWS = 30  # 이 행 수마다 출력 flush + URL 인덱스·상태 저장소 기록
+COLUMNS = ["date", "title", "abstract", "keywords", "url"]
+MONTH_SETTLE_DAYS = 3  # 달이 끝나고 이만큼 지나면 아카이브가 확정된 것으로 보고 링크 캐시 재사용
 
 HEADERS = {
     "User-Agent": (
@@ -42,8 +64,9 @@ ARTICLE_HREF_PAT = re.compile(
 # =========================
 # 유틸
 # =========================
-def get_session():
-    s = requests.Session()
+def get_session(limiter: HostLimiter = None):
+    """limiter를 주면 요청 간격을 다른 세션(스레드)과 공유, 없으면 이 세션만 PAUSE 간격"""
+    s = CachedSession(min_interval=PAUSE, limiter=limiter)
     retries = Retry(
         total=5,
         backoff_factor=0.5,
@@ -90,19 +113,21 @@ def coerce_date_iso(s: str) -> str:
 # =========================
 # 링크 수집
 # =========================
-def guess_total_pages(html: str) -> int:
+PAGE_OF_PAT = re.compile(r"[Pp]age\s*(?:<[^>]*>\s*)*\d+\s*(?:<[^>]*>\s*)*of\s*(?:<[^>]*>\s*)*(\d+)")
+
+def guess_total_pages(doc) -> int:
     """
     'Page 1 of N' 패턴 우선 탐지. 실패 시 1 페이지로 가정.
+    doc: parse_html() 결과(링크 추출과 트리 공유) 또는 HTML 문자열
     """
-    soup = BeautifulSoup(html, "html.parser")
-    # 자주 보이는 'Page X of Y' 텍스트 탐색
-    text = soup.get_text(" ", strip=True)
-    m = re.search(r"[Pp]age\s+\d+\s+of\s+(\d+)", text)
+    doc = parse_html(doc)
+    # 'Page X of Y' 텍스트: 문서 전체 get_text 대신 원문에서 태그를 건너뛰며 정규식 탐색
+    m = PAGE_OF_PAT.search(doc.html)
     if m:
         return max(1, int(m.group(1)))
     # 페이지네이션 a[aria-label="Page N"] 최댓값 탐색
     nums = []
-    for a in soup.find_all("a"):
+    for a in doc.select('a[aria-label^="Page"]'):
         label = (a.get("aria-label") or "").strip()
         m2 = re.match(r"Page\s+(\d+)$", label)
         if m2:
@@ -111,69 +136,157 @@ def guess_total_pages(html: str) -> int:
         return max(nums)
     return 1
 
-def extract_archive_links(html: str) -> list:
+def extract_archive_links(doc) -> list:
     """
     아카이브 페이지에서 기사 링크 추출. 패턴 기반 필터로 안정화.
+    doc: parse_html() 결과 또는 HTML 문자열
     """
-    soup = BeautifulSoup(html, "html.parser")
+    doc = parse_html(doc)
     links = set()
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    for a in doc.select("a[href]"):
+        href = a.get("href")
         if "#comments" in href:
             continue
         if ARTICLE_HREF_PAT.search(href):
             links.add(to_abs(href))
     return list(links)
 
-def collect_theverge_links(start_date: str, end_date: str, section: str = DEFAULT_SECTION) -> list:
+def month_partitions(start_date: str, end_date: str) -> list:
+    """start_date~end_date(YYYY-MM-DD)가 걸친 달 → [(연, 월)]"""
+    start = datetime.strptime(start_date, "%Y-%m-%d").replace(day=1)
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    out, current = [], start
+    while current <= end:
+        out.append((current.year, current.month))
+        current += relativedelta(months=1)
+    return out
+
+def month_is_settled(y: int, m: int, now: datetime = None) -> bool:
+    """달이 끝나고 MONTH_SETTLE_DAYS가 지났으면 아카이브가 더 바뀌지 않는다고 보고 캐시 재사용"""
+    now = now or datetime.now()
+    return now >= datetime(y, m, 1) + relativedelta(months=1, days=MONTH_SETTLE_DAYS)
+
+class MonthLinkCache:
     """
-    start_date~end_date 사이 각 월의 아카이브에서 기사 URL 수집.
-    YYYY-MM-DD 형식.
+    월별 아카이브 링크 수집 결과 (크롤 상태 저장소의 verge_months 테이블)
+    다 끝난 달은 다시 긁지 않고, 이번 달처럼 바뀔 수 있는 달만 다시 수집.
     """
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    sess = get_session()
 
+    def __init__(self, db_path: str = DEFAULT_STATE_DB):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS verge_months (
+                section TEXT NOT NULL,
+                month TEXT NOT NULL,
+                pages INTEGER NOT NULL,
+                links TEXT NOT NULL,
+                discovered_at REAL NOT NULL,
+                PRIMARY KEY (section, month)
+            )
+        """)
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def get(self, section: str, y: int, m: int):
+        """캐시된 링크 목록 (없거나, 수집 시점에 달이 아직 안 끝났으면 None)"""
+        with self._lock:
+            row = self._db.execute("SELECT links, discovered_at FROM verge_months WHERE section=? AND month=?",
+                                   (section, f"{y:04d}-{m:02d}")).fetchone()
+        if row is None or not month_is_settled(y, m, datetime.fromtimestamp(row[1])):
+            return None
+        return json.loads(row[0])
+
+    def put(self, section: str, y: int, m: int, pages: int, links: list):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO verge_months (section, month, pages, links, discovered_at) "
+                             "VALUES (?, ?, ?, ?, ?)",
+                             (section, f"{y:04d}-{m:02d}", pages, json.dumps(sorted(links)), time.time()))
+            self._db.commit()
+
+def discover_month(sess: requests.Session, section: str, y: int, m: int):
+    """
+    한 달치 아카이브 → (링크 목록, 페이지 수, 끝까지 수집했는지)
+    1페이지 응답 하나로 전체 페이지 수와 1페이지 링크를 같이 뽑음 (같은 페이지를 두 번 받지 않음)
+    """
+    links = set()
+    first_url = f"{BASE}/archives/{section}/{y}/{m}/1"
+    try:
+        r = sess.get(first_url, timeout=30)
+        r.raise_for_status()
+    except requests.RequestException as e:
+        tqdm.write(f"⚠️ {y}-{m:02d} 1페이지 요청 실패: {e}")
+        return [], 0, False
+    doc = parse_html(r.text)
+    total_pages = guess_total_pages(doc)
+    links.update(extract_archive_links(doc))
+    if not links:
+        return [], 1, True
+
+    for page in range(2, total_pages + 1):
+        url = f"{BASE}/archives/{section}/{y}/{m}/{page}"
+        try:
+            resp = sess.get(url, timeout=30)
+        except requests.RequestException as e:
+            tqdm.write(f"⚠️ {url} 요청 실패: {e}")
+            return sorted(links), page - 1, False
+        if resp.status_code == 404:
+            break                                   # 마지막 페이지 뒤 → 정상 종료
+        if resp.status_code >= 400:                 # 429/5xx 등 → 이 달은 미완료로 남겨 다음 실행에 재수집
+            tqdm.write(f"⚠️ {url} HTTP {resp.status_code} → 미완료")
+            return sorted(links), page - 1, False
+        page_links = extract_archive_links(parse_html(resp.text))
+        if not page_links:
+            break
+        links.update(page_links)
+    return sorted(links), total_pages, True
+
+def collect_theverge_links(start_date: str, end_date: str, section: str = DEFAULT_SECTION,
+                           workers: int = DISCOVERY_WORKERS, rediscover: bool = False) -> list:
+    """
+    start_date~end_date 사이 각 월의 아카이브에서 기사 URL 수집. YYYY-MM-DD 형식.
+
+    - 달마다 독립 작업으로 workers개 스레드가 동시에 수집 (theverge.com 전체 요청 간격 PAUSE는 모든 스레드가 공유)
+    - 다 끝난 달은 MonthLinkCache 결과를 그대로 사용 → 재실행 시 이번 달처럼 바뀔 수 있는 달만 다시 수집
+    - rediscover=True면 캐시 무시
+    """
+    months = month_partitions(start_date, end_date)
+    cache = MonthLinkCache()
     collected = set()
-    current = start
 
-    while current <= end:
-        y, m = current.year, current.month
-        first_url = f"{BASE}/archives/{section}/{y}/{m}/1"
-        print(f"\n🔍 페이지 수 확인: {first_url}")
-        try:
-            r = sess.get(first_url, timeout=30)
-            r.raise_for_status()
-            total_pages = guess_total_pages(r.text)
-        except Exception as e:
-            print(f"⚠️ 페이지 수 추출 실패: {e}")
-            total_pages = 1
-
-        # 페이지 순회
-        seen_any = False
-        for page in range(1, total_pages + 1):
-            url = f"{BASE}/archives/{section}/{y}/{m}/{page}"
-            print(f"📄 크롤링: {url}")
-            try:
-                resp = sess.get(url, timeout=30)
-                if resp.status_code >= 400:
-                    print(f"  ↳ 건너뜀 HTTP {resp.status_code}")
-                    break
-                page_links = extract_archive_links(resp.text)
-                if not page_links:
-                    print("  ↳ 기사 링크 없음. 다음 달로.")
-                    break
-                for lk in page_links:
-                    collected.add(lk)
-                seen_any = True
-                time.sleep(PAUSE)
-            except requests.RequestException as e:
-                print(f"  ↳ 요청 실패: {e}")
-                break
-
-        if not seen_any:
-            print("  ↳ 이 달은 수집 링크 없음.")
-        current += relativedelta(months=1)
+    todo = []
+    for y, m in months:
+        cached = None if rediscover else cache.get(section, y, m)
+        if cached is None:
+            todo.append((y, m))
+        else:
+            collected.update(cached)
+    print(f"\n🔍 아카이브 {len(months)}개월 중 캐시 {len(months) - len(todo)}개월, 수집 {len(todo)}개월 "
+          f"(동시 {min(workers, len(todo)) if todo else 0}개)")
+
+    limiter = HostLimiter(1 / PAUSE, burst=1)
+    local = threading.local()
+
+    def run(y, m):
+        if not hasattr(local, "sess"):
+            local.sess = get_session(limiter)
+        return discover_month(local.sess, section, y, m)
+
+    if todo:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(run, y, m): (y, m) for y, m in todo}
+            for fut in tqdm(as_completed(futures), total=len(futures), desc="📅 월별 링크 수집"):
+                y, m = futures[fut]
+                links, pages, complete = fut.result()
+                collected.update(links)
+                tqdm.write(f"📄 {y}-{m:02d}: {pages}페이지, 링크 {len(links)}개" + ("" if complete else " (일부 실패, 캐시 안 함)"))
+                if complete:
+                    cache.put(section, y, m, pages, links)
+    cache.close()
 
     print(f"\n✅ 수집 링크: {len(collected)}개")
     return sorted(collected)
@@ -181,15 +294,31 @@ def collect_theverge_links(start_date: str, end_date: str, section: str = DEFAUL
 # =========================
 # 기사 파싱
 # =========================
-def parse_json_ld(soup: BeautifulSoup) -> dict:
+LD_JSON_PAT = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']application/ld\+json["'][^>]*>(.*?)</script\s*>""", re.I | re.S
+)
+META_TAG_PAT = re.compile(r"<meta\b[^>]*>", re.I)
+ATTR_PAT = re.compile(r"""([\w:.-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+# JSON-LD에서 못 찾았을 때 쓰는 메타 (속성, 값) — parse_meta_fallback과 같은 우선순위
+ABSTRACT_META = (("name", "description"), ("property", "og:description"), ("name", "twitter:description"))
+KEYWORDS_META = (("name", "news_keywords"), ("name", "keywords"))
+_FAST_META = set(ABSTRACT_META + KEYWORDS_META)
+
+def parse_json_ld(doc: Document) -> dict:
     """
     JSON-LD에서 headline, description, datePublished, keywords를 우선 추출.
     """
+    return _json_ld_fields(sc.text() or "" for sc in doc.select('script[type="application/ld+json"]'))
+
+def parse_json_ld_fast(html: str) -> dict:
+    """parse_json_ld와 같은 결과를 DOM 없이: 원문에서 ld+json 블록만 정규식으로 잘라 JSON 파싱"""
+    return _json_ld_fields(m.group(1) for m in LD_JSON_PAT.finditer(html or ""))
+
+def _json_ld_fields(blocks) -> dict:
     data = {"title": None, "abstract": None, "date": None, "keywords": None}
-    scripts = soup.find_all("script", type="application/ld+json")
-    for sc in scripts:
+    for block in blocks:
         try:
-            payload = json.loads(sc.string or "")
+            payload = json_loads(block)
         except Exception:
             continue
         cand = []
@@ -222,7 +351,7 @@ def parse_json_ld(soup: BeautifulSoup) -> dict:
                 return data
     return data
 
-def parse_meta_fallback(soup: BeautifulSoup, current: dict) -> dict:
+def parse_meta_fallback(doc: Document, current: dict) -> dict:
     """
     메타 태그와 본문에서 폴백 추출.
     """
@@ -230,57 +359,76 @@ def parse_meta_fallback(soup: BeautifulSoup, current: dict) -> dict:
 
     # 제목
     if not out.get("title"):
-        h1 = soup.find("h1")
-        out["title"] = clean_text(h1.get_text()) if h1 else None
+        h1 = doc.select_one("h1")
+        out["title"] = clean_text(h1.text()) if h1 else None
 
     # 요약
     if not out.get("abstract"):
-        md = soup.find("meta", attrs={"name": "description"})
+        md = doc.select_one('meta[name="description"]')
         if not md:
-            md = soup.find("meta", property="og:description") or soup.find("meta", attrs={"name": "twitter:description"})
+            md = doc.select_one('meta[property="og:description"]') or doc.select_one('meta[name="twitter:description"]')
         if md and md.get("content"):
             out["abstract"] = clean_text(md["content"])
         else:
             # 본문 일부
-            paras = soup.select("article p")
+            paras = doc.select("article p")
             if not paras:
                 # 다른 컨테이너 폴백
-                paras = soup.find_all("p")
-            text = " ".join([clean_text(p.get_text()) for p in paras[:5]])
+                paras = doc.select("p")
+            text = " ".join([clean_text(p.text()) for p in paras[:5]])
             out["abstract"] = text if text else None
 
     # 키워드
     if not out.get("keywords"):
-        mk = soup.find("meta", attrs={"name": "news_keywords"}) or soup.find("meta", attrs={"name": "keywords"})
+        mk = doc.select_one('meta[name="news_keywords"]') or doc.select_one('meta[name="keywords"]')
         if mk and mk.get("content"):
             out["keywords"] = clean_text(mk["content"])
         else:
             # 목록 폴백
-            kws = [li.get_text(strip=True) for li in soup.select("#zephr-anchor ul li")]
+            kws = [li.text(strip=True) for li in doc.select("#zephr-anchor ul li")]
             out["keywords"] = ", ".join(kws) if kws else None
 
     # 날짜
     if not out.get("date"):
-        t = soup.find("time")
-        dt = t.get("datetime") if t and t.has_attr("datetime") else (t.get_text(strip=True) if t else None)
+        t = doc.select_one("time")
+        dt = t.get("datetime") if t and t.get("datetime") is not None else (t.text(strip=True) if t else None)
         out["date"] = dt or None
 
     return out
 
-def scrape_article(url: str, sess: requests.Session) -> dict:
+def parse_meta_fast(html: str, current: dict) -> dict:
     """
-    단일 기사 파싱 → dict 반환
+    parse_meta_fallback의 메타 태그 부분만 DOM 없이 (<meta> 태그를 정규식으로 훑음).
+    h1/본문/time 폴백은 하지 않으므로 남은 빈 필드는 parse_meta_fallback으로.
     """
-    try:
-        r = sess.get(url, timeout=40)
-        r.raise_for_status()
-    except requests.RequestException as e:
-        return {"url": url, "error": f"request_failed: {e}"}
-
-    soup = BeautifulSoup(r.text, "html.parser")
+    out = dict(current)
+    if out.get("abstract") and out.get("keywords"):
+        return out
+    metas = {}
+    for tag in META_TAG_PAT.finditer(html or ""):
+        attrs = {k.lower(): next((v for v in vals if v), "") for k, *vals in ATTR_PAT.findall(tag.group())}
+        for key in (("name", attrs.get("name")), ("property", attrs.get("property"))):
+            if key in _FAST_META:
+                metas.setdefault(key, unescape(attrs.get("content", "")))
+    for field, names in (("abstract", ABSTRACT_META), ("keywords", KEYWORDS_META)):
+        if not out.get(field):
+            # DOM 폴백과 같게: 우선순위상 처음 있는 태그의 content (비어 있으면 본문 폴백으로 넘김)
+            first = next((metas[n] for n in names if n in metas), "")
+            if first:
+                out[field] = clean_text(first)
+    return out
 
-    data = parse_json_ld(soup)
-    data = parse_meta_fallback(soup, data)
+def parse_article_html(html: str, url: str) -> dict:
+    """
+    기사 HTML → dict (JSON-LD 우선, 메타/본문 폴백)
+    빠른 경로: 원문에서 JSON-LD·메타 태그만 정규식으로 추출, 그래도 빈 필드가 있을 때만 전체 DOM 파싱
+    """
+    data = parse_json_ld_fast(html)
+    if not all(data.values()):
+        data = parse_meta_fast(html, data)
+    if not all(data.values()):
+        with METRICS.timer("parse_dom_fallback", SITE, url):
+            data = parse_meta_fallback(parse_html(html), data)
 
     return {
         "date": coerce_date_iso(data.get("date") or "N/A"),
@@ -290,71 +438,163 @@ def scrape_article(url: str, sess: requests.Session) -> dict:
         "url": url,
     }
 
+def row_from_page(html: str, meta: dict) -> dict:
+    """아카이브 레코드(원본 HTML + URL) → 출력 행"""
+    return parse_article_html(html, meta.get("url"))
+
+def scrape_article(url: str, sess: requests.Session, archive: PageArchive = None) -> dict:
+    """
+    단일 기사 파싱 → dict 반환
+    """
+    try:
+        r = sess.get(url, timeout=40)
+        r.raise_for_status()
+    except requests.RequestException as e:
+        return {"url": url, "error": f"request_failed: {e}"}
+
+    if archive is not None:
+        archive.append(url, r.text)
+    with METRICS.timer("parse", SITE, url):
+        return parse_article_html(r.text, url)
+
 # =========================
 # 메인
 # =========================
 def main():
     ap = argparse.ArgumentParser(description="The Verge AI 아카이브 크롤러")
-    ap.add_argument("--start", required=True, help="시작 날짜 YYYY-MM-DD")
-    ap.add_argument("--end", required=True, help="종료 날짜 YYYY-MM-DD")
+    ap.add_argument("--start", default=None, help="시작 날짜 YYYY-MM-DD")
+    ap.add_argument("--end", default=None, help="종료 날짜 YYYY-MM-DD")
     ap.add_argument("--section", default=DEFAULT_SECTION, help="아카이브 섹션 경로 (기본: ai-artificial-intelligence)")
     ap.add_argument("--output", default="./theverge.csv", help="출력 CSV 경로")
-    ap.add_argument("--resume", action="store_true", help="이미 저장된 URL은 건너뛰기")
+    ap.add_argument("--resume", action="store_true", help="이미 저장된 URL은 건너뛰기 (크롤 상태 저장소 기준)")
+    ap.add_argument("--retry-failed", action="store_true", help="링크 수집 없이 상태 저장소의 failed URL만 다시 시도")
     ap.add_argument("--limit", type=int, default=0, help="최대 기사 수 (0=무제한)")
+    ap.add_argument("--discovery-workers", type=int, default=DISCOVERY_WORKERS, help="월별 링크 수집 동시 작업 수")
+    ap.add_argument("--rediscover", action="store_true", help="월별 링크 캐시를 무시하고 모든 달을 다시 수집")
+    ap.add_argument("--archive", default=None, help="원본 HTML 아카이브 경로 (기본: 출력 CSV 옆 *.warc.gz)")
+    ap.add_argument("--reparse", action="store_true", help="크롤링 없이 아카이브만 재파싱해 CSV 재생성")
+    ap.add_argument("--workers", type=int, default=0, help="--reparse 프로세스 수 (0=CPU 코어 수)")
+    ap.add_argument("--compact", action="store_true",
+                    help="크롤링 없이 출력 파일의 url 중복 행만 정리해 다시 씀 (평소에는 덧붙이기만 함)")
+    ap.add_argument("--no-dedup", action="store_true", help="유사 중복(MinHash/LSH) 인덱스 기록 생략")
+    ap.add_argument("--metrics", default=None,
+                    help="단계별 소요 시간 저장 경로 (확장자 없이, 기본: 출력 CSV 옆 *_metrics.json/.prom)")
     args = ap.parse_args()
 
     ensure_parent_dir(args.output)
+    archive_path = args.archive or archive_path_for(args.output)
+
+    if args.compact:
+        if not os.path.exists(args.output):
+            ap.error(f"출력 파일 없음: {args.output}")
+        before, after = compact_output(args.output)
+        index = UrlIndex(args.output)
+        index.rebuild(read_output(args.output, ["url"])["url"].dropna())
+        index.close()
+        print(f"\n🧹 정리 완료: {os.path.abspath(args.output)} ({before}건 → {after}건)")
+        return
+
+    if args.reparse:
+        from reparse import reparse_archive
+        rows = reparse_archive("theverge", archive_path, workers=args.workers or None)
+        df = pd.DataFrame(rows, columns=COLUMNS)
+        df.drop_duplicates(subset=["url"], keep="last", inplace=True)
+        df.to_csv(args.output, index=False, encoding="utf-8-sig")
+        index = UrlIndex(args.output)
+        index.rebuild(df["url"].dropna())
+        index.close()
+        print(f"\n✅ 재파싱 완료: {os.path.abspath(args.output)} (총 {len(df)}건)")
+        return
+
+    if not (args.start and args.end) and not args.retry_failed:
+        ap.error("--start와 --end가 필요합니다 (--compact/--reparse/--retry-failed 제외)")
+
     sess = get_session()
 
-    # 기존 CSV 로드 및 스킵 목록
+    state = CrawlState()
+    index = UrlIndex(args.output)
+
+    # 스킵 목록: 상태 저장소의 parsed·포기한 failed URL (처음이면 기존 CSV의 url 열로 채움)
     existing_urls = set()
-    if args.resume and os.path.exists(args.output):
-        try:
-            prev = pd.read_csv(args.output)
-            if "url" in prev.columns:
-                existing_urls = set(prev["url"].dropna().tolist())
-                print(f"↺ 재개 모드: 기존 {len(existing_urls)}개 URL 스킵")
-        except Exception as e:
-            print(f"⚠️ 기존 CSV 로드 실패: {e}")
+    if args.resume:
+        existing_urls = state.skip_urls(SITE)
+        if not existing_urls and os.path.exists(args.output):
+            try:
+                prev = pd.read_csv(args.output, usecols=["url"])
+                state.mark_many_parsed(prev["url"].dropna().tolist(), SITE)
+                existing_urls = state.skip_urls(SITE)
+            except Exception as e:
+                print(f"⚠️ 기존 CSV 로드 실패: {e}")
+        print(f"↺ 재개 모드: 기존 {len(existing_urls)}개 URL 스킵")
 
     # 링크 수집
-    links = collect_theverge_links(args.start, args.end, section=args.section)
+    if args.retry_failed:
+        links = sorted(state.urls(SITE, "failed"))
+        print(f"↺ 실패 URL 재시도: {len(links)}개")
+    else:
+        links = collect_theverge_links(args.start, args.end, section=args.section,
+                                       workers=args.discovery_workers, rediscover=args.rediscover)
     if args.resume and existing_urls:
         links = [u for u in links if u not in existing_urls]
         print(f"↺ 스킵 후 잔여 링크: {len(links)}")
 
-    # 기사 파싱
-    rows = []
+    # 이미 출력에 있는 URL은 다시 받지 않음 (출력 파일별 URL 인덱스)
+    before = len(links)
+    links = [u for u in links if u not in index]
+    if len(links) < before:
+        print(f"↺ 출력에 이미 있는 URL {before - len(links)}개 건너뜀 (잔여 {len(links)}개)")
+
+    # 기사 파싱 → 끝나는 대로 출력 파일 끝에 덧붙임 (실패는 상태 저장소에만 남기고 CSV에는 쓰지 않음)
+    # CHECKPOINT_ROWS마다 flush 후 URL 인덱스·상태 저장소에 기록 → 중간에 죽어도 그때까지 쓴 행은 남음
+    # 유사 중복 인덱스: 행은 그대로 저장하고 클러스터만 기록 (python dedup.py report로 확인)
+    dedup = None if args.no_dedup else Deduper()
+    n_dup = 0
     count = 0
-    for url in tqdm(links, desc="📰 기사 파싱"):
-        row = scrape_article(url, sess)
-        rows.append(row)
-        count += 1
-        if args.limit and count >= args.limit:
-            break
-        time.sleep(PAUSE)
-
-    # CSV 저장
-    df_new = pd.DataFrame(rows, columns=["date", "title", "abstract", "keywords", "url"])
-    if os.path.exists(args.output) and not df_new.empty:
-        try:
-            df_old = pd.read_csv(args.output)
-            df_all = pd.concat([df_old, df_new], ignore_index=True)
-        except Exception:
-            df_all = df_new
-    else:
-        df_all = df_new
 
-    # 중복 제거
-    if not df_all.empty:
-        df_all.drop_duplicates(subset=["url"], inplace=True)
+    def checkpoint():
+        sink.flush()
+        index.commit()
+        state.commit_deferred()
 
     try:
-        df_all.to_csv(args.output, index=False, encoding="utf-8-sig")
-        print(f"\n✅ 저장 완료: {os.path.abspath(args.output)} (총 {len(df_all)}건)")
+        with PageArchive(archive_path) as archive, LiveSummary(interval=30, write=tqdm.write), \
+                RowSink(args.output, columns=COLUMNS, append=True) as sink:
+            for url in tqdm(links, desc="📰 기사 파싱"):
+                t0 = time.perf_counter()
+                row = scrape_article(url, sess, archive)
+                elapsed_ms = (time.perf_counter() - t0) * 1000
+                if "error" in row:
+                    state.mark_failed(url, SITE, row["error"])
+                    METRICS.incr("failed", site=SITE)
+                elif row["url"] not in index:
+                    sink.write(row)
+                    index.add(row["url"])
+                    state.defer_parsed(url, SITE, fetch_ms=elapsed_ms)
+                    METRICS.incr("pages", site=SITE)
+                    if dedup is not None and dedup.add_row(row, SITE):
+                        n_dup += 1
+                    if sink.count % CHECKPOINT_ROWS == 0:
+                        checkpoint()
+                count += 1
+                if args.limit and count >= args.limit:
+                    break
+            checkpoint()
     except PermissionError:
         print("❌ 저장 실패: Permission denied. 쓰기 가능한 경로를 지정하세요. 예: --output ~/Downloads/theverge.csv")
         sys.exit(1)
+    finally:
+        index.commit()
+        index.close()
+        state.commit_deferred()
+
+    if dedup is not None:
+        dedup.close()
+        if n_dup:
+            print(f"🔁 유사 중복 기사 {n_dup}건 (python dedup.py report --source {SITE})")
+
+    print(f"\n✅ 저장 완료: {os.path.abspath(args.output)} (새 기사 {sink.count}건)")
+    json_path, prom_path = METRICS.export(args.metrics or os.path.splitext(args.output)[0] + "_metrics")
+    print(f"📊 단계별 소요 시간: {json_path}, {prom_path}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+aiohttp 기반 동시 요청 엔진 (crawl_engine.py의 정적 HTML 단계)
+
+- 연결 풀 재사용(TCPConnector), 전체 동시 요청 수 상한(concurrency)
+- 호스트별 토큰 버킷(rate, burst)으로 기존 순차 크롤링과 같은 예의 범위 유지
+- http_cache.HttpCache와 같은 디스크 캐시를 공유 (캐시 적중 시 네트워크/대기 없음)
+
+사용 예:
+async with AsyncFetcher(rate=2.0, concurrency=4, headers=HDRS) as f:
+    html = await f.get_text(url)
+"""
+
+import time, asyncio
+
+import aiohttp
+
+from http_cache import HttpCache
+from rate_limit import HostLimiter, AsyncTokenBucket
+from metrics import METRICS, host_of
+
+def _trace_config(metrics) -> aiohttp.TraceConfig:
+    """요청마다 DNS 조회 · 연결 수립 · 첫 바이트(헤더 수신)까지 시간을 metrics에 기록"""
+    tc = aiohttp.TraceConfig()
+
+    async def on_request_start(session, ctx, params):
+        ctx.t0 = time.perf_counter()
+        ctx.host = host_of(params.url)
+
+    async def on_dns_start(session, ctx, params):
+        ctx.dns0 = time.perf_counter()
+
+    async def on_dns_end(session, ctx, params):
+        metrics.observe("dns", (time.perf_counter() - ctx.dns0) * 1000, ctx.host)
+
+    async def on_connect_start(session, ctx, params):
+        ctx.conn0 = time.perf_counter()
+
+    async def on_connect_end(session, ctx, params):
+        metrics.observe("connect", (time.perf_counter() - ctx.conn0) * 1000, ctx.host)
+
+    async def on_request_end(session, ctx, params):
+        metrics.observe("ttfb", (time.perf_counter() - ctx.t0) * 1000, ctx.host, str(params.url))
+
+    tc.on_request_start.append(on_request_start)
+    tc.on_dns_resolvehost_start.append(on_dns_start)
+    tc.on_dns_resolvehost_end.append(on_dns_end)
+    tc.on_connection_create_start.append(on_connect_start)
+    tc.on_connection_create_end.append(on_connect_end)
+    tc.on_request_end.append(on_request_end)
+    return tc
+
+class AsyncFetcher:
+    def __init__(self, rate: float = 2.0, burst: int = 1, concurrency: int = 4,
+                 headers: dict = None, cache: HttpCache = None, timeout: float = 30, retries: int = 2,
+                 metrics=METRICS):
+        self.headers = dict(headers or {})
+        self.metrics = metrics
+        self.cache = cache or HttpCache()
+        self.limiter = HostLimiter(rate, burst, bucket_cls=AsyncTokenBucket)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self._sem = None
+        self.session = None
+
+    async def __aenter__(self):
+        self._sem = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[_trace_config(self.metrics)],
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    async def get_text(self, url: str) -> str:
+        key = self.cache.make_key(url, self.headers)
+        entry = self.cache.lookup(key)
+        if entry and entry["fresh"]:
+            self.metrics.incr("cache_hit", site=host_of(url))
+            return entry["body"].decode("utf-8", errors="replace")
+
+        cond = {}
+        if entry and entry["etag"]:
+            cond["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            cond["If-Modified-Since"] = entry["last_modified"]
+
+        last_err = None
+        for attempt in range(self.retries + 1):
+            async with self._sem:
+                delay = await self.limiter.bucket(url).acquire()
+                if delay > 0:
+                    self.metrics.observe("wait", delay * 1000, host_of(url))
+                try:
+                    async with self.session.get(url, headers=cond) as r:
+                        if entry and r.status == 304:
+                            self.cache.touch(key, url)
+                            return entry["body"].decode("utf-8", errors="replace")
+                        if r.status in (429, 500, 502, 503, 504):
+                            last_err = aiohttp.ClientResponseError(
+                                r.request_info, r.history, status=r.status, message=r.reason)
+                        else:
+                            r.raise_for_status()
+                            t0 = time.perf_counter()
+                            body = await r.read()
+                            self.metrics.observe("download", (time.perf_counter() - t0) * 1000, host_of(url), url)
+                            self.cache.store(key, url, r.status, dict(r.headers), body)
+                            return body.decode(r.charset or "utf-8", errors="replace")
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    last_err = e
+            if attempt < self.retries:  # 마지막 시도 뒤에는 기다리지 않고 바로 실패
+                await asyncio.sleep(0.5 * (2 ** attempt))
+        raise last_err
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+HTML 파서 백엔드 마이크로 벤치마크 (저장된 페이지 기준, 네트워크 없음)
+
+픽스처: *.html 파일이 든 디렉터리 또는 크롤러가 남긴 *.warc.gz 아카이브
+측정: 백엔드별 페이지당 파싱 시간, 파싱 + 링크 추출(a[href]) 시간 (중앙값, ms)
+
+사용 예:
+python bench_parsers.py fixtures/
+python bench_parsers.py ./theverge.warc.gz --limit 200 --repeat 5
+"""
+
+import os, glob, time, argparse, statistics
+
+from html_parser import parse_html, available_backends
+from page_archive import PageArchive
+
+def load_fixtures(paths, limit: int = 0) -> list:
+    """[(이름, html)] 목록. 디렉터리는 *.html, 아카이브는 레코드 전체."""
+    out = []
+    for path in paths:
+        if os.path.isdir(path):
+            for fp in sorted(glob.glob(os.path.join(path, "**", "*.html"), recursive=True)):
+                with open(fp, encoding="utf-8") as f:
+                    out.append((os.path.relpath(fp, path), f.read()))
+        elif path.endswith(".warc.gz"):
+            for rec in PageArchive(path):
+                out.append((rec["url"], rec["html"]))
+        else:
+            with open(path, encoding="utf-8") as f:
+                out.append((os.path.basename(path), f.read()))
+    return out[:limit] if limit else out
+
+def time_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+def bench(fixtures, backends, repeat: int = 3) -> dict:
+    """{backend: {"parse": [ms...], "parse+links": [ms...]}}"""
+    result = {b: {"parse": [], "parse+links": []} for b in backends}
+    for _, html in fixtures:
+        for b in backends:
+            result[b]["parse"].append(time_ms(lambda: parse_html(html, b), repeat))
+            result[b]["parse+links"].append(
+                time_ms(lambda: [a.get("href") for a in parse_html(html, b).select("a[href]")], repeat)
+            )
+    return result
+
+def main():
+    ap = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    ap.add_argument("fixtures", nargs="+", help="*.html 디렉터리/파일 또는 *.warc.gz 아카이브")
+    ap.add_argument("--backends", nargs="*", default=None, help="비교할 백엔드 (기본: 설치된 전부)")
+    ap.add_argument("--repeat", type=int, default=3, help="페이지별 반복 횟수 (중앙값 사용)")
+    ap.add_argument("--limit", type=int, default=0, help="최대 페이지 수 (0=전체)")
+    args = ap.parse_args()
+
+    fixtures = load_fixtures(args.fixtures, args.limit)
+    if not fixtures:
+        print("픽스처가 없습니다.")
+        return
+    backends = args.backends or available_backends()
+    total_kb = sum(len(h.encode("utf-8")) for _, h in fixtures) / 1024
+    print(f"페이지 {len(fixtures)}개 (평균 {total_kb / len(fixtures):.0f}KB), 반복 {args.repeat}회\n")
+
+    result = bench(fixtures, backends, args.repeat)
+    print(f"{'backend':<12}{'parse ms/page':>16}{'parse+links ms/page':>22}")
+    for b in backends:
+        p = statistics.mean(result[b]["parse"])
+        pl = statistics.mean(result[b]["parse+links"])
+        print(f"{b:<12}{p:>16.2f}{pl:>22.2f}")
+
+if __name__ == "__main__":
+    main()
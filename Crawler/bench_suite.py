@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+파싱 함수 벤치마크 스위트 (저장된 픽스처 기준, 네트워크 없음) → 버전 간 비교용 JSON
+
+- 픽스처: fixtures/*.html — 파싱하는 페이지 유형마다 하나
+    ScienceDirect·INFORMS·T&F 논문, AISeL 목차/논문, TechCrunch 목록/기사, Verge 아카이브/기사, ProQuest docview
+- 케이스: (이름, 픽스처, 함수, 입력)
+    입력 "html": 문자열을 넘김 → 파싱 포함 시간 (기본 백엔드를 바꿔 가며 측정)
+    입력 "doc":  parse_html()로 미리 파싱한 Document를 넘김 → 추출 시간만
+    파일마다 "parse" 케이스(파싱만)도 자동 추가
+- 예전 저널별 크롤러의 parse_article_page/extract_abstract/extract_keywords는
+  site_profiles.row_from_page/extract_field(…, "abstract"/"keywords")로 측정
+- 결과: 케이스 × 백엔드별 중앙값·p90·최솟값(ms) + 출력 점검(빈 필드 목록/항목 수) + 환경 정보(git 리비전 등)
+
+사용 예:
+python bench_suite.py run                       # → bench_<git 리비전>.json
+python bench_suite.py run --repeat 50 --only verge --backends selectolax lxml
+python bench_suite.py compare bench_a1b2c3d.json bench_e4f5a6b.json --threshold 10
+"""
+
+import os, sys, json, time, argparse, platform, subprocess, statistics
+from functools import partial
+
+import html_parser
+from html_parser import parse_html, available_backends
+import site_profiles
+import TheVerge
+import TechCrunch
+import proquest
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEFAULT_REPEAT = 20
+DEFAULT_THRESHOLD = 10.0  # compare: 중앙값이 이 % 이상 느려지면 회귀
+
+# 픽스처 → 원래 URL (URL을 쓰는 파서용)
+FIXTURE_URLS = {
+    "sciencedirect_article": "https://www.sciencedirect.com/science/article/pii/S0378720625001211",
+    "informs_article": "https://pubsonline.informs.org/doi/10.1287/isre.2023.0456",
+    "tandf_article": "https://www.tandfonline.com/doi/full/10.1080/07421222.2025.2487321",
+    "aisel_toc": "https://aisel.aisnet.org/jais/vol24/iss1/",
+    "aisel_article": "https://aisel.aisnet.org/jais/vol24/iss1/3/",
+    "techcrunch_listing": "https://techcrunch.com/category/artificial-intelligence/page/1/",
+    "techcrunch_article": "https://techcrunch.com/2025/09/12/openai-rivals-race-to-ship/",
+    "verge_archive": "https://www.theverge.com/archives/ai-artificial-intelligence/2025/9/1",
+    "verge_article": "https://www.theverge.com/ai-artificial-intelligence/712345/google-gemini",
+    "proquest_docview": "https://www.proquest.com/docview/3163841212",
+}
+
+# =========================
+# 케이스
+# =========================
+def _profile_row(site, html, url):
+    return site_profiles.row_from_page(site, html, {"volume": 24, "issue": 1, "url": url})
+
+def _profile_field(site, name, doc, url):
+    return site_profiles.extract_field(site_profiles.get_profile(site), doc, name)
+
+def _article_links(site, html, url):
+    return site_profiles.article_links(site_profiles.get_profile(site), html, vol=24, iss=1)
+
+CASES = [
+    # (이름, 픽스처, fn(입력, url), 입력 종류)
+    ("sciencedirect.parse_article_page", "sciencedirect_article", partial(_profile_row, "iam"), "html"),
+    ("sciencedirect.extract_abstract", "sciencedirect_article", partial(_profile_field, "iam", "abstract"), "doc"),
+    ("sciencedirect.extract_keywords", "sciencedirect_article", partial(_profile_field, "iam", "keywords"), "doc"),
+    ("informs.parse_article_page", "informs_article", partial(_profile_row, "isr"), "html"),
+    ("informs.extract_abstract", "informs_article", partial(_profile_field, "isr", "abstract"), "doc"),
+    ("informs.extract_keywords", "informs_article", partial(_profile_field, "isr", "keywords"), "doc"),
+    ("tandf.parse_article_page", "tandf_article", partial(_profile_row, "jmis"), "html"),
+    ("tandf.extract_abstract", "tandf_article", partial(_profile_field, "jmis", "abstract"), "doc"),
+    ("tandf.extract_keywords", "tandf_article", partial(_profile_field, "jmis", "keywords"), "doc"),
+    ("aisel.article_links", "aisel_toc", partial(_article_links, "jais"), "html"),
+    ("aisel.parse_article_page", "aisel_article", partial(_profile_row, "jais"), "html"),
+    ("aisel.extract_abstract", "aisel_article", partial(_profile_field, "jais", "abstract"), "doc"),
+    ("aisel.extract_keywords", "aisel_article", partial(_profile_field, "jais", "keywords"), "doc"),
+    ("techcrunch.parse_listing", "techcrunch_listing", lambda html, url: TechCrunch.parse_listing(html), "html"),
+    ("techcrunch.parse_article", "techcrunch_article", TechCrunch.parse_article, "html"),
+    ("verge.guess_total_pages", "verge_archive", lambda doc, url: TheVerge.guess_total_pages(doc), "doc"),
+    ("verge.extract_archive_links", "verge_archive", lambda doc, url: TheVerge.extract_archive_links(doc), "doc"),
+    ("verge.parse_json_ld", "verge_article", lambda doc, url: TheVerge.parse_json_ld(doc), "doc"),
+    ("verge.parse_meta_fallback", "verge_article", lambda doc, url: TheVerge.parse_meta_fallback(doc, {}), "doc"),
+    ("verge.parse_json_ld_fast", "verge_article", lambda html, url: TheVerge.parse_json_ld_fast(html), "html"),
+    ("verge.parse_meta_fast", "verge_article", lambda html, url: TheVerge.parse_meta_fast(html, {}), "html"),
+    ("verge.parse_article_html", "verge_article", TheVerge.parse_article_html, "html"),
+    ("proquest.parse_detail", "proquest_docview", proquest.parse_detail, "html"),
+]
+
+def load_fixtures(names, fixture_dir: str = FIXTURE_DIR) -> dict:
+    out = {}
+    for name in names:
+        with open(os.path.join(fixture_dir, name + ".html"), encoding="utf-8") as f:
+            out[name] = f.read()
+    return out
+
+# =========================
+# 측정
+# =========================
+def samples_ms(fn, repeat: int) -> list:
+    fn()  # 워밍업 (import·정규식 컴파일 등 1회성 비용 제외)
+    out = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+def _percentile(values, q: float) -> float:
+    s = sorted(values)
+    return s[min(len(s) - 1, int(round(q / 100 * (len(s) - 1))))]
+
+def check_output(result) -> dict:
+    """출력 점검: dict는 빈 필드, list는 항목 수, 나머지는 값 자체 → 버전 간 결과가 바뀌었는지 비교용"""
+    if isinstance(result, dict):
+        return {"empty": sorted(k for k, v in result.items() if not v or v in ("N/A", "제목 없음", "본문 없음"))}
+    if isinstance(result, list):
+        return {"items": len(result)}
+    if isinstance(result, str):
+        return {"chars": len(result)}
+    return {"value": result}
+
+def run_suite(backends, repeat: int = DEFAULT_REPEAT, only: str = None, fixture_dir: str = FIXTURE_DIR) -> list:
+    cases = [c for c in CASES if not only or only in c[0]]
+    fixtures = load_fixtures(sorted({c[1] for c in cases}), fixture_dir)
+    cases = [(f"{name}.parse", name, lambda doc, url: doc, "parse") for name in fixtures] + cases
+
+    results = []
+    previous = html_parser._default
+    try:
+        for backend in backends:
+            html_parser.set_default_backend(backend)
+            docs = {name: parse_html(html, backend) for name, html in fixtures.items()}
+            for case, fixture, fn, kind in cases:
+                html, url = fixtures[fixture], FIXTURE_URLS.get(fixture, "")
+                if kind == "parse":
+                    call = partial(parse_html, html, backend)
+                elif kind == "doc":
+                    call = partial(fn, docs[fixture], url)
+                else:
+                    call = partial(fn, html, url)
+                try:
+                    check = {} if kind == "parse" else check_output(call())
+                    ms = samples_ms(call, repeat)
+                except Exception as e:
+                    print(f"❌ {case} [{backend}]: {type(e).__name__}: {e}")
+                    results.append({"case": case, "fixture": fixture, "backend": backend,
+                                    "error": f"{type(e).__name__}: {e}"})
+                    continue
+                results.append({
+                    "case": case, "fixture": fixture, "backend": backend, "input": kind, "n": len(ms),
+                    "median_ms": round(statistics.median(ms), 4),
+                    "p90_ms": round(_percentile(ms, 90), 4),
+                    "min_ms": round(min(ms), 4),
+                    "check": check,
+                })
+    finally:
+        html_parser.set_default_backend(previous)
+    return results
+
+def _git_rev() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip()
+    except Exception:
+        return ""
+
+def _versions(backends) -> dict:
+    modules = {"selectolax": "selectolax", "lxml": "lxml", "bs4": "bs4"}
+    out = {}
+    for b in backends:
+        try:
+            out[b] = getattr(__import__(modules[b]), "__version__", "")
+        except ImportError:
+            out[b] = None
+    return out
+
+def environment(backends, repeat: int, fixture_dir: str = FIXTURE_DIR) -> dict:
+    return {
+        "git_rev": _git_rev(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "backends": _versions(backends),
+        "repeat": repeat,
+        "fixtures": {f[:-5]: os.path.getsize(os.path.join(fixture_dir, f))
+                     for f in sorted(os.listdir(fixture_dir)) if f.endswith(".html")},
+    }
+
+def print_table(results, backends):
+    by_case = {}
+    for r in results:
+        by_case.setdefault(r["case"], {})[r["backend"]] = r
+    print(f"{'case':<38}" + "".join(f"{b:>14}" for b in backends) + "   (중앙값 ms)")
+    for case, row in by_case.items():
+        cells = []
+        for b in backends:
+            r = row.get(b)
+            cells.append(f"{'-' if r is None else 'error' if 'error' in r else format(r['median_ms'], '.3f'):>14}")
+        print(f"{case:<38}" + "".join(cells))
+
+# =========================
+# 비교
+# =========================
+def compare(old: dict, new: dict, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    [(case, backend, 이전 ms, 현재 ms, 변화 %, 판정, 출력 변화 여부)] — 양쪽에 다 있는 케이스만
+    판정: 변화가 +threshold% 이상이면 "slower"(회귀), -threshold% 이하면 "faster", 그 사이는 ""
+    """
+    old_rows = {(r["case"], r["backend"]): r for r in old["results"] if "error" not in r}
+    out = []
+    for r in new["results"]:
+        prev = old_rows.get((r["case"], r["backend"]))
+        if prev is None or "error" in r:
+            continue
+        change = (r["median_ms"] / prev["median_ms"] - 1) * 100 if prev["median_ms"] else 0.0
+        verdict = "slower" if change >= threshold else "faster" if change <= -threshold else ""
+        out.append((r["case"], r["backend"], prev["median_ms"], r["median_ms"], change, verdict,
+                    prev.get("check") != r.get("check")))
+    return out
+
+def print_compare(rows, old_env: dict, new_env: dict, threshold: float = DEFAULT_THRESHOLD) -> int:
+    """compare() 결과 표 출력 후 회귀(판정 "slower") 건수 반환 — threshold는 요약 줄 표시용"""
+    print(f"이전 {old_env.get('git_rev') or '?'} ({old_env.get('created_at')}) → "
+          f"현재 {new_env.get('git_rev') or '?'} ({new_env.get('created_at')})")
+    if old_env.get("python") != new_env.get("python") or old_env.get("backends") != new_env.get("backends"):
+        print(f"⚠️ 환경이 다름: python {old_env.get('python')} → {new_env.get('python')}, "
+              f"백엔드 {old_env.get('backends')} → {new_env.get('backends')}")
+    print(f"{'case':<38}{'backend':<12}{'이전 ms':>10}{'현재 ms':>10}{'변화':>9}")
+    regressions = 0
+    for case, backend, before, after, change, verdict, output_changed in rows:
+        mark = {"slower": "🐢", "faster": "🚀"}.get(verdict, "")
+        regressions += verdict == "slower"
+        if output_changed:
+            mark += " ⚠️ 출력 변화"
+        print(f"{case:<38}{backend:<12}{before:>10.3f}{after:>10.3f}{change:>+8.1f}% {mark}")
+    print(f"\n회귀(+{threshold:.0f}% 이상) {regressions}건 / 비교 {len(rows)}건")
+    return regressions
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="파싱 함수 벤치마크 스위트")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="픽스처로 케이스 × 백엔드 측정 → JSON")
+    p_run.add_argument("--backends", nargs="*", default=None, help="비교할 백엔드 (기본: 설치된 전부)")
+    p_run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="케이스별 반복 횟수")
+    p_run.add_argument("--only", default=None, help="이름에 이 문자열이 들어간 케이스만 (예: verge)")
+    p_run.add_argument("--fixtures", default=FIXTURE_DIR, help="픽스처 디렉터리")
+    p_run.add_argument("--out", default=None, help="결과 JSON (기본: bench_<git 리비전>.json)")
+
+    p_cmp = sub.add_parser("compare", help="두 결과 JSON 비교 (회귀가 있으면 종료 코드 1)")
+    p_cmp.add_argument("old")
+    p_cmp.add_argument("new")
+    p_cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀 기준 (중앙값 변화 %%)")
+    args = ap.parse_args()
+
+    if args.command == "compare":
+        with open(args.old, encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+        rows = compare(old, new, args.threshold)
+        sys.exit(1 if print_compare(rows, old["env"], new["env"], args.threshold) else 0)
+
+    backends = args.backends or available_backends()
+    env = environment(backends, args.repeat, args.fixtures)
+    print(f"🧪 백엔드 {', '.join(backends)} · 반복 {args.repeat}회 · 리비전 {env['git_rev'] or '?'}\n")
+    results = run_suite(backends, args.repeat, args.only, args.fixtures)
+    print_table(results, backends)
+
+    out = args.out or f"bench_{env['git_rev'] or 'local'}.json"
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({"env": env, "results": results}, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,442 @@
+# -*- coding: utf-8 -*-
+"""
+사이트 프로필 기반 공통 크롤 엔진 (JAIS/MISQ/JIT · IAM/DSS/JSIS · ISR · JMIS/EJIS 크롤러 통합)
+
+- 사이트별 차이는 site_profiles.PROFILES에만 있음 (목차 URL, 링크/필드 셀렉터, 수집 단계)
+- 모든 사이트가 한 이벤트 루프에서 스케줄러 · 디스크 캐시 · 속도 제한 · 출력 싱크 · 상태 저장소를 공유
+  · 정적 HTML 요청은 호스트마다 한 번에 하나 (asyncio.Lock) + 호스트별 토큰 버킷(프로필 rate)
+  · 호스트가 다르면 동시에 진행 → 9개 저널을 한 번에 돌려도 같은 사이트에 몰리지 않음
+- 수집 단계: 정적 HTML(aiohttp) 우선, 프로필이 허용하면 필수 필드가 빌 때만 브라우저
+  · 브라우저는 호스트마다 드라이버 풀(--browsers개, 각자 전용 스레드)에서 빈 드라이버를 빌려 씀
+    → IAM/DSS/JSIS처럼 호스트를 공유하는 저널도 렌더링이 겹침 (요청 간격은 같은 호스트 버킷이 지킴)
+  · 드라이버 재시작은 연속 실패 또는 메모리(RSS) 초과 시에만 (driver_pool의 기준)
+- 원본 HTML은 출력 파일 옆 아카이브에 보관 (reparse.py로 재파싱), 완료 기록은 출력이 디스크에 내려간 뒤
+- 단계별 소요 시간(metrics.py)을 실행 중 주기적으로 요약하고, 끝나면 --metrics 경로에 JSON/Prometheus로 저장
+
+사용 예:
+python crawl_engine.py jais:24-26:1-6 misq:49:1-4 jit:40:1-4 iam:62:8 dss:189-196 jsis:34:3,4 \\
+    isr:36:3-4 jmis:42:1-4 ejis:34:1-6 --out "Data/{SITE}/{SITE}_vol{vol}_iss{iss}.csv"
+
+작업 형식: 사이트:권[:호] — 범위(24-26)와 목록(3,4) 가능, 호를 생략하면 프로필 기본값(DSS는 C)
+"""
+
+import time, asyncio, argparse
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from http_cache import HttpCache
+from async_fetch import AsyncFetcher
+from page_archive import PageArchive, archive_path_for
+from sink import RowSink
+from crawl_state import CrawlState, DEFAULT_STATE_DB
+from smart_wait import WaitEngine, RUN_ID, run_report
+from tiered_fetch import TierLog, USER_AGENT, tier_stats
+from driver_pool import driver_rss_mb, MAX_RSS_MB, MAX_FAILURES, DEFAULT_WORKERS, START_STAGGER
+from metrics import METRICS, LiveSummary
+from site_profiles import PROFILES, get_profile, toc_url, article_links, missing_fields, row_from_page
+
+# =========================
+# 설정
+# =========================
+HDRS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9,ko;q=0.8",
+}
+DEFAULT_CONCURRENCY = 8   # 전체 동시 HTTP 요청 상한 (호스트마다는 항상 1개)
+CHECKPOINT_ROWS = 30      # 이만큼 쓸 때마다 모든 출력 flush + 완료 기록
+HEADLESS = False
+TOC_BASELINE = 3.0        # 예전 목차 고정 대기(초) — 절약 시간 보고용
+ARTICLE_BASELINE = 2.0    # 예전 논문 페이지 고정 대기(초)
+
+# =========================
+# 브라우저 (호스트별 드라이버 풀)
+# =========================
+def make_driver(headless: bool = HEADLESS):
+    import undetected_chromedriver as uc  # 브라우저 단계가 있는 사이트에서만 필요
+    from selenium.common.exceptions import WebDriverException
+
+    opts = uc.ChromeOptions()
+    if headless:
+        opts.add_argument("--headless=new")
+    opts.add_argument("--window-size=1280,800")
+    opts.add_argument("--disable-blink-features=AutomationControlled")
+    opts.add_argument("--disable-infobars")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-popup-blocking")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument(f"user-agent={USER_AGENT}")
+    drv = uc.Chrome(options=opts)
+    try:
+        drv.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"}
+        )
+    except WebDriverException:
+        pass
+    return drv
+
+class BrowserSlot:
+    """Chrome 드라이버 하나. selenium은 스레드 안전하지 않으므로 전용 스레드 1개에서만 조작."""
+
+    def __init__(self, host: str, headless: bool = HEADLESS, driver_factory=make_driver, index: int = 0):
+        self.host = host
+        self.name = f"{host}#{index}"
+        self.index = index
+        self.headless = headless
+        self.driver_factory = driver_factory
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"browser-{self.name}")
+        self.driver = None
+        self.failures = 0
+        self._started = False
+        self._cookies_done = False
+        self._waiters = {}
+
+    def waiter(self, site: str) -> WaitEngine:
+        # 요청 간격은 엔진의 호스트 버킷이 지키므로 대기 엔진은 준비 신호만 담당
+        if site not in self._waiters:
+            self._waiters[site] = WaitEngine(site, min_interval=0)
+        return self._waiters[site]
+
+    def _ensure_driver(self):
+        if self.driver is None:
+            if not self._started:
+                # undetected_chromedriver 바이너리 패치 충돌 방지: 같은 호스트의 드라이버는 시차를 두고 처음 시작
+                self._started = True
+                time.sleep(self.index * START_STAGGER)
+            t0 = time.monotonic()
+            self.driver = self.driver_factory(self.headless)
+            self._cookies_done = False
+            METRICS.observe("driver_start", (time.monotonic() - t0) * 1000, self.host)
+            print(f"🚀 [{self.name}] 드라이버 시작 ({time.monotonic() - t0:.1f}s)")
+        return self.driver
+
+    def _quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+    def _accept_cookies(self, driver, profile: dict, waiter: WaitEngine):
+        css = profile.get("cookie_button")
+        if not css or self._cookies_done:
+            return
+        self._cookies_done = True
+        try:
+            waiter.wait_for(driver, css, label="cookie", idle=False, timeout=5).click()
+            waiter.settle(driver, "cookie", baseline=2.0)
+            print(f"🍪 [{self.name}] 쿠키 수락 완료")
+        except Exception:
+            print(f"[{self.name}] 쿠키 수락 스킵")
+
+    def page(self, profile: dict, site: str, url: str, ready: str = None, label: str = "page",
+             scroll: bool = False, baseline: float = 0.0):
+        """(전용 스레드에서 실행) 이동 → 준비 셀렉터 대기 → (scroll이면) 하단 스크롤 후 유휴 대기 → (html, 도착 URL)"""
+        driver = self._ensure_driver()
+        waiter = self.waiter(site)
+        t0 = time.perf_counter()
+        try:
+            driver.get(url)
+            self._accept_cookies(driver, profile, waiter)
+            if ready:
+                waiter.wait_for(driver, ready, label=label, baseline=0.0 if scroll else baseline, idle=not scroll)
+            if scroll:
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                waiter.settle(driver, f"{label}_scroll", baseline=baseline)
+            self.failures = 0
+            METRICS.observe("page", (time.perf_counter() - t0) * 1000, site, url)
+            return driver.page_source, driver.current_url
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            # 재시작 조건: 연속 실패 또는 메모리 초과
+            rss = driver_rss_mb(driver)
+            if self.failures >= MAX_FAILURES or (MAX_RSS_MB and rss > MAX_RSS_MB):
+                reason = f"연속 실패 {self.failures}회" if self.failures >= MAX_FAILURES else f"메모리 {rss:.0f}MB"
+                print(f"♻️ [{self.name}] 드라이버 재시작: {reason}")
+                METRICS.incr("driver_restart", site=self.host)
+                self._quit()
+                self.failures = 0
+
+    def close(self):
+        def shutdown():
+            self._quit()
+            for w in self._waiters.values():
+                w.summary()
+                w.close()
+        self.executor.submit(shutdown).result()
+        self.executor.shutdown()
+
+# =========================
+# 엔진
+# =========================
+class CrawlEngine:
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, headless: bool = HEADLESS, resume: bool = True,
+                 db_path: str = DEFAULT_STATE_DB, cache: HttpCache = None, driver_factory=make_driver,
+                 browsers: int = DEFAULT_WORKERS):
+        """
+        concurrency: 전체 동시 HTTP 요청 상한 (호스트마다는 잠금으로 1개씩)
+        resume: True면 이미 수집한 논문은 건너뛰고 기존 출력 뒤에 이어 씀
+        browsers: 호스트마다 동시에 띄우는 드라이버 수 (드라이버는 처음 필요할 때 시작)
+        """
+        self.concurrency = concurrency
+        self.headless = headless
+        self.browsers = max(1, browsers)
+        self.resume = resume
+        self.cache = cache or HttpCache()
+        self.driver_factory = driver_factory
+        self.state = CrawlState(db_path)
+        self.tiers = TierLog(db_path)
+        self.fetcher = None
+        self.stats = {}         # site → {"rows", "failed", "http", "browser"}
+        self._host_locks = {}
+        self._browsers = {}     # 호스트 → [BrowserSlot]
+        self._idle = {}         # 호스트 → 비어 있는 BrowserSlot 큐
+        self._outputs = {}      # 출력 경로 → (RowSink, PageArchive)
+        self._written = 0
+
+    # ---------- 호스트 단위 직렬화 ----------
+    def _lock(self, url: str) -> asyncio.Lock:
+        host = urlparse(url).netloc
+        if host not in self._host_locks:
+            self._host_locks[host] = asyncio.Lock()
+        return self._host_locks[host]
+
+    async def get_static(self, url: str) -> str:
+        async with self._lock(url):
+            return await self.fetcher.get_text(url)
+
+    def _browser_pool(self, host: str) -> asyncio.Queue:
+        if host not in self._idle:
+            self._browsers[host] = [BrowserSlot(host, self.headless, self.driver_factory, i)
+                                    for i in range(self.browsers)]
+            self._idle[host] = asyncio.Queue()
+            for slot in self._browsers[host]:
+                self._idle[host].put_nowait(slot)
+        return self._idle[host]
+
+    async def get_browser(self, profile: dict, site: str, url: str, ready: str = None, label: str = "page",
+                          scroll: bool = False, baseline: float = 0.0):
+        """
+        브라우저 렌더링 → (html, 도착 URL). 호스트 풀에서 빈 드라이버를 빌려 씀.
+        요청 시작 간격은 같은 호스트의 HTTP 요청과 같은 버킷이 지키고, 렌더링·대기 시간은 드라이버끼리 겹침.
+        """
+        host = urlparse(url).netloc
+        idle = self._browser_pool(host)
+        slot = await idle.get()
+        try:
+            delay = await self.fetcher.limiter.bucket(url).acquire()
+            if delay > 0:
+                METRICS.observe("wait", delay * 1000, host)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(slot.executor, slot.page, profile, site, url, ready, label,
+                                              scroll, baseline)
+        finally:
+            idle.put_nowait(slot)
+
+    # ---------- 출력 ----------
+    def _output(self, path: str, profile: dict):
+        if path not in self._outputs:
+            self._outputs[path] = (RowSink(path, columns=profile["columns"], append=self.resume),
+                                   PageArchive(archive_path_for(path)))
+        return self._outputs[path]
+
+    def checkpoint(self):
+        """모든 출력을 디스크에 내린 뒤 완료 기록 (중간에 죽어도 출력과 상태가 어긋나지 않음)"""
+        for sink, _ in self._outputs.values():
+            sink.flush()
+        self.state.commit_deferred()
+
+    # ---------- 수집 ----------
+    @staticmethod
+    def _parse(site: str, html: str, meta: dict) -> dict:
+        with METRICS.timer("parse", site, meta.get("url")):
+            return row_from_page(site, html, meta)
+
+    async def fetch_article(self, site: str, profile: dict, url: str, meta: dict):
+        """프로필 tier에 따라 정적 HTML → (필요 시) 브라우저. (html, row, tier, 도착 URL) 반환."""
+        tier = profile["tier"]
+        missing = []
+        if tier in ("http", "auto"):
+            try:
+                html = await self.get_static(url)
+            except Exception as e:
+                if tier == "http":
+                    raise
+                html, missing = None, [type(e).__name__]
+            if html is not None:
+                row = await asyncio.to_thread(self._parse, site, html, {**meta, "url": url})
+                missing = missing_fields(profile, row)
+                if tier == "http" or not missing:
+                    self.tiers.record(url, site, "http")
+                    return html, row, "http", url
+
+        html, final_url = await self.get_browser(profile, site, url, profile.get("ready"), "article",
+                                                 profile.get("scroll", False), ARTICLE_BASELINE)
+        self.tiers.record(url, site, "browser", missing)
+        row = await asyncio.to_thread(self._parse, site, html, {**meta, "url": final_url})
+        return html, row, "browser", final_url
+
+    async def crawl_article(self, site: str, profile: dict, url: str, vol, iss, out):
+        stats = self.stats[site]
+        t0 = time.perf_counter()
+        try:
+            html, row, tier, final_url = await self.fetch_article(site, profile, url, {"volume": vol, "issue": iss})
+        except Exception as e:
+            print(f"🚧 실패 [{site} {vol}-{iss}]: {url} -> {type(e).__name__}: {e}")
+            self.state.mark_failed(url, site, e)
+            stats["failed"] += 1
+            METRICS.incr("failed", site=site)
+            return
+        fetch_ms = (time.perf_counter() - t0) * 1000
+
+        sink, archive = out
+        archive.append(final_url, html, volume=vol, issue=iss)
+        sink.write(row)
+        for u in {url, final_url}:
+            self.state.defer_parsed(u, site, fetch_ms=fetch_ms)
+        stats["rows"] += 1
+        stats[tier] += 1
+        METRICS.incr("pages", site=site)
+        print(f"→ [{site} {vol}-{iss}] {str(row.get('title'))[:80]}")
+        self._written += 1
+        if self._written % CHECKPOINT_ROWS == 0:
+            self.checkpoint()
+
+    async def crawl_issue(self, site: str, vol, iss, out_path: str):
+        profile = get_profile(site)
+        url = toc_url(profile, vol, iss)
+        tag = f"[{site} {vol}-{iss}]"
+        try:
+            if profile["toc_tier"] == "http":
+                html = await self.get_static(url)
+            else:
+                html, _ = await self.get_browser(profile, site, url, profile.get("toc_ready"), "toc",
+                                                 baseline=TOC_BASELINE)
+        except Exception as e:
+            print(f"❌ {tag} 목차 로딩 실패: {type(e).__name__}: {e}")
+            return
+
+        links = article_links(profile, html, vol, iss)
+        if not links:
+            print(f"⚠️ {tag} 논문 링크 없음")
+            return
+        todo = [u for u in links if not (self.resume and self.state.should_skip(u))]
+        print(f"📄 {tag} 논문 {len(links)}편 (새로 수집 {len(todo)}편)")
+        out = self._output(out_path, profile)
+        await asyncio.gather(*(self.crawl_article(site, profile, u, vol, iss, out) for u in todo))
+
+    async def run(self, jobs, out_fmt: str):
+        """
+        jobs: [(site, vol, iss), ...]
+        out_fmt: 출력 경로 — {site}, {SITE}, {vol}, {iss} 자리표시자 (같은 경로로 모이는 작업은 한 파일에)
+        """
+        jobs = list(jobs)
+        for site, _, _ in jobs:
+            self.stats.setdefault(site, {"rows": 0, "failed": 0, "http": 0, "browser": 0})
+        self.fetcher = AsyncFetcher(concurrency=self.concurrency, headers=HDRS, cache=self.cache)
+        try:
+            async with self.fetcher:
+                for site in self.stats:
+                    profile = get_profile(site)
+                    self.fetcher.limiter.set_rate(toc_url(profile, 0, 0), profile.get("rate", 1.0))
+                await asyncio.gather(*(
+                    self.crawl_issue(site, vol, iss, out_fmt.format(site=site, SITE=site.upper(), vol=vol, iss=iss))
+                    for site, vol, iss in jobs
+                ))
+        finally:
+            self.checkpoint()
+            for sink, archive in self._outputs.values():
+                sink.close()
+                archive.close()
+            for slots in self._browsers.values():
+                for slot in slots:
+                    slot.close()
+        return self.stats
+
+    def close(self):
+        self.state.close()
+        self.tiers.close()
+
+def crawl(jobs, out_fmt: str, live_interval: float = 30.0, **kw) -> dict:
+    """동기 진입점: 작업 전체를 한 이벤트 루프에서 실행하고 사이트별 통계 반환 (live_interval초마다 계측 요약)"""
+    engine = CrawlEngine(**kw)
+    try:
+        with LiveSummary(interval=live_interval):
+            return asyncio.run(engine.run(jobs, out_fmt))
+    finally:
+        engine.close()
+
+# =========================
+# 작업 지정
+# =========================
+def _expand(spec: str) -> list:
+    """"24-26,28" → [24, 25, 26, 28] (숫자가 아닌 값은 그대로, 예: "C")"""
+    out = []
+    for part in spec.split(","):
+        part = part.strip()
+        lo, sep, hi = part.partition("-")
+        if sep and lo.isdigit() and hi.isdigit():
+            out.extend(range(int(lo), int(hi) + 1))
+        elif part:
+            out.append(int(part) if part.isdigit() else part)
+    return out
+
+def parse_job(spec: str) -> list:
+    """"jais:24-26:1-6" → [("jais", 24, 1), ...]. 호 생략 시 프로필 default_issue."""
+    site, _, rest = spec.partition(":")
+    profile = get_profile(site)
+    vols, _, issues = rest.partition(":")
+    if not vols:
+        raise ValueError(f"권 지정 없음: {spec}")
+    if issues:
+        iss_list = _expand(issues)
+    elif profile.get("default_issue") is not None:
+        iss_list = [profile["default_issue"]]
+    else:
+        raise ValueError(f"호 지정 없음: {spec} (예: {site}:{vols}:1-4)")
+    return [(site, vol, iss) for vol in _expand(vols) for iss in iss_list]
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="사이트 프로필 기반 저널 크롤러")
+    ap.add_argument("jobs", nargs="+", help=f"사이트:권[:호] (사이트: {', '.join(sorted(PROFILES))})")
+    ap.add_argument("--out", default="Data/{SITE}/{SITE}_vol{vol}_iss{iss}.csv",
+                    help="출력 경로 형식 ({site}, {SITE}, {vol}, {iss}); 확장자로 csv/jsonl 선택")
+    ap.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    ap.add_argument("--headless", action="store_true")
+    ap.add_argument("--browsers", type=int, default=DEFAULT_WORKERS, help="호스트마다 동시에 띄우는 드라이버 수")
+    ap.add_argument("--no-resume", action="store_true", help="수집 기록을 무시하고 새로 씀")
+    ap.add_argument("--db", default=DEFAULT_STATE_DB)
+    ap.add_argument("--metrics", default="crawl_metrics", help="계측 결과 저장 경로 (확장자 없이: .json, .prom)")
+    ap.add_argument("--live", type=float, default=30.0, help="실행 중 계측 요약 출력 간격(초)")
+    args = ap.parse_args()
+
+    try:
+        jobs = [job for spec in args.jobs for job in parse_job(spec)]
+    except (KeyError, ValueError) as e:
+        ap.error(str(e))
+
+    t0 = time.monotonic()
+    stats = crawl(jobs, args.out, live_interval=args.live, concurrency=args.concurrency, headless=args.headless,
+                  resume=not args.no_resume, db_path=args.db, browsers=args.browsers)
+
+    print(f"\n✅ 완료 ({time.monotonic() - t0:.0f}s, 권호 {len(jobs)}개)")
+    for site, s in sorted(stats.items()):
+        print(f"{site:<6} 수집 {s['rows']:>5}편  실패 {s['failed']:>4}  정적 HTML {s['http']:>5}  브라우저 {s['browser']:>5}")
+    for _, site, n_waits, waited, saved in run_report(args.db, run_id=RUN_ID):
+        print(f"⏱️ [{site}] 대기 {n_waits}회, 추가 대기 {waited:.1f}s — 고정 대기 대비 {saved:.1f}s 절약")
+    for site, n_http, n_browser, rate in tier_stats(args.db):
+        if site in stats:
+            print(f"🪜 [{site}] 정적 HTML 누적 {n_http}건, 브라우저 {n_browser}건 (적중률 {rate:.0%})")
+    if args.metrics:
+        json_path, prom_path = METRICS.export(args.metrics)
+        print(f"📊 계측 저장: {json_path}, {prom_path}")
+
+if __name__ == "__main__":
+    main()
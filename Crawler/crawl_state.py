@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+크롤 상태 저장소 (SQLite): URL별 상태·시도 횟수·마지막 오류·소요 시간
+
+상태: queued → fetched → parsed, 실패 시 failed
+- 재시작 시 parsed인 URL과 MAX_ATTEMPTS번 넘게 실패한 URL은 건너뜀 (should_skip: 기본키 조회 O(1))
+  그보다 적게 실패한 URL은 다음 실행에서 자동 재시도
+- retry 명령은 포기한 failed URL을 queued로 되돌리고 시도 횟수를 초기화 → 다음 실행에서 다시 수집
+- URL별 fetch/parse 시간 기록 → 사이트별 소요 시간 요약
+
+사용 예:
+state = CrawlState()
+if state.should_skip(url): continue
+state.mark_parsed(url, "iam", fetch_ms=2100, parse_ms=8)
+
+출력 싱크와 함께 쓸 때는 defer_parsed()로 쌓아 두었다가 sink.flush() 직후 commit_deferred()
+→ 파일에 실제로 내려간 행만 완료로 기록되므로 비정상 종료 후에도 행이 누락되지는 않는다.
+  단, RowSink는 버퍼(buffer_rows)가 차면 commit_deferred() 전에 파일로 내리므로 그 사이에 죽으면
+  완료 기록 없이 파일에만 남은 행이 재개 시 다시 쓰일 수 있다 (최소 한 번 기록, 중복 가능).
+  중복은 sink.compact_output (TheVerge --compact)으로 정리하거나, TheVerge처럼 sink.UrlIndex로 걸러서 막는다.
+
+CLI:
+python crawl_state.py stats [--site iam]
+python crawl_state.py failed --site theverge
+python crawl_state.py retry --site theverge     # failed → queued
+"""
+
+import os, time, sqlite3, argparse, threading
+
+DEFAULT_STATE_DB = os.environ.get(
+    "CRAWLER_STATE_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".crawl_state.sqlite")
+)
+STATUSES = ("queued", "fetched", "parsed", "failed")
+MAX_ATTEMPTS = 3  # 이만큼 실패한 URL은 retry 명령 전까지 건너뜀
+
+UPSERT_SQL = """
+    INSERT INTO urls (url, site, status, attempts, last_error, fetch_ms, parse_ms, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        site=excluded.site,
+        status=excluded.status,
+        attempts=urls.attempts + excluded.attempts,
+        last_error=COALESCE(excluded.last_error, urls.last_error),
+        fetch_ms=COALESCE(excluded.fetch_ms, urls.fetch_ms),
+        parse_ms=COALESCE(excluded.parse_ms, urls.parse_ms),
+        updated_at=excluded.updated_at
+"""
+
+class CrawlState:
+    def __init__(self, path: str = DEFAULT_STATE_DB):
+        self.path = path
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._lock = threading.Lock()
+        self._deferred = []
+        # 여러 크롤러(프로세스)와 엔진의 브라우저 슬롯 스레드가 같은 파일을 쓰므로 WAL + 대기 시간
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                site TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                fetch_ms REAL,
+                parse_ms REAL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_site_status ON urls(site, status)")
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # ---------- 조회 ----------
+    def status(self, url: str):
+        with self._lock:
+            row = self._db.execute("SELECT status FROM urls WHERE url=?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def is_done(self, url: str) -> bool:
+        return self.status(url) == "parsed"
+
+    def should_skip(self, url: str) -> bool:
+        """완료했거나 MAX_ATTEMPTS번 이상 실패해 포기한 URL"""
+        with self._lock:
+            row = self._db.execute("SELECT status, attempts FROM urls WHERE url=?", (url,)).fetchone()
+        return row is not None and (row[0] == "parsed" or (row[0] == "failed" and row[1] >= MAX_ATTEMPTS))
+
+    def urls(self, site: str, status: str = "parsed") -> set:
+        with self._lock:
+            rows = self._db.execute("SELECT url FROM urls WHERE site=? AND status=?", (site, status)).fetchall()
+        return {r[0] for r in rows}
+
+    def done_urls(self, site: str) -> set:
+        """완료 URL 집합 (메모리 set으로 O(1) 조회할 때)"""
+        return self.urls(site, "parsed")
+
+    def skip_urls(self, site: str) -> set:
+        """should_skip에 해당하는 URL 집합"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT url FROM urls WHERE site=? AND (status='parsed' OR (status='failed' AND attempts>=?))",
+                (site, MAX_ATTEMPTS),
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def failed(self, site: str) -> list:
+        with self._lock:
+            return self._db.execute(
+                "SELECT url, attempts, last_error FROM urls WHERE site=? AND status='failed' ORDER BY updated_at",
+                (site,),
+            ).fetchall()
+
+    # ---------- 기록 ----------
+    def _upsert(self, url, site, status, attempt=False, error=None, fetch_ms=None, parse_ms=None):
+        with self._lock:
+            self._db.execute(UPSERT_SQL, (url, site, status, 1 if attempt else 0, error, fetch_ms, parse_ms, time.time()))
+            self._db.commit()
+
+    def enqueue(self, url: str, site: str):
+        """이미 기록된 URL은 건드리지 않는다."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR IGNORE INTO urls (url, site, status, updated_at) VALUES (?, ?, 'queued', ?)",
+                (url, site, time.time()),
+            )
+            self._db.commit()
+
+    def mark_fetched(self, url: str, site: str, fetch_ms: float = None):
+        self._upsert(url, site, "fetched", attempt=True, fetch_ms=fetch_ms)
+
+    def mark_parsed(self, url: str, site: str, fetch_ms: float = None, parse_ms: float = None):
+        """fetch_ms를 주면 fetched 단계를 건너뛴 한 번의 시도로 기록"""
+        self._upsert(url, site, "parsed", attempt=fetch_ms is not None, fetch_ms=fetch_ms, parse_ms=parse_ms)
+
+    def defer_parsed(self, url: str, site: str, fetch_ms: float = None, parse_ms: float = None):
+        self._deferred.append((url, site, fetch_ms, parse_ms))
+
+    def commit_deferred(self):
+        """싱크 flush 이후 호출: 보류해 둔 완료 기록을 한 트랜잭션으로 반영"""
+        pending, self._deferred = self._deferred, []
+        if not pending:
+            return
+        now = time.time()
+        with self._lock:
+            self._db.executemany(UPSERT_SQL, [
+                (url, site, "parsed", 1 if fetch_ms is not None else 0, None, fetch_ms, parse_ms, now)
+                for url, site, fetch_ms, parse_ms in pending
+            ])
+            self._db.commit()
+
+    def mark_failed(self, url: str, site: str, error: str):
+        self._upsert(url, site, "failed", attempt=True, error=str(error)[:500])
+
+    def mark_many_parsed(self, urls, site: str):
+        """기존 CSV에서 옮겨올 때 등 일괄 완료 처리"""
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO urls (url, site, status, updated_at) VALUES (?, ?, 'parsed', ?)",
+                [(u, site, now) for u in urls],
+            )
+            self._db.commit()
+
+    def retry_failed(self, site: str) -> int:
+        """failed → queued, 시도 횟수 초기화 (포기한 URL도 다음 실행에서 다시 수집)"""
+        with self._lock:
+            cur = self._db.execute("UPDATE urls SET status='queued', attempts=0 WHERE site=? AND status='failed'",
+                                   (site,))
+            self._db.commit()
+        return cur.rowcount
+
+    # ---------- 통계 ----------
+    def stats(self, site: str = None) -> list:
+        """[(site, status, 개수, 평균 fetch_ms, 평균 parse_ms, 최대 fetch_ms)]"""
+        q = ("SELECT site, status, COUNT(*), AVG(fetch_ms), AVG(parse_ms), MAX(fetch_ms) FROM urls "
+             + ("WHERE site=? " if site else "") + "GROUP BY site, status ORDER BY site, status")
+        with self._lock:
+            return self._db.execute(q, (site,) if site else ()).fetchall()
+
+    def slowest(self, site: str, n: int = 10) -> list:
+        with self._lock:
+            return self._db.execute(
+                "SELECT url, fetch_ms, parse_ms FROM urls WHERE site=? AND fetch_ms IS NOT NULL "
+                "ORDER BY fetch_ms DESC LIMIT ?", (site, n),
+            ).fetchall()
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="크롤 상태 저장소 조회/재시도")
+    ap.add_argument("command", choices=["stats", "failed", "retry", "slowest"])
+    ap.add_argument("--site", default=None, help="사이트 이름 (iam, dss, theverge ...)")
+    ap.add_argument("--db", default=DEFAULT_STATE_DB, help="상태 DB 경로")
+    args = ap.parse_args()
+
+    state = CrawlState(args.db)
+    if args.command == "stats":
+        print(f"{'site':<12}{'status':<9}{'count':>8}{'fetch ms':>11}{'parse ms':>10}{'max fetch':>11}")
+        for site, status, n, fms, pms, mx in state.stats(args.site):
+            fmt = lambda v: f"{v:.0f}" if v is not None else "-"
+            print(f"{site:<12}{status:<9}{n:>8}{fmt(fms):>11}{fmt(pms):>10}{fmt(mx):>11}")
+        return
+    if not args.site:
+        ap.error("--site가 필요합니다")
+    if args.command == "failed":
+        for url, attempts, err in state.failed(args.site):
+            print(f"[{attempts}회] {url}\n    ↳ {err}")
+    elif args.command == "retry":
+        print(f"↺ {state.retry_failed(args.site)}개 URL을 재시도 대기열로 되돌림")
+    elif args.command == "slowest":
+        for url, fms, pms in state.slowest(args.site):
+            print(f"{fms:>8.0f}ms  {url}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+유사 중복 기사 탐지 (MinHash + LSH, 영구 인덱스)
+
+- 제목 + 요약/본문을 단어 3-gram 싱글로 나눠 MinHash 시그니처(num_perm개) 계산
+- LSH: 시그니처를 bands개 구간으로 나눠 구간별 버킷에 등록 → 새 문서는 같은 버킷 문서만 후보로 비교
+  (인덱스 크기와 무관하게 후보 조회는 SQLite 색인 검색)
+- 인덱스는 SQLite에 남아 새 크롤 배치를 과거 전체 코퍼스와 바로 비교
+- 중복을 지우지 않고 클러스터로 묶어 기록 → report로 확인 (출력 CSV는 그대로)
+- 빈 문서·자리표시 텍스트("N/A", "제목 없음", "본문 없음")뿐인 문서는 인덱스에 넣지 않음
+  (싱글이 없으면 시그니처가 모두 같아져 빈 문서끼리 한 클러스터로 묶임)
+
+사용 예:
+dd = Deduper()
+matches = dd.add_row(row, source="theverge")      # [(doc_key, 추정 유사도), ...]
+if matches: print("유사 기사:", matches)
+
+CLI:
+python dedup.py index theverge.csv techcrunch_ai_articles.csv     # 기존 CSV를 인덱스에 추가
+python dedup.py report --min-size 2
+"""
+
+import os, re, zlib, sqlite3, hashlib, argparse, threading
+
+import numpy as np
+
+DEFAULT_DEDUP_DB = os.environ.get(
+    "CRAWLER_DEDUP_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dedup_index.sqlite")
+)
+NUM_PERM = 128
+BANDS = 16          # rows = NUM_PERM / BANDS = 8 → 유사도 약 0.7 이상부터 후보가 됨
+THRESHOLD = 0.8     # 후보 중 추정 Jaccard가 이 이상이면 중복으로 판정
+SHINGLE = 3
+_MERSENNE = np.uint64((1 << 61) - 1)
+_WORD_PAT = re.compile(r"\w+")
+PLACEHOLDERS = ("N/A", "제목 없음", "본문 없음", "nan", "None")  # 크롤러가 빈 값 대신 넣는 텍스트
+_PLACEHOLDER_PAT = re.compile("|".join(re.escape(p) for p in PLACEHOLDERS))
+
+# =========================
+# MinHash
+# =========================
+def shingles(text: str, k: int = SHINGLE) -> set:
+    words = _WORD_PAT.findall((text or "").lower())
+    if len(words) < k:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+def doc_text(row: dict) -> str:
+    """출력 행 → 비교 텍스트 (제목 + 요약, 없으면 본문)"""
+    parts = [row.get("title"), row.get("abstract") or row.get("content")]
+    return " ".join(str(p) for p in parts if p and str(p).strip() not in PLACEHOLDERS)
+
+def is_empty_text(text: str) -> bool:
+    """자리표시 텍스트를 빼고 나면 단어가 없는 문서"""
+    return not _WORD_PAT.search(_PLACEHOLDER_PAT.sub(" ", text or ""))
+
+class MinHasher:
+    """고정 시드 해시 계열 → 프로세스/실행이 달라도 같은 시그니처"""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, int(_MERSENNE), num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, int(_MERSENNE), num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        sh = shingles(text)
+        if not sh:
+            return np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        h = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in sh), dtype=np.uint64, count=len(sh))
+        # (a*h + b) mod p 뒤 하위 32비트 — uint64 곱셈은 랩어라운드되지만 해시 용도로는 충분 (datasketch와 같은 방식)
+        perm = (self.a[:, None] * h[None, :] + self.b[:, None]) % _MERSENNE
+        return (perm.min(axis=1) & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+
+def jaccard_estimate(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(np.mean(sig_a == sig_b))
+
+# =========================
+# 영구 LSH 인덱스
+# =========================
+class Deduper:
+    def __init__(self, path: str = DEFAULT_DEDUP_DB, threshold: float = THRESHOLD,
+                 num_perm: int = NUM_PERM, bands: int = BANDS):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands로 나누어 떨어져야 합니다")
+        self.path = path
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS docs (
+                doc_key TEXT PRIMARY KEY,
+                source TEXT,
+                title TEXT,
+                sig BLOB NOT NULL,
+                cluster TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS buckets (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                doc_key TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_bucket ON buckets(band, bucket);
+            CREATE INDEX IF NOT EXISTS idx_cluster ON docs(cluster);
+        """)
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _band_keys(self, sig: np.ndarray) -> list:
+        out = []
+        for i in range(self.bands):
+            digest = hashlib.blake2b(sig[i * self.rows:(i + 1) * self.rows].tobytes(), digest_size=8).digest()
+            out.append(int.from_bytes(digest, "big", signed=True))
+        return out
+
+    # ---------- 조회 ----------
+    def query(self, text: str, sig: np.ndarray = None) -> list:
+        """[(doc_key, 추정 유사도)] — 같은 버킷 후보만 비교, threshold 이상만, 유사도 내림차순"""
+        sig = self.hasher.signature(text) if sig is None else sig
+        keys = self._band_keys(sig)
+        with self._lock:
+            cands = set()
+            for band, bucket in enumerate(keys):
+                cands.update(r[0] for r in self._db.execute(
+                    "SELECT doc_key FROM buckets WHERE band=? AND bucket=?", (band, bucket)))
+            rows = [self._db.execute("SELECT doc_key, sig FROM docs WHERE doc_key=?", (k,)).fetchone() for k in cands]
+        out = []
+        for row in rows:
+            if row is None:
+                continue
+            sim = jaccard_estimate(sig, np.frombuffer(row[1], dtype=np.uint32))
+            if sim >= self.threshold:
+                out.append((row[0], sim))
+        return sorted(out, key=lambda x: -x[1])
+
+    def __contains__(self, doc_key: str) -> bool:
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM docs WHERE doc_key=?", (doc_key,)).fetchone() is not None
+
+    # ---------- 추가 ----------
+    def add(self, doc_key: str, text: str, source: str = None, title: str = None) -> list:
+        """
+        문서를 인덱스에 추가하고 유사 중복 목록을 반환.
+        중복이 있으면 가장 비슷한 문서의 클러스터에 합류, 없으면 자기 자신이 클러스터 대표.
+        이미 있는 doc_key는 다시 넣지 않고 기존 매칭만 돌려줌.
+        빈 문서(is_empty_text)는 비교도 추가도 하지 않고 []
+        """
+        if is_empty_text(text):
+            return []
+        sig = self.hasher.signature(text)
+        matches = [(k, s) for k, s in self.query(text, sig) if k != doc_key]
+        if doc_key in self:
+            return matches
+        with self._lock:
+            if matches:
+                cluster = self._db.execute("SELECT cluster FROM docs WHERE doc_key=?", (matches[0][0],)).fetchone()[0]
+            else:
+                cluster = doc_key
+            self._db.execute("INSERT INTO docs (doc_key, source, title, sig, cluster) VALUES (?, ?, ?, ?, ?)",
+                             (doc_key, source, title, sig.tobytes(), cluster))
+            self._db.executemany("INSERT INTO buckets (band, bucket, doc_key) VALUES (?, ?, ?)",
+                                 [(band, bucket, doc_key) for band, bucket in enumerate(self._band_keys(sig))])
+            self._db.commit()
+        return matches
+
+    # ---------- 보고 ----------
+    def clusters(self, min_size: int = 2, source: str = None) -> list:
+        """[(cluster, [(doc_key, source, title), ...])] — 크기 내림차순"""
+        with self._lock:
+            q = "SELECT cluster FROM docs GROUP BY cluster HAVING COUNT(*) >= ? ORDER BY COUNT(*) DESC"
+            ids = [r[0] for r in self._db.execute(q, (min_size,))]
+            out = []
+            for cid in ids:
+                members = self._db.execute("SELECT doc_key, source, title FROM docs WHERE cluster=?", (cid,)).fetchall()
+                if source is None or any(m[1] == source for m in members):
+                    out.append((cid, members))
+        return out
+
+    def add_row(self, row: dict, source: str, key_col: str = "url") -> list:
+        """크롤러 출력 행을 바로 인덱스에 추가 (쓰는 즉시 과거 코퍼스와 비교)"""
+        key = row.get(key_col)
+        if not isinstance(key, str) or not key:
+            key = f"{source}:{row.get('title')}"
+        return self.add(key, doc_text(row), source=source, title=row.get("title"))
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="MinHash/LSH 유사 중복 인덱스")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p_idx = sub.add_parser("index", help="CSV/JSONL 출력 파일을 인덱스에 추가")
+    p_idx.add_argument("inputs", nargs="+")
+    p_idx.add_argument("--source", default=None, help="source 이름 (기본: 파일명)")
+    p_rep = sub.add_parser("report", help="유사 중복 클러스터 출력")
+    p_rep.add_argument("--min-size", type=int, default=2)
+    p_rep.add_argument("--source", default=None, help="이 source 문서가 포함된 클러스터만")
+    ap.add_argument("--db", default=DEFAULT_DEDUP_DB)
+    ap.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = ap.parse_args()
+
+    dd = Deduper(args.db, threshold=args.threshold)
+    if args.command == "index":
+        import pandas as pd
+        for path in args.inputs:
+            df = pd.read_json(path, lines=True) if path.endswith(".jsonl") else pd.read_csv(path, encoding="utf-8-sig")
+            source = args.source or os.path.splitext(os.path.basename(path))[0]
+            dup = 0
+            for row in df.to_dict("records"):
+                row = {k: (v if isinstance(v, str) else None) for k, v in row.items()}
+                if dd.add_row(row, source):
+                    dup += 1
+            print(f"📄 {path}: {len(df)}건 중 유사 중복 {dup}건")
+        print(f"인덱스 문서 수: {len(dd)}")
+        return
+
+    clusters = dd.clusters(args.min_size, args.source)
+    for cid, members in clusters:
+        print(f"\n[{len(members)}건] {cid}")
+        for key, src, title in members:
+            print(f"   - ({src}) {str(title)[:80]}  {key}")
+    print(f"\n유사 중복 클러스터 {len(clusters)}개")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Selenium 드라이버 설정값과 재시작 기준 (상수 + driver_rss_mb만 있음, 스케줄러 없음)
+
+드라이버 풀 자체는 crawl_engine.BrowserSlot: 한 프로세스 안에서 호스트마다 슬롯(드라이버 + 전용 스레드)을
+DEFAULT_WORKERS개까지 두고 asyncio 큐로 빌려 씀. 여기 값은 그 슬롯들이 참고하는 기준.
+
+- 드라이버 재시작은 고정 개수마다가 아니라 메모리(RSS, driver_rss_mb > MAX_RSS_MB) 초과 또는 연속 실패 시에만
+- DEFAULT_WORKERS: 호스트마다 동시에 띄우는 드라이버 수 기본값 (crawl_engine --browsers)
+- START_STAGGER: 같은 호스트의 드라이버를 처음 띄울 때 시차 (undetected_chromedriver 바이너리 패치 충돌 방지)
+"""
+
+try:
+    import psutil  # 선택 의존성: 없으면 메모리 기준 재시작은 끔
+except ImportError:
+    psutil = None
+
+# =========================
+# 설정
+# =========================
+DEFAULT_WORKERS = 3
+MAX_RSS_MB = 1500       # 드라이버(크롬 프로세스 트리) 메모리 상한
+MAX_FAILURES = 2        # 연속 실패 허용 횟수
+START_STAGGER = 3.0     # undetected_chromedriver 바이너리 패치 충돌 방지용 드라이버 시작 간격(초)
+
+# =========================
+# 드라이버 상태
+# =========================
+def driver_rss_mb(driver) -> float:
+    """chromedriver + 자식 크롬 프로세스들의 RSS 합(MB). 측정 불가 시 0."""
+    if psutil is None:
+        return 0.0
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        procs = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in procs) / 1024 ** 2
+    except Exception:
+        return 0.0
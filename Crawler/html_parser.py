@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+HTML 파서 공통 인터페이스 (selectolax → lxml → BeautifulSoup 순으로 사용 가능한 백엔드 선택)
+
+- 페이지당 한 번만 파싱해서 Document를 링크 추출/페이지 수 탐지/필드 추출이 함께 쓰도록 한다
+- 텍스트 규칙은 BeautifulSoup get_text(sep, strip)와 같게 맞춤 (script/style 본문 제외)
+
+사용 예:
+doc = parse_html(r.text)
+title = doc.select_one("h1.citation__title")
+title = title.text(strip=True) if title else ""
+
+백엔드 강제: parse_html(html, backend="bs4") 또는 환경변수 CRAWLER_PARSER=lxml
+"""
+
+import os
+
+SKIP_TEXT_TAGS = ("script", "style", "template")
+
+# =========================
+# 노드
+# =========================
+class Node:
+    """백엔드 요소 래퍼. 하위 클래스가 select/text/get/find_next를 구현한다."""
+
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    def select_one(self, css: str):
+        found = self.select(css)
+        return found[0] if found else None
+
+    def __getitem__(self, attr: str):
+        v = self.get(attr)
+        if v is None:
+            raise KeyError(attr)
+        return v
+
+    def __bool__(self):
+        return True
+
+def _join_text(pieces, sep: str, strip: bool) -> str:
+    if strip:
+        pieces = [p.strip() for p in pieces]
+        pieces = [p for p in pieces if p]
+    return sep.join(pieces)
+
+# ---------- selectolax (lexbor) ----------
+class _LexborNode(Node):
+    __slots__ = ()
+
+    @property
+    def tag(self):
+        return self.el.tag
+
+    def select(self, css):
+        return [_LexborNode(n) for n in self.el.css(css)]
+
+    def select_one(self, css):
+        n = self.el.css_first(css)
+        return _LexborNode(n) if n is not None else None
+
+    def get(self, attr, default=None):
+        v = self.el.attributes.get(attr, default)
+        return default if v is None else v
+
+    def text(self, sep: str = "", strip: bool = False) -> str:
+        if self.el.tag in SKIP_TEXT_TAGS:
+            return _join_text([self.el.text(deep=True)], sep, strip)
+        pieces = []
+        for n in self.el.traverse(include_text=True):
+            if n.is_text_node and n.parent is not None and n.parent.tag not in SKIP_TEXT_TAGS:
+                pieces.append(n.text_content or "")
+        return _join_text(pieces, sep, strip)
+
+    def find_next(self, tag: str):
+        # 문서 순서상 뒤에 오는 첫 tag 요소 (BeautifulSoup find_next와 동일)
+        cur = self.el
+        while cur is not None:
+            sib = cur.next
+            while sib is not None:
+                if sib.tag == tag:
+                    return _LexborNode(sib)
+                inner = sib.css_first(tag) if sib.is_element_node else None
+                if inner is not None:
+                    return _LexborNode(inner)
+                sib = sib.next
+            cur = cur.parent
+        return None
+
+# ---------- lxml ----------
+class _LxmlNode(Node):
+    __slots__ = ()
+
+    @property
+    def tag(self):
+        return self.el.tag
+
+    def select(self, css):
+        return [_LxmlNode(n) for n in self.el.cssselect(css)]
+
+    def get(self, attr, default=None):
+        return self.el.get(attr, default)
+
+    def text(self, sep: str = "", strip: bool = False) -> str:
+        if self.el.tag in SKIP_TEXT_TAGS:
+            return _join_text([self.el.text or ""], sep, strip)
+        pieces = self.el.xpath(".//text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]")
+        return _join_text([str(p) for p in pieces], sep, strip)
+
+    def find_next(self, tag: str):
+        found = self.el.xpath(f"following::{tag}[1]")
+        return _LxmlNode(found[0]) if found else None
+
+# ---------- BeautifulSoup ----------
+class _SoupNode(Node):
+    __slots__ = ()
+
+    @property
+    def tag(self):
+        return self.el.name
+
+    def select(self, css):
+        return [_SoupNode(n) for n in self.el.select(css)]
+
+    def select_one(self, css):
+        n = self.el.select_one(css)
+        return _SoupNode(n) if n is not None else None
+
+    def get(self, attr, default=None):
+        v = self.el.get(attr, default)
+        return " ".join(v) if isinstance(v, list) else v  # class 등 다중값 속성
+
+    def text(self, sep: str = "", strip: bool = False) -> str:
+        return self.el.get_text(sep, strip=strip)
+
+    def find_next(self, tag: str):
+        n = self.el.find_next(tag)
+        return _SoupNode(n) if n is not None else None
+
+# =========================
+# 문서
+# =========================
+class Document:
+    """
+    파싱된 페이지. root는 문서 전체 노드, html은 원문(정규식 빠른 경로용).
+    """
+
+    __slots__ = ("html", "backend", "root")
+
+    def __init__(self, html: str, backend: str, root: Node):
+        self.html = html
+        self.backend = backend
+        self.root = root
+
+    def select(self, css: str) -> list:
+        return self.root.select(css)
+
+    def select_one(self, css: str):
+        return self.root.select_one(css)
+
+    def text(self, sep: str = "", strip: bool = False) -> str:
+        return self.root.text(sep, strip)
+
+def _parse_selectolax(html):
+    from selectolax.lexbor import LexborHTMLParser
+    return _LexborNode(LexborHTMLParser(html).root)
+
+def _parse_lxml(html):
+    import lxml.html
+    import cssselect  # noqa: F401  (lxml cssselect() 의존성)
+    if not html or not html.strip():
+        html = "<html></html>"
+    return _LxmlNode(lxml.html.document_fromstring(html))
+
+def _parse_bs4(html):
+    from bs4 import BeautifulSoup
+    return _SoupNode(BeautifulSoup(html, "html.parser"))
+
+PARSERS = {
+    "selectolax": _parse_selectolax,
+    "lxml": _parse_lxml,
+    "bs4": _parse_bs4,
+}
+
+def available_backends() -> list:
+    out = []
+    for name, fn in PARSERS.items():
+        try:
+            fn("<p></p>")
+            out.append(name)
+        except ImportError:
+            continue
+    return out
+
+_default = None
+
+def default_backend() -> str:
+    global _default
+    if _default is None:
+        forced = os.environ.get("CRAWLER_PARSER")
+        backends = available_backends()
+        _default = forced if forced in backends else backends[0]
+    return _default
+
+def set_default_backend(name: str):
+    """기본 백엔드 변경 (벤치마크 등에서 문자열 입력 함수의 백엔드를 바꿀 때). None이면 다시 자동 선택."""
+    global _default
+    if name is not None and name not in PARSERS:
+        raise ValueError(f"알 수 없는 파서 백엔드: {name} (가능: {', '.join(PARSERS)})")
+    _default = name
+
+def parse_html(html, backend: str = None) -> Document:
+    """HTML 문자열 → Document. 이미 Document면 그대로 반환(재파싱 방지)."""
+    if isinstance(html, Document):
+        return html
+    backend = backend or default_backend()
+    return Document(html or "", backend, PARSERS[backend](html or ""))
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+requests 기반 크롤러 공용 HTTP 응답 캐시
+
+- 키: URL(params= 포함) + 관련 헤더(Accept, Accept-Language) 해시
+- 본문: zlib 압축 후 본문 해시(content-addressed)로 디스크 저장 → 동일 본문은 한 번만 저장
+- 신선도: URL 종류(TOC/아카이브 vs 기사)별 TTL, 만료 시 ETag/Last-Modified로 재검증(304)
+  요청 헤더에 Cache-Control: no-cache가 있으면 TTL이 남아 있어도 재검증 (증분 수집의 목록 페이지 등)
+- 용량: max_bytes 초과 시 마지막 접근 시각 기준 LRU 삭제
+
+사용 예:
+from http_cache import CachedSession
+sess = CachedSession(min_interval=0.5)
+r = sess.get("https://aisel.aisnet.org/jais/vol26/iss1/", timeout=30)
+"""
+
+import os, re, json, time, zlib, hashlib, sqlite3, threading
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from metrics import METRICS, host_of
+
+# =========================
+# 설정
+# =========================
+DEFAULT_CACHE_DIR = os.environ.get(
+    "CRAWLER_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".http_cache")
+)
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2GB
+VARY_HEADERS = ("Accept", "Accept-Language")
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# (URL 정규식, TTL 초) — 위에서부터 처음 매칭되는 규칙 적용
+# 목차/아카이브/목록 페이지는 새 글이 올라오므로 짧게, 기사 페이지는 거의 바뀌지 않으므로 길게
+DEFAULT_TTL_RULES = [
+    (re.compile(r"/archives/|/category/|/page/\d+/?$"), 6 * HOUR),  # 뉴스 목록
+    (re.compile(r"/toc/|/iss\d+/?$|/vol/\d+/(issue|suppl)/"), 7 * DAY),  # 저널 목차
+    (re.compile(r"."), 30 * DAY),  # 기사/논문 상세
+]
+
+# =========================
+# 캐시 저장소
+# =========================
+class HttpCache:
+    """
+    디스크 캐시. 인덱스는 SQLite, 본문은 objects/<해시 앞 2자리>/<해시>.z 파일.
+    스레드 간 공유 가능(내부 잠금).
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl_rules=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_rules = ttl_rules or DEFAULT_TTL_RULES
+        os.makedirs(os.path.join(cache_dir, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(cache_dir, "index.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body_hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON entries(last_access)")
+        self._db.commit()
+
+    # ---------- 키/경로 ----------
+    @staticmethod
+    def make_key(url: str, headers=None) -> str:
+        headers = CaseInsensitiveDict(headers or {})
+        parts = [url] + [f"{h}:{headers.get(h, '')}" for h in VARY_HEADERS]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _object_path(self, body_hash: str) -> str:
+        return os.path.join(self.cache_dir, "objects", body_hash[:2], body_hash + ".z")
+
+    def ttl_for(self, url: str) -> int:
+        for pat, ttl in self.ttl_rules:
+            if pat.search(url):
+                return ttl
+        return 30 * DAY
+
+    # ---------- 조회/저장 ----------
+    def lookup(self, key: str):
+        """
+        캐시 항목 반환(dict) 또는 None. 본문 파일이 사라졌으면 항목도 삭제.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, body_hash, status, headers, etag, last_modified, expires_at "
+                "FROM entries WHERE key=?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            url, body_hash, status, headers, etag, last_modified, expires_at = row
+            try:
+                with open(self._object_path(body_hash), "rb") as f:
+                    body = zlib.decompress(f.read())
+            except (OSError, zlib.error):
+                self._db.execute("DELETE FROM entries WHERE key=?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE entries SET last_access=? WHERE key=?", (time.time(), key))
+            self._db.commit()
+        return {
+            "url": url,
+            "status": status,
+            "headers": json.loads(headers),
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": expires_at > time.time(),
+        }
+
+    def store(self, key: str, url: str, status: int, headers: dict, body: bytes):
+        body_hash = hashlib.sha256(body).hexdigest()
+        path = self._object_path(body_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(zlib.compress(body, 6))
+            os.replace(tmp, path)
+        size = os.path.getsize(path)
+        headers = CaseInsensitiveDict(headers)
+        keep = {k: v for k, v in headers.items() if k.lower() in ("content-type", "etag", "last-modified")}
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, url, body_hash, size, status, headers, etag, last_modified, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, body_hash, size, status, json.dumps(keep), headers.get("ETag"),
+                 headers.get("Last-Modified"), now + self.ttl_for(url), now),
+            )
+            self._db.commit()
+        self.evict()
+
+    def touch(self, key: str, url: str):
+        """304 재검증 성공 시 만료 시각 연장."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE entries SET expires_at=?, last_access=? WHERE key=?",
+                (now + self.ttl_for(url), now, key),
+            )
+            self._db.commit()
+
+    def evict(self):
+        """총 용량이 max_bytes를 넘으면 오래 안 쓴 항목부터 삭제."""
+        with self._lock:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = self._db.execute("SELECT key, body_hash, size FROM entries ORDER BY last_access").fetchall()
+            for key, body_hash, size in rows:
+                if total <= self.max_bytes * 0.9:
+                    break
+                self._db.execute("DELETE FROM entries WHERE key=?", (key,))
+                total -= size
+                still_used = self._db.execute(
+                    "SELECT 1 FROM entries WHERE body_hash=? LIMIT 1", (body_hash,)
+                ).fetchone()
+                if not still_used:
+                    try:
+                        os.remove(self._object_path(body_hash))
+                    except OSError:
+                        pass
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+# =========================
+# requests 세션
+# =========================
+def _build_response(entry: dict, request) -> requests.Response:
+    r = requests.Response()
+    r.status_code = entry["status"]
+    r.reason = "OK"
+    r.headers = CaseInsensitiveDict(entry["headers"])
+    r._content = entry["body"]
+    r.url = entry["url"]
+    r.encoding = get_encoding_from_headers(r.headers)
+    r.request = request
+    r.from_cache = True
+    return r
+
+class CachedSession(requests.Session):
+    """
+    GET 요청을 HttpCache로 처리하는 Session.
+    min_interval: 같은 호스트로 실제 네트워크 요청을 보낼 때의 최소 간격(초).
+    limiter: rate_limit.HostLimiter — 주면 min_interval 대신 사용 (스레드마다 세션을 두고 속도 제한은 공유할 때)
+    캐시 적중 시에는 대기하지 않으므로 재파싱은 네트워크 시간 0.
+    headers={"Cache-Control": "no-cache"}로 요청하면 신선한 항목도 서버에 재검증 (바뀌지 않았으면 304로 캐시 본문 사용)
+    """
+
+    def __init__(self, cache: HttpCache = None, min_interval: float = 0.0, limiter=None):
+        super().__init__()
+        self.cache = cache or HttpCache()
+        self.min_interval = min_interval
+        self.limiter = limiter
+        self._last_hit = {}
+        self._host_lock = threading.Lock()
+
+    def _polite_wait(self, url: str):
+        if self.limiter is not None:
+            delay = self.limiter.acquire(url)
+            if delay > 0:
+                METRICS.observe("wait", delay * 1000, host_of(url))
+            return
+        if self.min_interval <= 0:
+            return
+        host = urlparse(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            due = self._last_hit.get(host, 0.0) + self.min_interval
+            self._last_hit[host] = max(now, due)
+        if due > now:
+            time.sleep(due - now)
+            METRICS.observe("wait", (due - now) * 1000, host)
+
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != "GET" or kwargs.get("stream"):
+            self._polite_wait(url)
+            return super().request(method, url, *args, **kwargs)
+
+        # 키·TTL·저장 URL은 params=까지 붙인 최종 URL 기준 (params만 다른 요청이 같은 항목을 쓰지 않도록)
+        full_url = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+        merged = CaseInsensitiveDict(self.headers)
+        merged.update(kwargs.get("headers") or {})
+        key = self.cache.make_key(full_url, merged)
+        entry = self.cache.lookup(key)
+        revalidate = "no-cache" in merged.get("Cache-Control", "").lower()
+        if entry and entry["fresh"] and not revalidate:
+            METRICS.incr("cache_hit", site=host_of(url))
+            return _build_response(entry, requests.Request("GET", full_url).prepare())
+
+        if entry:
+            cond = dict(kwargs.get("headers") or {})
+            if entry["etag"]:
+                cond["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                cond["If-Modified-Since"] = entry["last_modified"]
+            kwargs["headers"] = cond
+
+        self._polite_wait(url)
+        t0 = time.perf_counter()
+        r = super().request(method, url, *args, **kwargs)
+        METRICS.observe_response(r, (time.perf_counter() - t0) * 1000)
+        r.from_cache = False
+        if entry and r.status_code == 304:
+            self.cache.touch(key, full_url)
+            return _build_response(entry, r.request)
+        if r.status_code == 200:
+            self.cache.store(key, full_url, r.status_code, r.headers, r.content)
+        return r
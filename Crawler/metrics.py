@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+크롤 단계별 소요 시간 계측 (모든 크롤러 공용)
+
+- 단계(stage): dns / connect / ttfb / download (네트워크), parse, wait(요청 간격·준비 대기),
+  driver_start(드라이버 시작·재시작), sink_write(출력 기록), page(브라우저 렌더링 전체) 등
+- (단계, 사이트)마다 HDR 방식 로그 버킷 히스토그램 — 값 범위와 무관하게 상대 오차 1% 이하, 메모리 일정
+- 단계별로 가장 느린 URL 몇 개를 함께 보관 → 느린 사이트·페이지 바로 확인
+- 실행 끝에 JSON(히스토그램 원본 포함, 실행끼리 합산·비교 가능) + Prometheus 텍스트로 내보내기
+- LiveSummary: 실행 중 주기적으로 처리량과 단계별 p50/p95 출력
+
+사용 예:
+from metrics import METRICS, LiveSummary
+with METRICS.timer("parse", site="theverge", url=url):
+    row = parse_article_html(html, url)
+with LiveSummary(interval=30):
+    ...
+METRICS.export("theverge_metrics")   # → theverge_metrics.json, theverge_metrics.prom
+
+python metrics.py show theverge_metrics.json [--stage ttfb]
+"""
+
+import json, time, heapq, argparse, threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+# =========================
+# 설정
+# =========================
+SUB_BITS = 7          # 2의 거듭제곱 구간마다 2^7=128개 버킷 → 상대 오차 < 1/128
+SLOWEST_N = 10        # 단계별로 보관하는 가장 느린 URL 수
+QUANTILES = (0.5, 0.9, 0.95, 0.99)
+NETWORK_STAGES = ("dns", "connect", "ttfb", "download")
+
+def host_of(url: str) -> str:
+    return urlparse(str(url)).netloc
+
+# =========================
+# 히스토그램
+# =========================
+class Histogram:
+    """
+    HDR 방식: 값(μs 정수)의 상위 SUB_BITS+1비트만 남겨 버킷 번호로 사용.
+    작은 값은 그대로, 큰 값은 같은 상대 폭으로 묶이므로 1μs~수 시간을 같은 정밀도로 기록.
+    """
+
+    def __init__(self, sub_bits: int = SUB_BITS):
+        self.sub_bits = sub_bits
+        self.counts = {}
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+
+    def _index(self, us: int) -> int:
+        if us < (1 << self.sub_bits):
+            return us
+        shift = us.bit_length() - self.sub_bits - 1
+        return ((shift + 1) << self.sub_bits) + ((us >> shift) - (1 << self.sub_bits))
+
+    def _value_us(self, idx: int) -> float:
+        """버킷 대표값(구간 중앙, μs)"""
+        if idx < (1 << self.sub_bits):
+            return float(idx)
+        shift = (idx >> self.sub_bits) - 1
+        top = (idx & ((1 << self.sub_bits) - 1)) + (1 << self.sub_bits)
+        return (top << shift) + ((1 << shift) - 1) / 2
+
+    def record(self, ms: float):
+        ms = max(0.0, float(ms))
+        idx = self._index(int(ms * 1000))
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.count += 1
+        self.sum_ms += ms
+        self.min_ms = ms if self.min_ms is None else min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def merge(self, other: "Histogram"):
+        for idx, n in other.counts.items():
+            self.counts[idx] = self.counts.get(idx, 0) + n
+        self.count += other.count
+        self.sum_ms += other.sum_ms
+        if other.min_ms is not None:
+            self.min_ms = other.min_ms if self.min_ms is None else min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+        return self
+
+    def percentile(self, q: float) -> float:
+        """q: 0~100 → ms (기록 없으면 0)"""
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(self.count * q / 100)))
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen >= target:
+                return min(self.max_ms, max(self.min_ms, self._value_us(idx) / 1000))
+        return self.max_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "min_ms": round(self.min_ms or 0.0, 3),
+            "max_ms": round(self.max_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            **{f"p{int(q * 100)}_ms": round(self.percentile(q * 100), 3) for q in QUANTILES},
+            "sub_bits": self.sub_bits,
+            "buckets": {str(k): v for k, v in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Histogram":
+        h = cls(d.get("sub_bits", SUB_BITS))
+        h.counts = {int(k): v for k, v in d.get("buckets", {}).items()}
+        h.count = d["count"]
+        h.sum_ms = d["sum_ms"]
+        h.min_ms = d["min_ms"] if h.count else None
+        h.max_ms = d["max_ms"]
+        return h
+
+# =========================
+# 수집기
+# =========================
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hists = {}       # (stage, site) → Histogram
+        self.counters = {}    # (name, site) → int
+        self.slowest = {}     # stage → [(ms, url, site)] 최소 힙
+        self.started = time.time()
+
+    def observe(self, stage: str, ms: float, site: str = "", url: str = None):
+        with self._lock:
+            key = (stage, site or "")
+            if key not in self.hists:
+                self.hists[key] = Histogram()
+            self.hists[key].record(ms)
+            if url:
+                heap = self.slowest.setdefault(stage, [])
+                item = (float(ms), str(url), site or "")
+                if len(heap) < SLOWEST_N:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+    def incr(self, name: str, n: int = 1, site: str = ""):
+        with self._lock:
+            key = (name, site or "")
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    @contextmanager
+    def timer(self, stage: str, site: str = "", url: str = None):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - t0) * 1000, site, url)
+
+    def observe_response(self, r, total_ms: float, site: str = None):
+        """
+        requests 응답: elapsed(요청 → 헤더 수신)를 ttfb, 나머지를 download로 기록.
+        requests는 DNS·연결 시간을 따로 알려주지 않으므로 둘은 ttfb에 포함된다 (aiohttp 경로만 분리 기록).
+        """
+        site = site or host_of(r.url)
+        ttfb = r.elapsed.total_seconds() * 1000
+        self.observe("ttfb", ttfb, site, r.url)
+        self.observe("download", max(0.0, total_ms - ttfb), site, r.url)
+
+    # ---------- 조회 ----------
+    def merged(self, stage: str, site: str = None) -> Histogram:
+        """한 단계의 (사이트 전체 또는 특정 사이트) 합산 히스토그램"""
+        out = Histogram()
+        with self._lock:
+            for (st, s), h in self.hists.items():
+                if st == stage and (site is None or s == site):
+                    out.merge(h)
+        return out
+
+    def stages(self) -> list:
+        with self._lock:
+            return sorted({st for st, _ in self.hists})
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "started": self.started,
+                "elapsed_s": round(time.time() - self.started, 3),
+                "histograms": [{"stage": st, "site": s, **h.to_dict()} for (st, s), h in sorted(self.hists.items())],
+                "counters": [{"name": n, "site": s, "value": v} for (n, s), v in sorted(self.counters.items())],
+                "slowest": {st: [{"ms": round(ms, 3), "url": u, "site": s} for ms, u, s in sorted(h, reverse=True)]
+                            for st, h in sorted(self.slowest.items())},
+            }
+
+    def summary_lines(self, stages=None) -> list:
+        elapsed = max(1e-9, time.time() - self.started)
+        pages = sum(v for (n, _), v in list(self.counters.items()) if n == "pages")
+        lines = [f"📊 {elapsed:.0f}s 경과, 페이지 {pages}건 ({pages / elapsed:.2f}건/s)"]
+        for stage in stages or self.stages():
+            h = self.merged(stage)
+            if h.count:
+                lines.append(f"   {stage:<12} n={h.count:<6} p50 {h.percentile(50):>8.1f}ms  "
+                             f"p95 {h.percentile(95):>8.1f}ms  max {h.max_ms:>8.1f}ms  합계 {h.sum_ms / 1000:>7.1f}s")
+        return lines
+
+    # ---------- 내보내기 ----------
+    def to_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=1)
+
+    def to_prometheus(self, path: str, prefix: str = "crawler"):
+        snap = self.snapshot()
+        out = [f"# HELP {prefix}_stage_ms 크롤 단계별 소요 시간(ms)", f"# TYPE {prefix}_stage_ms summary"]
+        for h in snap["histograms"]:
+            labels = f'stage="{_esc(h["stage"])}",site="{_esc(h["site"])}"'
+            for q in QUANTILES:
+                out.append(f'{prefix}_stage_ms{{{labels},quantile="{q}"}} {h[f"p{int(q * 100)}_ms"]}')
+            out.append(f"{prefix}_stage_ms_sum{{{labels}}} {h['sum_ms']}")
+            out.append(f"{prefix}_stage_ms_count{{{labels}}} {h['count']}")
+        out += [f"# HELP {prefix}_events_total 크롤 이벤트 수", f"# TYPE {prefix}_events_total counter"]
+        for c in snap["counters"]:
+            out.append(f'{prefix}_events_total{{name="{_esc(c["name"])}",site="{_esc(c["site"])}"}} {c["value"]}')
+        out += [f"# TYPE {prefix}_elapsed_seconds gauge", f"{prefix}_elapsed_seconds {snap['elapsed_s']}"]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(out) + "\n")
+
+    def export(self, prefix: str) -> tuple:
+        """prefix.json + prefix.prom 저장 → 두 경로 반환"""
+        paths = (prefix + ".json", prefix + ".prom")
+        self.to_json(paths[0])
+        self.to_prometheus(paths[1])
+        return paths
+
+def _esc(v: str) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+METRICS = Metrics()  # 프로세스 공용 (http_cache · async_fetch · smart_wait · sink가 여기에 기록)
+
+# =========================
+# 실행 중 요약
+# =========================
+class LiveSummary:
+    """interval초마다 METRICS 요약 출력 (tqdm을 쓰는 크롤러는 write=tqdm.write)"""
+
+    def __init__(self, metrics: Metrics = METRICS, interval: float = 30.0, write=print, stages=None):
+        self.metrics = metrics
+        self.interval = interval
+        self.write = write
+        self.stages = stages
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write("\n".join(self.metrics.summary_lines(self.stages)))
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, final: bool = True):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        if final:
+            self.write("\n".join(self.metrics.summary_lines(self.stages)))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="크롤 계측 결과(JSON) 보기 · 합산")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p_show = sub.add_parser("show", help="단계·사이트별 분위수와 느린 URL")
+    p_show.add_argument("inputs", nargs="+", help="*.json (여러 개면 합산)")
+    p_show.add_argument("--stage", default=None)
+    p_show.add_argument("--by-site", action="store_true", help="사이트별로 나눠 출력")
+    args = ap.parse_args()
+
+    merged, slowest = {}, {}
+    for path in args.inputs:
+        with open(path, encoding="utf-8") as f:
+            snap = json.load(f)
+        for d in snap["histograms"]:
+            key = (d["stage"], d["site"] if args.by_site else "")
+            merged.setdefault(key, Histogram(d.get("sub_bits", SUB_BITS))).merge(Histogram.from_dict(d))
+        for st, items in snap.get("slowest", {}).items():
+            slowest.setdefault(st, []).extend(items)
+
+    for (stage, site), h in sorted(merged.items()):
+        if args.stage and stage != args.stage:
+            continue
+        name = f"{stage} [{site}]" if site else stage
+        print(f"{name:<40} n={h.count:<7} p50 {h.percentile(50):>8.1f}  p90 {h.percentile(90):>8.1f}  "
+              f"p99 {h.percentile(99):>8.1f}  max {h.max_ms:>8.1f} ms")
+    for stage, items in sorted(slowest.items()):
+        if args.stage and stage != args.stage:
+            continue
+        print(f"\n🐢 {stage} 가장 느린 URL")
+        for it in sorted(items, key=lambda x: -x["ms"])[:SLOWEST_N]:
+            print(f"   {it['ms']:>9.1f}ms  {it['url']}")
+
+if __name__ == "__main__":
+    main()
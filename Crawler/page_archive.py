@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+원본 HTML 보관용 append-only 아카이브 (WARC 유사)
+
+- 본문 파일(*.warc.gz): 레코드마다 독립된 gzip 멤버 → 전체를 gzip으로 순차 읽기도, 오프셋으로 임의 접근도 가능
+  레코드 내용: 헤더 JSON 한 줄 + "\\n" + HTML
+- 인덱스 파일(*.warc.gz.idx): 레코드별 {"url", "offset", "length", "meta"} JSON 한 줄
+
+사용 예:
+with PageArchive("IAM/iam.warc.gz") as arc:
+    arc.append(url, driver.page_source, volume=62, issue=8)
+"""
+
+import os, json, gzip, time
+
+# =========================
+# 아카이브
+# =========================
+class PageArchive:
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = path + ".idx"
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        if os.path.exists(path) and not os.path.exists(self.index_path):
+            self.rebuild_index()
+        self._fh = None
+        self._idx = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _open_for_append(self):
+        if self._fh is None:
+            self._fh = open(self.path, "ab")
+            self._idx = open(self.index_path, "a", encoding="utf-8")
+
+    def append(self, url: str, html: str, **meta) -> dict:
+        """
+        페이지 1건 기록. meta에는 volume/issue 등 페이지 밖에서 알 수 있는 값만 넣는다.
+        """
+        self._open_for_append()
+        header = {"url": url, "fetched_at": time.time(), "meta": meta}
+        payload = json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n" + (html or "").encode("utf-8")
+        blob = gzip.compress(payload, compresslevel=6)
+        offset = self._fh.seek(0, os.SEEK_END)
+        self._fh.write(blob)
+        self._fh.flush()
+        entry = {"url": url, "offset": offset, "length": len(blob), "meta": meta}
+        self._idx.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._idx.flush()
+        return entry
+
+    def close(self):
+        for fh in (self._fh, self._idx):
+            if fh is not None:
+                fh.close()
+        self._fh = self._idx = None
+
+    # ---------- 읽기 ----------
+    def entries(self) -> list:
+        """
+        인덱스 항목 목록. 같은 URL이 여러 번 기록됐으면 마지막 것만 남긴다.
+        """
+        if not os.path.exists(self.index_path):
+            return []
+        latest = {}
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    e = json.loads(line)
+                except ValueError:
+                    continue  # 비정상 종료로 잘린 마지막 줄
+                latest[e["url"]] = e
+        return sorted(latest.values(), key=lambda e: e["offset"])
+
+    def read(self, entry: dict) -> dict:
+        return read_record(self.path, entry["offset"], entry["length"])
+
+    def get(self, url: str):
+        for e in reversed(self.entries()):
+            if e["url"] == url:
+                return self.read(e)
+        return None
+
+    def __iter__(self):
+        for e in self.entries():
+            yield self.read(e)
+
+    def __len__(self):
+        return len(self.entries())
+
+    def rebuild_index(self):
+        """
+        인덱스가 없거나 깨졌을 때 본문 파일을 처음부터 훑어 재생성.
+        gzip 멤버 경계를 찾기 위해 zlib 디컴프레서의 unused_data를 이용한다.
+        """
+        import zlib
+        entries = []
+        with open(self.path, "rb") as f:
+            data = f.read()
+        pos = 0
+        while pos < len(data):
+            d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            try:
+                payload = d.decompress(data[pos:])
+            except zlib.error:
+                break  # 잘린 마지막 레코드
+            if not d.eof:
+                break
+            length = len(data) - pos - len(d.unused_data)
+            header = json.loads(payload.split(b"\n", 1)[0])
+            entries.append({"url": header["url"], "offset": pos, "length": length, "meta": header.get("meta", {})})
+            pos += length
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            for e in entries:
+                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+
+def read_record(path: str, offset: int, length: int) -> dict:
+    """
+    오프셋으로 레코드 1건 읽기 → {"url", "fetched_at", "meta", "html"}
+    (프로세스 풀 워커에서 파일 핸들 공유 없이 쓰도록 모듈 함수로 둔다)
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        payload = gzip.decompress(f.read(length))
+    head, _, body = payload.partition(b"\n")
+    rec = json.loads(head)
+    rec["html"] = body.decode("utf-8")
+    return rec
+
+def archive_path_for(output_path: str) -> str:
+    """출력 CSV 경로 옆에 둘 아카이브 경로."""
+    root, _ = os.path.splitext(output_path)
+    return root + ".warc.gz"
@@ -0,0 +1,501 @@
+# -*- coding: utf-8 -*-
+"""
+ProQuest(NYT/WSJ) 상세 페이지 병렬 수집기 (proquest-nyt / proquest wsj 노트북의 본문 수집 단계)
+
+- 로그인은 한 번만: 브라우저에서 수동 로그인 후 쿠키를 JSON으로 내보냄 (login 명령)
+- 워커 N개가 그 쿠키를 복제한 세션(HTTP 세션 또는 헤드리스 크롬)을 하나씩 보유
+- 작업 큐에서 docview 링크를 batch_size개씩 꺼내 처리 → 결과는 메인 스레드가 한 줄씩 바로 기록
+- 고정 time.sleep(3) 대신 호스트 단위 요청 간격(rate)으로 전체 속도만 제한
+- 문서는 URL의 /docview/(\d+) ID로 SQLite 저장소에 한 행씩 → 명령마다 해당 상태의 행만 읽고 갱신
+- 결과는 받는 즉시 저장소에 커밋 → 중단 후 같은 명령으로 이어서 실행
+
+사용 예:
+python proquest.py login --cookies proquest_cookies.json
+python proquest.py import proquest_nyt.csv nyt_content.csv --source nyt   # 링크 목록/기존 결과 등록
+python proquest.py fetch-missing --source nyt --workers 4                  # 본문 없는 문서 전체를 한 번에
+python proquest.py refetch-failed --source wsj --mode browser
+python proquest.py export --source nyt --output nyt_content.csv
+"""
+
+import os, re, json, time, queue, sqlite3, argparse, threading
+from urllib.parse import urlparse
+
+import requests
+
+from html_parser import parse_html
+from rate_limit import HostLimiter
+from sink import RowSink
+from smart_wait import WaitEngine, WaitTimeout
+from metrics import METRICS, LiveSummary
+
+# =========================
+# 설정
+# =========================
+BASE_URL = "https://www.proquest.com"
+COLUMNS = ["title", "link", "date", "media", "content"]
+DEFAULT_COOKIES = "proquest_cookies.json"
+DEFAULT_STORE_DB = os.environ.get(
+    "PROQUEST_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".proquest.sqlite")
+)
+DEFAULT_WORKERS = 4
+BATCH_SIZE = 10          # 워커가 큐에서 한 번에 가져가는 링크 수
+RATE = 1.0               # proquest.com 전체 초당 요청 수 (워커 수와 무관)
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+_DOCVIEW_PAT = re.compile(r"/docview/(\d+)")
+_DATE_PAT = re.compile(r"<strong[^>]*>[^<]*;[^<]*</strong>\s*([^<]+)")
+_DAY_PAT = re.compile(r"\d{2} \w{3} \d{4}")  # "04 Feb 2025"
+_READY_CSS = "[id^='fulltext_field_'] p, #fullTextZone p, #main-content p, #companionColumn-0 p"
+
+class SessionExpired(RuntimeError):
+    """로그인 페이지로 돌아감 → 쿠키를 다시 내보내야 함"""
+
+def doc_id_of(url: str) -> str:
+    m = _DOCVIEW_PAT.search(url or "")
+    return m.group(1) if m else ""
+
+# =========================
+# 상세 페이지 파싱 (노트북 XPath → CSS)
+# =========================
+def parse_detail(html: str, url: str) -> dict:
+    """docview 페이지 HTML → date/media/content (못 찾은 필드는 빈 문자열)"""
+    doc = parse_html(html)
+    mstar_id = f"MSTAR_{doc_id_of(url)}" if doc_id_of(url) else ""
+
+    content = ""
+    content_css = [
+        f"#fulltext_field_{mstar_id} > div > root > text > p" if mstar_id else "",
+        "#fullTextZone p",
+        "#main-content p",
+        "#companionColumn-0 p",
+    ]
+    for css in content_css:
+        if not css:
+            continue
+        paragraphs = [p.text(strip=True) for p in doc.select(css)]
+        paragraphs = [p for p in paragraphs if p]
+        if paragraphs:
+            content = "\n".join(paragraphs)
+            break
+
+    # 날짜: ';'가 들어간 <strong> 바로 뒤 텍스트
+    date_text = ""
+    m = _DATE_PAT.search(html)
+    if m:
+        raw = m.group(1).strip()
+        day = _DAY_PAT.search(raw)
+        date_text = day.group() if day else raw
+
+    media = ""
+    media_css = [
+        f"#pubPopoverTrigger-{mstar_id} > span" if mstar_id else "",
+        "#bibSource > span",
+        "div.publicationTitle",
+        "div.bibSource",
+        "span.publicationTitle",
+    ]
+    for css in media_css:
+        if not css:
+            continue
+        el = doc.select_one(css)
+        if el is not None:
+            media = el.text(strip=True).split(";")[0]
+            if media:
+                break
+
+    return {"date": date_text, "media": media, "content": content}
+
+def _check_login(final_url: str):
+    """docview 요청이 다른 곳(로그인/기관 인증 페이지)으로 리다이렉트되면 세션 만료"""
+    if "login" in urlparse(final_url).path.lower() or "/docview/" not in final_url:
+        raise SessionExpired(f"로그인 세션 만료: {final_url}")
+
+# =========================
+# 로그인 쿠키
+# =========================
+def make_browser(headless: bool = True):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    return webdriver.Chrome(options=options)
+
+def export_cookies(path: str = DEFAULT_COOKIES):
+    """보이는 브라우저로 수동 로그인 → 쿠키 저장 (워커들이 이 쿠키를 복제해 사용)"""
+    driver = make_browser(headless=False)
+    try:
+        print("🔐 브라우저가 열립니다. ProQuest에 로그인하세요.")
+        driver.get(BASE_URL)
+        input("✅ 로그인 완료 후 Enter를 눌러주세요...")
+        cookies = driver.get_cookies()
+    finally:
+        driver.quit()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cookies, f, ensure_ascii=False, indent=2)
+    print(f"🍪 쿠키 {len(cookies)}개 저장: {path}")
+
+def load_cookies(path: str = DEFAULT_COOKIES) -> list:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"쿠키 파일이 없습니다: {path} (먼저 python proquest.py login)")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+# =========================
+# 워커별 페처 (쿠키 복제)
+# =========================
+class HttpFetcher:
+    """requests 세션 — 가장 가볍고 빠름 (본문이 서버 렌더링일 때)"""
+
+    def __init__(self, cookies: list):
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        for c in cookies:
+            self.session.cookies.set(c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/"))
+
+    def fetch(self, url: str) -> str:
+        t0 = time.perf_counter()
+        r = self.session.get(url, timeout=30)
+        METRICS.observe_response(r, (time.perf_counter() - t0) * 1000, "proquest")
+        r.raise_for_status()
+        _check_login(r.url)
+        return r.text
+
+    def close(self):
+        self.session.close()
+
+class BrowserFetcher:
+    """헤드리스 크롬 — 본문이 스크립트로 그려질 때"""
+
+    def __init__(self, cookies: list):
+        with METRICS.timer("driver_start", "proquest"):
+            self.driver = make_browser(headless=True)
+        # 요청 간격은 워커 풀의 HostLimiter가 맡으므로 여기서는 본문 준비 신호만 기다림
+        self.waiter = WaitEngine("proquest", min_interval=0, jitter=0)
+        self.driver.get(BASE_URL)  # 쿠키 도메인 맞추기
+        for c in cookies:
+            c = {k: v for k, v in c.items() if k in ("name", "value", "domain", "path", "secure", "expiry")}
+            try:
+                self.driver.add_cookie(c)
+            except Exception:
+                pass
+
+    def fetch(self, url: str) -> str:
+        t0 = time.perf_counter()
+        self.driver.get(url)
+        _check_login(self.driver.current_url)
+        try:
+            self.waiter.wait_for(self.driver, _READY_CSS, label="docview", baseline=3.0)  # 노트북의 time.sleep(3)
+        except WaitTimeout:
+            pass  # 본문 없는 문서 — 파싱 결과가 비면 failed로 남음
+        METRICS.observe("page", (time.perf_counter() - t0) * 1000, "proquest", url)
+        return self.driver.page_source
+
+    def close(self):
+        self.waiter.summary()
+        self.waiter.close()
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+FETCHERS = {"http": HttpFetcher, "browser": BrowserFetcher}
+
+# =========================
+# 워커 풀
+# =========================
+def _worker(wid, fetcher_cls, cookies, task_q, result_q, limiter, stop):
+    try:
+        fetcher = fetcher_cls(cookies)
+    except Exception as e:
+        result_q.put(("error", wid, None, f"페처 생성 실패: {e!r}"))
+        result_q.put(("done", wid, None, None))
+        return
+    try:
+        while not stop.is_set():
+            batch = task_q.get()
+            if batch is None:
+                break
+            for item in batch:
+                if stop.is_set():
+                    break
+                url = item["link"]
+                delay = limiter.acquire(url)
+                if delay > 0:
+                    METRICS.observe("wait", delay * 1000, "proquest")
+                t0 = time.perf_counter()
+                try:
+                    html = fetcher.fetch(url)
+                    with METRICS.timer("parse", "proquest", url):
+                        row = {**item, **parse_detail(html, url)}
+                    result_q.put(("row", wid, row, time.perf_counter() - t0))
+                except SessionExpired as e:
+                    result_q.put(("expired", wid, item, str(e)))
+                    stop.set()
+                except Exception as e:
+                    result_q.put(("error", wid, item, repr(e)))
+    finally:
+        fetcher.close()
+        result_q.put(("done", wid, None, None))
+
+def fetch_details(items, cookies: list, mode: str = "http", n_workers: int = DEFAULT_WORKERS,
+                  batch_size: int = BATCH_SIZE, rate: float = RATE):
+    """
+    items: {"title", "link", ...} dict 목록 → 완료 순서대로 ("row", row, 소요 초) / ("error", item, 메시지) yield.
+    세션이 만료되면 모든 워커를 멈추고 ("expired", item, 메시지)를 yield한 뒤 끝낸다.
+    """
+    items = list(items)
+    if not items:
+        return
+    fetcher_cls = FETCHERS[mode]
+    task_q, result_q = queue.Queue(), queue.Queue()
+    for i in range(0, len(items), batch_size):
+        task_q.put(items[i:i + batch_size])
+    n_workers = max(1, min(n_workers, task_q.qsize()))
+    for _ in range(n_workers):
+        task_q.put(None)
+
+    limiter = HostLimiter(rate, burst=n_workers)
+    stop = threading.Event()
+    threads = [threading.Thread(target=_worker, args=(wid, fetcher_cls, cookies, task_q, result_q, limiter, stop),
+                                daemon=True) for wid in range(n_workers)]
+    for t in threads:
+        t.start()
+
+    done = 0
+    try:
+        while done < n_workers:
+            kind, wid, payload, extra = result_q.get()
+            if kind == "row":
+                yield "row", payload, extra
+            elif kind in ("error", "expired"):
+                yield kind, payload, extra
+            elif kind == "done":
+                done += 1
+    finally:
+        stop.set()
+        for t in threads:
+            t.join(timeout=30)
+
+# =========================
+# docview ID 기준 저장소
+# =========================
+class ProQuestStore:
+    """
+    SQLite: doc_id(기본키)마다 링크·메타·본문·상태 한 행.
+    상태: pending(본문 없음) → done, 실패 시 failed — 명령마다 해당 행만 읽고 갱신 (CSV 전체 재작성 없음)
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_DB):
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                doc_id TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                title TEXT,
+                link TEXT NOT NULL,
+                date TEXT,
+                media TEXT,
+                content TEXT,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_source_status ON articles(source, status)")
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- 가져오기 ----------
+    def import_rows(self, rows, source: str) -> tuple:
+        """
+        노트북 CSV 행(title, link[, date, media, content]) 등록 → (새 문서 수, 본문이 채워진 문서 수).
+        이미 있는 doc_id는 비어 있던 필드만 채움 (수집한 본문을 덮어쓰지 않음).
+        """
+        now = time.time()
+        n_new = n_filled = 0
+        for r in rows:
+            doc_id = doc_id_of(r.get("link"))
+            if not doc_id:
+                continue
+            vals = {c: ("" if _is_empty(r.get(c)) else str(r.get(c))) for c in COLUMNS}
+            status = "done" if vals["content"] else "pending"
+            cur = self._db.execute(
+                "INSERT OR IGNORE INTO articles (doc_id, source, title, link, date, media, content, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (doc_id, source, vals["title"], vals["link"], vals["date"], vals["media"], vals["content"], status, now),
+            )
+            if cur.rowcount:
+                n_new += 1
+            elif vals["content"]:
+                cur = self._db.execute(
+                    "UPDATE articles SET content=?, date=COALESCE(NULLIF(date, ''), ?), media=COALESCE(NULLIF(media, ''), ?), "
+                    "status='done', updated_at=? WHERE doc_id=? AND COALESCE(content, '')=''",
+                    (vals["content"], vals["date"], vals["media"], now, doc_id),
+                )
+                n_filled += cur.rowcount
+        self._db.commit()
+        return n_new, n_filled
+
+    # ---------- 조회 ----------
+    def items(self, status: str, source: str = None, limit: int = 0) -> list:
+        q = "SELECT title, link FROM articles WHERE status=?"
+        params = [status]
+        if source:
+            q += " AND source=?"
+            params.append(source)
+        if limit:
+            q += f" LIMIT {int(limit)}"
+        return [{"title": t, "link": l} for t, l in self._db.execute(q, params)]
+
+    def stats(self) -> list:
+        return self._db.execute(
+            "SELECT source, status, COUNT(*) FROM articles GROUP BY source, status ORDER BY source, status"
+        ).fetchall()
+
+    # ---------- 갱신 ----------
+    def save(self, row: dict):
+        """수집 결과 한 행 반영 — 본문이 비었으면 failed로 남겨 refetch-failed 대상"""
+        status = "done" if row.get("content") else "failed"
+        self._db.execute(
+            "UPDATE articles SET date=COALESCE(NULLIF(?, ''), date), media=COALESCE(NULLIF(?, ''), media), "
+            "content=?, status=?, attempts=attempts+1, last_error=?, updated_at=? WHERE doc_id=?",
+            (row.get("date"), row.get("media"), row.get("content"), status,
+             None if status == "done" else "본문 없음", time.time(), doc_id_of(row["link"])),
+        )
+        self._db.commit()
+
+    def mark_failed(self, link: str, error):
+        self._db.execute(
+            "UPDATE articles SET status='failed', attempts=attempts+1, last_error=?, updated_at=? WHERE doc_id=?",
+            (str(error)[:500], time.time(), doc_id_of(link)),
+        )
+        self._db.commit()
+
+    # ---------- 내보내기 ----------
+    def export(self, path: str, source: str = None) -> int:
+        """노트북과 같은 열(title, link, date, media, content)로 내보내기 — doc_id 순서로 스트리밍"""
+        q = "SELECT title, link, date, media, content FROM articles"
+        params = []
+        if source:
+            q += " WHERE source=?"
+            params.append(source)
+        q += " ORDER BY doc_id"
+        with RowSink(path, columns=COLUMNS, buffer_rows=1000) as sink:
+            for values in self._db.execute(q, params):
+                sink.write(dict(zip(COLUMNS, values)))
+        return sink.count
+
+# =========================
+# 수집 실행
+# =========================
+def _is_empty(v) -> bool:
+    return v is None or (isinstance(v, float) and v != v) or not str(v).strip()
+
+def fetch_status(store: ProQuestStore, status: str, source: str = None, cookies_path: str = DEFAULT_COOKIES,
+                 mode: str = "http", n_workers: int = DEFAULT_WORKERS, limit: int = 0, metrics_path: str = None):
+    """status(pending/failed)인 문서만 병렬 수집 → 완료되는 즉시 해당 행만 갱신 (metrics_path: 계측 저장 경로)"""
+    todo = store.items(status, source, limit)
+    print(f"🔄 수집할 문서 수: {len(todo)} ({status})")
+    n_ok = n_fail = 0
+    t_start = time.perf_counter()
+    live = LiveSummary(interval=60).start()
+    for kind, payload, extra in fetch_details(todo, load_cookies(cookies_path), mode=mode, n_workers=n_workers):
+        if kind == "row":
+            with METRICS.timer("store_write", "proquest"):
+                store.save(payload)
+            if payload.get("content"):
+                n_ok += 1
+                METRICS.incr("pages", site="proquest")
+            else:
+                n_fail += 1
+                METRICS.incr("failed", site="proquest")
+            if (n_ok + n_fail) % 50 == 0:
+                rate = (n_ok + n_fail) / (time.perf_counter() - t_start)
+                print(f"   ✅ {n_ok + n_fail}/{len(todo)}건 ({rate:.2f}건/s)")
+        elif kind == "expired":
+            print(f"🔐 {extra} → python proquest.py login 후 같은 명령으로 이어서 실행")
+            break
+        else:
+            n_fail += 1
+            if payload:
+                store.mark_failed(payload["link"], extra)
+            print(f"❌ 실패: {payload['link'] if payload else ''} → {extra}")
+    live.stop()
+    print(f"📄 완료: 성공 {n_ok}, 실패 {n_fail}")
+    if metrics_path:
+        json_path, prom_path = METRICS.export(metrics_path)
+        print(f"📊 계측 저장: {json_path}, {prom_path}")
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="ProQuest 상세 페이지 병렬 수집 (docview ID 기준 저장소)")
+    ap.add_argument("--db", default=DEFAULT_STORE_DB, help="저장소 경로 (SQLite)")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p_login = sub.add_parser("login", help="수동 로그인 후 쿠키 내보내기")
+    p_login.add_argument("--cookies", default=DEFAULT_COOKIES)
+
+    p_imp = sub.add_parser("import", help="노트북 CSV(링크 목록 또는 content 포함)를 저장소에 등록")
+    p_imp.add_argument("inputs", nargs="+")
+    p_imp.add_argument("--source", required=True, help="nyt / wsj")
+
+    for name, help_text in (("fetch-missing", "본문이 없는(pending) 문서만 수집"),
+                            ("refetch-failed", "실패한(failed) 문서만 다시 수집")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--source", default=None)
+        p.add_argument("--cookies", default=DEFAULT_COOKIES)
+        p.add_argument("--mode", choices=sorted(FETCHERS), default="http", help="http: requests 세션, browser: 헤드리스 크롬")
+        p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+        p.add_argument("--limit", type=int, default=0, help="최대 문서 수 (0=전체)")
+        p.add_argument("--metrics", default="proquest_metrics", help="계측 저장 경로 (확장자 없이: .json, .prom)")
+
+    p_exp = sub.add_parser("export", help="CSV/JSONL/Parquet으로 내보내기")
+    p_exp.add_argument("--source", default=None)
+    p_exp.add_argument("--output", required=True, help="예: nyt_content.csv")
+
+    sub.add_parser("stats", help="source별 상태 집계")
+    args = ap.parse_args()
+
+    if args.command == "login":
+        export_cookies(args.cookies)
+        return
+
+    with ProQuestStore(args.db) as store:
+        if args.command == "import":
+            import pandas as pd
+            for path in args.inputs:
+                df = pd.read_csv(path, encoding="utf-8-sig")
+                n_new, n_filled = store.import_rows(df.to_dict("records"), args.source)
+                print(f"📥 {path}: 새 문서 {n_new}건, 본문 채움 {n_filled}건")
+        elif args.command in ("fetch-missing", "refetch-failed"):
+            status = "pending" if args.command == "fetch-missing" else "failed"
+            fetch_status(store, status, args.source, args.cookies, mode=args.mode,
+                         n_workers=args.workers, limit=args.limit, metrics_path=args.metrics)
+        elif args.command == "export":
+            n = store.export(args.output, args.source)
+            print(f"📄 저장 완료: {args.output} ({n}건)")
+        for source, status, n in store.stats():
+            print(f"  {source:<6} {status:<8} {n}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+호스트별 요청 속도 제한 (토큰 버킷)
+
+- TokenBucket: 스레드용 (acquire()가 토큰이 생길 때까지 블로킹)
+- AsyncTokenBucket: asyncio용 (await acquire())
+- HostLimiter: 호스트 이름별로 버킷을 하나씩 만들어 공유
+
+rate=초당 요청 수, burst=한 번에 몰아 쓸 수 있는 최대 토큰 수
+"""
+
+import time, asyncio, threading
+from urllib.parse import urlparse
+
+# =========================
+# 토큰 버킷
+# =========================
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 1개 예약 후 기다려야 할 시간(초) 반환. 음수 토큰으로 대기열 순서를 보장."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1.0
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> float:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+class AsyncTokenBucket(TokenBucket):
+    async def acquire(self) -> float:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+class HostLimiter:
+    """
+    URL의 호스트마다 독립된 버킷. 같은 호스트는 rate를 넘지 않고, 다른 호스트끼리는 서로 막지 않는다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, bucket_cls=TokenBucket):
+        self.rate = rate
+        self.burst = burst
+        self.bucket_cls = bucket_cls
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = self.bucket_cls(self.rate, self.burst)
+            return self._buckets[host]
+
+    def set_rate(self, url: str, rate: float, burst: int = None):
+        """이 URL 호스트만 다른 속도로 (사이트별 예의 범위가 다를 때)"""
+        host = urlparse(url).netloc
+        with self._lock:
+            self._buckets[host] = self.bucket_cls(rate, self.burst if burst is None else burst)
+
+    def acquire(self, url: str):
+        return self.bucket(url).acquire()
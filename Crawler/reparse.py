@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 재파싱: 크롤 중 저장한 원본 HTML 아카이브에서 파싱 함수만 다시 돌려 CSV 재생성
+(셀렉터 수정·필드 추가 시 Selenium 재크롤 불필요)
+
+사용 예:
+python reparse.py iam IAM/iam_vol62to63_issue8.warc.gz --output IAM/iam_vol62to63_issue8.csv
+python reparse.py theverge ./theverge.warc.gz --output ./theverge.csv --workers 8
+"""
+
+import os, argparse, importlib
+from functools import partial
+from multiprocessing import Pool
+
+import pandas as pd
+
+from page_archive import PageArchive, read_record
+from site_profiles import PROFILES, row_from_page as profile_row_from_page
+
+# 저널은 site_profiles.PROFILES로 파싱, 그 밖의 사이트 → 크롤러 모듈 (row_from_page(html, meta) -> dict 제공)
+SITE_MODULES = {
+    "techcrunch": "TechCrunch",
+    "theverge": "TheVerge",
+}
+SITES = sorted(set(SITE_MODULES) | set(PROFILES))
+
+_worker = {}
+
+def _init_worker(site: str, archive_path: str):
+    if site in PROFILES:
+        _worker["row_from_page"] = partial(profile_row_from_page, site)
+    else:
+        _worker["row_from_page"] = importlib.import_module(SITE_MODULES[site]).row_from_page
+    _worker["path"] = archive_path
+
+def _parse_entry(entry: dict):
+    rec = read_record(_worker["path"], entry["offset"], entry["length"])
+    meta = dict(rec.get("meta") or {})
+    meta.setdefault("url", rec["url"])
+    try:
+        return _worker["row_from_page"](rec["html"], meta)
+    except Exception as e:
+        print(f"⚠️ 재파싱 실패: {rec['url']} -> {e}")
+        return None
+
+def reparse_archive(site: str, archive_path: str, workers: int = None, chunksize: int = 16) -> list:
+    """
+    아카이브 전체를 코어 수만큼 병렬 재파싱 → 행 목록(아카이브 기록 순서 유지)
+    """
+    entries = PageArchive(archive_path).entries()
+    if not entries:
+        return []
+    workers = workers or os.cpu_count() or 1
+    with Pool(workers, initializer=_init_worker, initargs=(site, archive_path)) as pool:
+        rows = pool.map(_parse_entry, entries, chunksize=chunksize)
+    return [r for r in rows if r]
+
+def main():
+    ap = argparse.ArgumentParser(description="원본 HTML 아카이브 재파싱")
+    ap.add_argument("site", choices=SITES, help="사이트 이름")
+    ap.add_argument("archive", help="*.warc.gz 아카이브 경로")
+    ap.add_argument("--output", required=True, help="출력 CSV 경로")
+    ap.add_argument("--workers", type=int, default=0, help="프로세스 수 (0=CPU 코어 수)")
+    args = ap.parse_args()
+
+    rows = reparse_archive(args.site, args.archive, workers=args.workers or None)
+    pd.DataFrame(rows).to_csv(args.output, index=False, encoding="utf-8-sig")
+    print(f"✅ 재파싱 완료: {len(rows)}건 → {args.output}")
+
+if __name__ == "__main__":
+    main()
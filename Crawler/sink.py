@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 출력 싱크: 새 행만 파일 끝에 덧붙이고, 체크포인트에서 flush + fsync
+
+- 형식은 확장자로 결정: .csv(utf-8-sig, 기존 출력과 동일) / .jsonl / .parquet(행 그룹 단위)
+- 메모리에는 buffer_rows개만 보관 → 실행 길이와 무관하게 메모리·체크포인트 I/O 일정
+
+- UrlIndex: 출력 파일별로 이미 쓴 URL 목록 (SQLite) → 이어쓰기 실행에서 파일 전체를 읽지 않고 중복 방지
+- compact_output: 중복 행 정리가 필요할 때만 파일 전체 재작성
+
+사용 예:
+with RowSink(OUTPUT_CSV, columns=COLUMNS) as sink:
+    sink.write(row)
+    if sink.count % 30 == 0:
+        sink.flush()
+"""
+
+import os, csv, json, time, sqlite3, threading
+
+from metrics import METRICS
+from crawl_state import DEFAULT_STATE_DB
+
+class RowSink:
+    def __init__(self, path: str, columns=None, append: bool = False, buffer_rows: int = 30):
+        """
+        columns: 열 순서 (None이면 첫 행의 키 순서, append 시 기존 CSV 헤더)
+        append: True면 기존 파일 뒤에 이어 쓰기, False면 새로 씀
+        """
+        self.path = path
+        self.columns = list(columns) if columns else None
+        self.append = append
+        self.buffer_rows = buffer_rows
+        self.fmt = os.path.splitext(path)[1].lstrip(".").lower() or "csv"
+        if self.fmt not in ("csv", "jsonl", "parquet"):
+            raise ValueError(f"지원하지 않는 출력 형식: {path}")
+        if self.fmt == "parquet" and append:
+            raise ValueError("parquet은 이어쓰기를 지원하지 않습니다 (CSV/JSONL 사용)")
+        self.count = 0  # 이번 실행에서 쓴 행 수
+        self._buf = []
+        self._fh = None
+        self._writer = None
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- 쓰기 ----------
+    def write(self, row: dict):
+        if self.columns is None:
+            self.columns = list(row.keys())
+        self._buf.append(row)
+        self.count += 1
+        if len(self._buf) >= self.buffer_rows:
+            self._drain()
+
+    def write_many(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def flush(self, fsync: bool = True):
+        """체크포인트: 버퍼를 파일로 내리고 디스크까지 동기화."""
+        self._drain()
+        if self._fh is not None and self.fmt != "parquet":
+            self._fh.flush()
+            if fsync:
+                os.fsync(self._fh.fileno())
+
+    def close(self):
+        self.flush()
+        if self.fmt == "parquet":
+            if self._writer is not None:
+                self._writer.close()
+        elif self._fh is not None:
+            self._fh.close()
+        self._fh = self._writer = None
+
+    # ---------- 내부 ----------
+    def _open(self):
+        existing = self.append and os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        if self.fmt == "csv":
+            if existing:
+                with open(self.path, encoding="utf-8-sig", newline="") as f:
+                    header = next(csv.reader(f), None)
+                if header:
+                    self.columns = header
+            self._fh = open(self.path, "a" if existing else "w", encoding="utf-8-sig", newline="")
+            self._writer = csv.DictWriter(self._fh, fieldnames=self.columns, extrasaction="ignore", restval="",
+                                          lineterminator="\n")
+            if not existing:
+                self._writer.writeheader()
+        elif self.fmt == "jsonl":
+            self._fh = open(self.path, "a" if existing else "w", encoding="utf-8")
+        # parquet은 첫 행 그룹에서 스키마를 정해 ParquetWriter를 연다
+
+    def _drain(self):
+        if not self._buf:
+            return
+        t0 = time.perf_counter()
+        if self._fh is None and self._writer is None:
+            self._open()
+        if self.fmt == "csv":
+            self._writer.writerows(self._buf)
+        elif self.fmt == "jsonl":
+            for row in self._buf:
+                self._fh.write(json.dumps({c: row.get(c) for c in self.columns}, ensure_ascii=False, default=str) + "\n")
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pylist([{c: row.get(c) for c in self.columns} for row in self._buf])
+            if self._writer is None:
+                # 첫 배치에서 전부 비어 있던 열은 문자열로 고정
+                schema = pa.schema([pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+                                    for f in table.schema])
+                self._writer = pq.ParquetWriter(self.path, schema)
+            self._writer.write_table(table.cast(self._writer.schema))
+        METRICS.observe("sink_write", (time.perf_counter() - t0) * 1000, os.path.basename(self.path))
+        self._buf = []
+
+# =========================
+# 출력 파일별 URL 인덱스
+# =========================
+def read_output(path: str, columns=None):
+    """RowSink 출력 파일 → DataFrame (확장자로 형식 판단)"""
+    import pandas as pd
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".jsonl":
+        df = pd.read_json(path, lines=True, dtype=False)
+        return df[list(columns)] if columns else df
+    if ext == ".parquet":
+        return pd.read_parquet(path, columns=list(columns) if columns else None)
+    return pd.read_csv(path, usecols=list(columns) if columns else None, dtype=str, encoding="utf-8-sig")
+
+class UrlIndex:
+    """
+    출력 파일 하나에 이미 쓴 URL (크롤 상태 저장소의 output_urls 테이블, 출력 파일 절대 경로별)
+    - 출력 파일이 없거나 비어 있으면 인덱스도 비움 (파일을 지웠으면 처음부터)
+    - 파일은 있는데 인덱스가 비어 있으면 파일의 key 열로 한 번 채움 (기존 출력에서 이어쓰기 시작)
+    - add()는 메모리에만 쌓고 commit()에서 기록 → sink.flush() 직후 commit()하면 파일에 내려간 행만 인덱스에 남음
+    """
+
+    def __init__(self, output_path: str, key: str = "url", db_path: str = DEFAULT_STATE_DB):
+        self.output = os.path.abspath(output_path)
+        self.key = key
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS output_urls (
+                output TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (output, url)
+            )
+        """)
+        self._db.commit()
+        if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+            self.rebuild([])
+        elif len(self) == 0:
+            self.rebuild(read_output(output_path, [key])[key].dropna())
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __contains__(self, url: str) -> bool:
+        if url in self._pending:
+            return True
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM output_urls WHERE output=? AND url=?",
+                                    (self.output, url)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM output_urls WHERE output=?", (self.output,)).fetchone()[0]
+
+    def add(self, url: str):
+        self._pending.add(url)
+
+    def commit(self):
+        if not self._pending:
+            return
+        with self._lock:
+            self._db.executemany("INSERT OR IGNORE INTO output_urls (output, url) VALUES (?, ?)",
+                                 [(self.output, u) for u in self._pending])
+            self._db.commit()
+        self._pending.clear()
+
+    def rebuild(self, urls):
+        """인덱스를 urls로 교체 (재파싱·compact로 파일을 새로 쓴 뒤)"""
+        self._pending.clear()
+        with self._lock:
+            self._db.execute("DELETE FROM output_urls WHERE output=?", (self.output,))
+            self._db.executemany("INSERT OR IGNORE INTO output_urls (output, url) VALUES (?, ?)",
+                                 [(self.output, u) for u in urls])
+            self._db.commit()
+
+def compact_output(path: str, key: str = "url", keep: str = "last") -> tuple:
+    """
+    출력 파일의 key 중복 행 제거 후 같은 형식으로 다시 씀 (임시 파일에 쓴 뒤 교체) → (이전 행 수, 이후 행 수)
+    평소 실행은 덧붙이기만 하므로 정리가 필요할 때만 호출.
+    """
+    df = read_output(path)
+    before = len(df)
+    df = df.drop_duplicates(subset=[key], keep=keep)
+    tmp = f"{path}.compact.tmp{os.path.splitext(path)[1]}"
+    with RowSink(tmp, columns=list(df.columns)) as sink:
+        sink.write_many(df.where(df.notna(), None).to_dict("records"))
+    os.replace(tmp, path)
+    return before, len(df)
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+저널 사이트 프로필 (선언형): 목차 URL 템플릿 · 논문 링크 셀렉터 · 필드 셀렉터 · 수집 단계(tier)
+
+- 크롤 엔진(crawl_engine.py)은 프로필만 보고 동작 → 사이트 추가는 PROFILES에 항목 하나
+- 필드 셀렉터 규칙 (FIELD_SPEC):
+    "css"                                   첫 요소의 텍스트
+    {"css": ..., "all": True}               모든 요소 텍스트를 ", "로 (중복 제거, 순서 유지)
+    {"css": ..., "attr": "content"}         속성 값
+    {"css": ..., "strip_prefix": "abstract"} 앞의 "Abstract" 같은 머리말 제거
+    {"after_heading": "abstract"}           h2/h3 제목에 단어가 있으면 그 뒤 첫 <p>
+    [spec, spec, ...]                       앞에서부터 처음 값이 나오는 것
+- 본문에서 못 찾은 필드는 citation 메타로 보충 (tiered_fetch.fill_from_meta)
+- tier: "http"(정적 HTML만) / "auto"(정적 HTML로 required가 안 차면 브라우저) / "browser"
+
+사용 예:
+from site_profiles import get_profile, article_links, row_from_page
+p = get_profile("jais")
+links = article_links(p, toc_html, vol=24, iss=1)
+row = row_from_page("jais", html, {"volume": 24, "issue": 1, "url": url})
+"""
+
+import re
+from urllib.parse import urljoin
+
+from html_parser import parse_html
+from tiered_fetch import fill_from_meta
+
+# =========================
+# 공통 조각
+# =========================
+_AISEL_FIELDS = {
+    "title": "#title a",
+    "abstract": ["#abstract p", {"after_heading": "abstract"}],
+    "keywords": {"css": "div.keywords li, div.keywords span, div.keywords a, section.keywords li, "
+                        "section.keywords span, section.keywords a, #keywords li, #keywords span, #keywords a",
+                 "all": True},
+}
+
+def _aisel(slug: str) -> dict:
+    return {
+        "toc_url": f"https://aisel.aisnet.org/{slug}/vol{{vol}}/iss{{iss}}/",
+        "toc_tier": "http",
+        "links": "a[href]",
+        "link_pattern": rf"/{slug}/vol{{vol}}/iss{{iss}}/\d+/?$",
+        "tier": "http",
+        "fields": _AISEL_FIELDS,
+        "columns": ["title", "abstract", "keywords", "url"],
+        "rate": 2.0,   # 예전 time.sleep(0.5)
+    }
+
+_SCIENCEDIRECT_FIELDS = {
+    "title": "span.title-text",
+    "authors": {"css": "div.author-group span.react-xocs-alternative-link", "all": True},
+    "abstract": [{"css": "div.abstract.author", "strip_prefix": "abstract"},
+                 {"css": "div[id^='sp']", "strip_prefix": "abstract"},
+                 {"css": "div.Abstracts div.abstract", "strip_prefix": "abstract"}],
+    "date": [{"css": "meta[name='citation_publication_date']", "attr": "content"},
+             "div.text-xs, dl.article-header-details"],
+    "keywords": [{"css": "div.keywords-section div.keyword > span", "all": True},
+                 {"css": "div.Keywords div.keyword", "all": True}],
+}
+
+def _sciencedirect(slug: str, issue_path: str = "issue/{iss}", default_issue=None) -> dict:
+    return {
+        "toc_url": f"https://www.sciencedirect.com/journal/{slug}/vol/{{vol}}/{issue_path}",
+        "toc_tier": "browser",
+        "toc_ready": ".text-l",
+        "links": "a.article-content-title",
+        "link_pattern": r"/science/article/pii/",
+        "tier": "auto",
+        "required": ("title", "abstract"),
+        "ready": "span.title-text",
+        "scroll": True,                # 하단 스크롤로 키워드 등 동적 섹션 로딩
+        "cookie_button": "#onetrust-accept-btn-handler",
+        "text": "strip",               # 예전 text(strip=True)와 같은 결과
+        "fields": _SCIENCEDIRECT_FIELDS,
+        "columns": ["volume", "issue", "title", "authors", "abstract", "date", "keywords", "url"],
+        "rate": 1 / 1.5,
+        "default_issue": default_issue,
+    }
+
+_TANDF_FIELDS = {
+    "title": ".hlFld-title",
+    "abstract": ".last",
+    "keywords": {"css": ".keyword-click", "all": True},
+}
+
+def _tandf(code: str) -> dict:
+    return {
+        "toc_url": f"https://www.tandfonline.com/toc/{code}/{{vol}}/{{iss}}?nav=tocList",
+        "toc_tier": "browser",
+        "toc_ready": "div.art_title.linkable > a",
+        "links": "div.art_title.linkable > a",
+        "tier": "auto",
+        "required": ("title", "abstract"),
+        "ready": ".hlFld-title",
+        "fields": _TANDF_FIELDS,
+        "columns": ["title", "abstract", "keywords", "url"],
+        "rate": 1 / 1.5,
+    }
+
+# =========================
+# 사이트 프로필
+# =========================
+PROFILES = {
+    "jais": _aisel("jais"),
+    "misq": _aisel("misq"),
+    "jit": _aisel("jit"),
+    "iam": _sciencedirect("information-and-management"),
+    "dss": _sciencedirect("decision-support-systems", issue_path="suppl/{iss}", default_issue="C"),  # 권 단위
+    "jsis": _sciencedirect("the-journal-of-strategic-information-systems"),
+    "isr": {
+        "toc_url": "https://pubsonline.informs.org/toc/isre/{vol}/{iss}",
+        "toc_tier": "browser",
+        "toc_ready": "h5.issue-item__title > a",
+        "links": "h5.issue-item__title > a",
+        "tier": "auto",
+        "required": ("title", "abstract"),
+        "ready": "h1.citation__title",
+        "cookie_button": "#hs-eu-confirmation-button",
+        "fields": {
+            "title": "h1.citation__title",
+            "authors": {"css": "a.entryAuthor", "all": True},
+            "date": "span.epub-section__date",
+            "abstract": "div.abstractSection.abstractInFull > p",
+            "keywords": {"css": "section.article__keyword ul.rlist li a", "all": True},
+        },
+        "columns": ["volume", "issue", "title", "authors", "date", "abstract", "keywords", "url"],
+        "rate": 1 / 1.5,
+    },
+    "jmis": _tandf("mmis20"),
+    "ejis": _tandf("tjis20"),
+}
+
+def get_profile(site: str) -> dict:
+    try:
+        return PROFILES[site]
+    except KeyError:
+        raise KeyError(f"프로필 없음: {site} (가능: {', '.join(sorted(PROFILES))})") from None
+
+# =========================
+# 목차
+# =========================
+def toc_url(profile: dict, vol, iss) -> str:
+    return profile["toc_url"].format(vol=vol, iss=iss)
+
+def article_links(profile: dict, html: str, vol, iss) -> list:
+    """목차 HTML → 논문 URL 목록 (절대 경로, 중복 제거, 목차 순서 유지)"""
+    base = toc_url(profile, vol, iss)
+    pattern = profile.get("link_pattern")
+    pat = re.compile(pattern.format(vol=vol, iss=iss)) if pattern else None
+    seen, out = set(), []
+    for a in parse_html(html).select(profile["links"]):
+        href = a.get("href")
+        if not href:
+            continue
+        full = urljoin(base, href)
+        if (pat is None or pat.search(full)) and full not in seen:
+            seen.add(full)
+            out.append(full)
+    return out
+
+# =========================
+# 필드 추출
+# =========================
+def _clean(s: str) -> str:
+    return re.sub(r"\s+", " ", s or "").strip()
+
+def _text(el, mode: str) -> str:
+    return el.text(strip=True) if mode == "strip" else _clean(el.text(" "))
+
+def _extract(doc, spec, mode: str) -> str:
+    if isinstance(spec, list):
+        for alt in spec:
+            value = _extract(doc, alt, mode)
+            if value:
+                return value
+        return ""
+    if isinstance(spec, str):
+        spec = {"css": spec}
+
+    if "after_heading" in spec:
+        word = spec["after_heading"].lower()
+        for h in doc.select("h2, h3"):
+            if word in h.text(strip=True).lower():
+                p = h.find_next("p")
+                return _text(p, mode) if p else ""
+        return ""
+
+    if spec.get("all"):
+        seen, items = set(), []
+        for el in doc.select(spec["css"]):
+            v = _text(el, mode)
+            if v and v not in seen:
+                seen.add(v)
+                items.append(v)
+        return ", ".join(items)
+
+    el = doc.select_one(spec["css"])
+    if el is None:
+        return ""
+    value = _clean(el.get(spec["attr"]) or "") if "attr" in spec else _text(el, mode)
+    prefix = spec.get("strip_prefix")
+    if prefix and value.lower().startswith(prefix):
+        value = value[len(prefix):].strip()
+    return value
+
+def extract_field(profile: dict, html, name: str) -> str:
+    """필드 하나만 추출 (html: 문자열 또는 parse_html() 결과)"""
+    return _extract(parse_html(html), profile["fields"][name], profile.get("text", "clean"))
+
+def extract_fields(profile: dict, html) -> dict:
+    """프로필 필드 셀렉터로 {필드: 텍스트} (없으면 "")"""
+    doc = parse_html(html)
+    mode = profile.get("text", "clean")
+    return {name: _extract(doc, spec, mode) for name, spec in profile["fields"].items()}
+
+def missing_fields(profile: dict, fields: dict) -> list:
+    return [f for f in profile.get("required", ()) if not fields.get(f)]
+
+def row_from_page(site: str, html: str, meta: dict) -> dict:
+    """원본 HTML + 페이지 밖 정보(volume/issue/url) → 출력 행 (본문에서 못 찾은 필드는 citation 메타로 보충)"""
+    profile = get_profile(site)
+    fields = extract_fields(profile, html)
+    row = {c: meta.get(c) if c in ("volume", "issue", "url") else fields.get(c, "") for c in profile["columns"]}
+    return fill_from_meta(row, html)
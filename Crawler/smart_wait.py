@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Selenium 적응형 대기 (고정 time.sleep / random_wait 대체)
+
+- 대상 셀렉터가 DOM에 나타나고 네트워크가 잠잠해지면(리소스 요청 수 변화 없음) 바로 진행
+- 사이트·단계(label)별 준비 시간을 SQLite에 기록 → 백분위수(p95)로 타임아웃 자동 설정
+- 예의상 요청 간격은 따로 관리: 같은 엔진의 페이지 이동 사이 최소 min_interval초 (+ 약간의 지터)
+- 호출마다 "예전 고정 대기(baseline)" 대비 절약한 시간을 기록 → 실행(run)별 합계 보고
+
+사용 예:
+waiter = WaitEngine("iam", min_interval=1.0)
+waiter.get(driver, toc_url, ".text-l", label="toc", baseline=3.0)              # 예전: driver.get + random_wait(2, 4)
+waiter.wait_for(driver, "span.title-text", label="article", baseline=1.7)     # 예전: WebDriverWait + random_wait(1.2, 2.2)
+waiter.summary()
+
+python smart_wait.py report [--site iam]
+"""
+
+import os, time, random, sqlite3, argparse, threading
+
+from crawl_state import DEFAULT_STATE_DB
+from metrics import METRICS
+
+# =========================
+# 설정
+# =========================
+RUN_ID = os.environ.setdefault("CRAWLER_RUN_ID", time.strftime("%Y%m%d-%H%M%S"))  # 하위 프로세스와 공유 (환경 변수)
+DEFAULT_TIMEOUT = 25.0    # 학습 전 타임아웃(초)
+MIN_TIMEOUT = 5.0
+MAX_TIMEOUT = 60.0
+TIMEOUT_FACTOR = 2.0      # 타임아웃 = p95 × 2 (MIN~MAX 범위)
+MIN_SAMPLES = 20          # 이만큼 쌓여야 학습값 사용
+HISTORY = 500             # 백분위수 계산에 쓰는 최근 표본 수
+POLL = 0.1
+IDLE_MS = 400             # 리소스 요청 수가 이 시간 동안 그대로면 네트워크 유휴
+IDLE_TIMEOUT = 3.0        # 유휴를 기다리는 최대 시간 (광고·추적 스크립트가 계속 요청하는 페이지 대비)
+CSS = "css selector"      # selenium By.CSS_SELECTOR 값
+
+# document.readyState와 지금까지의 리소스 요청 수
+_NETWORK_JS = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+class WaitTimeout(TimeoutError):
+    """셀렉터가 학습된 타임아웃 안에 나타나지 않음 (selenium TimeoutException처럼 처리)"""
+
+# =========================
+# 대기 엔진
+# =========================
+class WaitEngine:
+    def __init__(self, site: str, min_interval: float = 1.0, jitter: float = 0.3,
+                 db_path: str = DEFAULT_STATE_DB, default_timeout: float = DEFAULT_TIMEOUT):
+        """
+        min_interval: 페이지 이동 사이 최소 간격(초) — 준비 신호와 무관한 예의상 간격
+        jitter: 간격에 더하는 0~jitter초 무작위 값
+        """
+        self.site = site
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.default_timeout = default_timeout
+        self._last_nav = 0.0
+        self._pending = 0.0   # polite()로 쉰 시간 — 다음 기록에 합산
+        self._timeouts = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS wait_samples (
+                run_id TEXT NOT NULL,
+                site TEXT NOT NULL,
+                label TEXT NOT NULL,
+                ready_ms REAL NOT NULL,
+                waited_ms REAL NOT NULL,
+                saved_ms REAL NOT NULL,
+                ts REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_wait_site_label ON wait_samples(site, label)")
+        self._db.commit()
+        self.calls = 0
+        self.waited_s = 0.0
+        self.saved_s = 0.0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # ---------- 학습 ----------
+    def percentile(self, label: str, q: float = 95) -> float:
+        """최근 HISTORY개 준비 시간(ms)의 q 백분위수 (표본 부족 시 None)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT ready_ms FROM wait_samples WHERE site=? AND label=? ORDER BY ts DESC LIMIT ?",
+                (self.site, label, HISTORY)).fetchall()
+        if len(rows) < MIN_SAMPLES:
+            return None
+        values = sorted(r[0] for r in rows)
+        return values[min(len(values) - 1, int(len(values) * q / 100))]
+
+    def timeout_for(self, label: str) -> float:
+        if label not in self._timeouts:
+            p95 = self.percentile(label)
+            if p95 is None:
+                self._timeouts[label] = self.default_timeout
+            else:
+                self._timeouts[label] = min(MAX_TIMEOUT, max(MIN_TIMEOUT, p95 / 1000 * TIMEOUT_FACTOR))
+        return self._timeouts[label]
+
+    def _record(self, label: str, ready_s: float, waited_s: float, baseline: float):
+        waited_s += self._pending
+        self._pending = 0.0
+        saved = baseline - waited_s
+        self.calls += 1
+        self.waited_s += waited_s
+        self.saved_s += saved
+        METRICS.observe("wait", (ready_s + waited_s) * 1000, self.site)
+        with self._lock:
+            self._db.execute("INSERT INTO wait_samples VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             (RUN_ID, self.site, label, ready_s * 1000, waited_s * 1000, saved * 1000, time.time()))
+            self._db.commit()
+
+    # ---------- 대기 ----------
+    def polite(self):
+        """직전 페이지 이동 후 min_interval(+지터)이 안 지났으면 남은 만큼만 쉼. 쉰 시간(초) 반환."""
+        gap = self.min_interval + random.uniform(0, self.jitter)
+        delay = self._last_nav + gap - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+            self._pending += delay
+        self._last_nav = time.monotonic()
+        return max(delay, 0.0)
+
+    def network_idle(self, driver, idle_ms: int = IDLE_MS, timeout: float = IDLE_TIMEOUT) -> float:
+        """readyState가 complete이고 리소스 요청 수가 idle_ms 동안 그대로일 때까지 (최대 timeout초)"""
+        t0 = time.monotonic()
+        last_count, stable_since = -1, t0
+        while time.monotonic() - t0 < timeout:
+            try:
+                state, count = driver.execute_script(_NETWORK_JS)
+            except Exception:
+                break
+            now = time.monotonic()
+            if count != last_count or state != "complete":
+                last_count, stable_since = count, now
+            elif (now - stable_since) * 1000 >= idle_ms:
+                break
+            time.sleep(POLL)
+        return time.monotonic() - t0
+
+    def wait_for(self, driver, css: str, label: str = None, baseline: float = 0.0, all_elements: bool = False,
+                 idle: bool = True, timeout: float = None):
+        """
+        css가 나타날 때까지 폴링 후 (idle이면) 네트워크 유휴까지 대기 → 찾은 요소(all_elements면 목록) 반환.
+        baseline: 이 호출이 대체한 예전 고정 대기(초) — 절약 시간 계산용
+        """
+        label = label or css
+        timeout = timeout or self.timeout_for(label)
+        t0 = time.monotonic()
+        while True:
+            found = driver.find_elements(CSS, css)
+            if found:
+                break
+            if time.monotonic() - t0 > timeout:
+                raise WaitTimeout(f"{self.site}: '{css}' {timeout:.1f}s 안에 나타나지 않음")
+            time.sleep(POLL)
+        ready = time.monotonic() - t0
+        settle = self.network_idle(driver) if idle else 0.0
+        # 예전 방식: 셀렉터 대기(ready) + 고정 대기(baseline) → 절약 = baseline - 추가 대기(settle + 요청 간격)
+        self._record(label, ready, settle, baseline)
+        return found if all_elements else found[0]
+
+    def settle(self, driver, label: str = "settle", baseline: float = 0.0) -> float:
+        """스크롤·클릭 뒤 동적 섹션 로딩 대기 (예전 random_wait 자리)"""
+        waited = self.network_idle(driver)
+        self._record(label, 0.0, waited, baseline)  # 셀렉터 대기 없음 → 대기 시간은 waited 한 번만 기록
+        return waited
+
+    def get(self, driver, url: str, css: str = None, label: str = None, baseline: float = 0.0, **kw):
+        """예의상 간격을 지킨 뒤 이동하고, css가 있으면 준비될 때까지 대기"""
+        self.polite()
+        driver.get(url)
+        if css is None:
+            self._record(label or "get", 0.0, 0.0, baseline)
+            return None
+        return self.wait_for(driver, css, label=label, baseline=baseline, **kw)
+
+    # ---------- 보고 ----------
+    def summary(self):
+        """이 엔진(사이트 하나)의 누적 — 실행 전체 합계는 run_report(run_id=RUN_ID)"""
+        if self.calls:
+            print(f"⏱️ [{self.site}] 대기 {self.calls}회: 추가 대기 {self.waited_s:.1f}s, "
+                  f"고정 대기 대비 절약 {self.saved_s:.1f}s")
+
+def run_report(db_path: str = DEFAULT_STATE_DB, site: str = None, last: int = 10, run_id: str = None) -> list:
+    """실행(run)별 절약 시간 합계 [(run_id, site, 호출 수, 추가 대기 s, 절약 s)] — 같은 RUN_ID의 모든 사이트·프로세스 기록 합산"""
+    where, params = [], []
+    if site:
+        where.append("site=?")
+        params.append(site)
+    if run_id:
+        where.append("run_id=?")
+        params.append(run_id)
+    db = sqlite3.connect(db_path)
+    try:
+        q = ("SELECT run_id, site, COUNT(*), SUM(waited_ms) / 1000.0, SUM(saved_ms) / 1000.0 FROM wait_samples"
+             + (" WHERE " + " AND ".join(where) if where else "")
+             + " GROUP BY run_id, site ORDER BY MAX(ts) DESC LIMIT ?")
+        return db.execute(q, params + [last]).fetchall()
+    except sqlite3.OperationalError:
+        return []
+    finally:
+        db.close()
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="적응형 대기 통계")
+    ap.add_argument("command", choices=["report", "timeouts"])
+    ap.add_argument("--site", default=None)
+    ap.add_argument("--last", type=int, default=10, help="최근 실행 수")
+    ap.add_argument("--db", default=DEFAULT_STATE_DB)
+    args = ap.parse_args()
+
+    if args.command == "report":
+        rows = run_report(args.db, args.site, args.last)
+        if not rows:
+            print("기록 없음")
+        for run_id, site, n, waited, saved in rows:
+            print(f"{run_id}  {site:<10} 대기 {n:>5}회  추가 대기 {waited:>8.1f}s  절약 {saved:>8.1f}s")
+        return
+
+    db = sqlite3.connect(args.db)
+    q = "SELECT DISTINCT site, label FROM wait_samples" + (" WHERE site=?" if args.site else "")
+    pairs = db.execute(q, [args.site] if args.site else []).fetchall()
+    db.close()
+    for site, label in pairs:
+        w = WaitEngine(site, db_path=args.db)
+        p50, p95 = w.percentile(label, 50), w.percentile(label, 95)
+        fmt = lambda v: "-" if v is None else f"{v:.0f}ms"
+        print(f"{site:<10} {label:<12} p50 {fmt(p50):>8}  p95 {fmt(p95):>8}  타임아웃 {w.timeout_for(label):.1f}s")
+        w.close()
+
+if __name__ == "__main__":
+    main()
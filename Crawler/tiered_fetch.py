@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+계층형 수집 보조: citation 메타 파서 + 단계 기록 (단계 선택 자체는 crawl_engine.CrawlEngine.fetch_article)
+
+- <meta name="citation_*">(Highwire/Dublin Core)에서 제목·저자·날짜·초록·키워드 추출
+- 정적 HTML로 필수 필드가 다 차면 "http", 비어서 브라우저로 넘어가면 "browser"
+- URL마다 어느 단계로 끝났는지, 무엇이 비었는지 상태 저장소에 기록 → 사이트별 적중률 확인
+
+사용 예:
+row = fill_from_meta(parse_row(html), html)    # 본문에서 못 찾은 필드를 메타로 보충
+log = TierLog(); log.record(url, "iam", "browser", missing=["abstract"])
+
+python tiered_fetch.py stats [--site iam]
+"""
+
+import time, sqlite3, argparse, threading
+
+from html_parser import parse_html
+from crawl_state import DEFAULT_STATE_DB
+
+# =========================
+# 설정
+# =========================
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# 출력 열 → 메타 이름 (앞에서부터 처음 값이 있는 것)
+META_FIELDS = {
+    "title": ("citation_title", "dc.title"),
+    "authors": ("citation_author", "dc.creator"),
+    "date": ("citation_publication_date", "citation_online_date", "citation_date", "dc.date"),
+    "abstract": ("citation_abstract", "dc.description", "description"),
+    "keywords": ("citation_keywords", "keywords", "dc.subject"),
+    "volume": ("citation_volume",),
+    "issue": ("citation_issue",),
+    "doi": ("citation_doi", "dc.identifier"),
+}
+_MULTI = {"authors", "keywords"}  # 여러 태그를 ", "로 이어 붙이는 필드
+
+# =========================
+# 메타 파서
+# =========================
+def parse_citation_meta(html: str) -> dict:
+    """<meta name="citation_*"> 등 → {title, authors, date, abstract, keywords, volume, issue, doi} (없으면 "")"""
+    doc = parse_html(html)
+    values = {}
+    for m in doc.select("meta[name]"):
+        name = (m.get("name") or "").strip().lower()
+        content = (m.get("content") or "").strip()
+        if content:
+            values.setdefault(name, []).append(content)
+
+    out = {}
+    for field, names in META_FIELDS.items():
+        out[field] = ""
+        for name in names:
+            if name in values:
+                vals = values[name]
+                if field == "keywords" and len(vals) == 1:
+                    vals = [k.strip() for k in vals[0].replace(";", ",").split(",") if k.strip()]
+                out[field] = ", ".join(vals) if field in _MULTI else vals[0]
+                break
+    return out
+
+def fill_from_meta(row: dict, html: str) -> dict:
+    """row에서 비어 있는 필드만 메타 값으로 채움 (페이지 본문에서 찾은 값이 우선)"""
+    if not html or all(row.get(k) for k in row if k in META_FIELDS):
+        return row
+    meta = parse_citation_meta(html)
+    for k, v in row.items():
+        if k in META_FIELDS and not v and meta.get(k):
+            row[k] = meta[k]
+    return row
+
+# =========================
+# 단계 기록
+# =========================
+class TierLog:
+    """URL별로 어느 단계(http/browser)에서 끝났는지, 브라우저로 넘어간 이유(비어 있던 필드) 기록"""
+
+    def __init__(self, db_path: str = DEFAULT_STATE_DB):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS fetch_tiers (
+                url TEXT PRIMARY KEY,
+                site TEXT NOT NULL,
+                tier TEXT NOT NULL,
+                missing TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_tiers_site ON fetch_tiers(site, tier)")
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def record(self, url: str, site: str, tier: str, missing=()):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO fetch_tiers (url, site, tier, missing, updated_at) VALUES (?, ?, ?, ?, ?)",
+                             (url, site, tier, ",".join(missing), time.time()))
+            self._db.commit()
+
+def tier_stats(db_path: str = DEFAULT_STATE_DB, site: str = None) -> list:
+    """[(site, http 건수, browser 건수, http 비율)]"""
+    db = sqlite3.connect(db_path)
+    try:
+        q = ("SELECT site, SUM(tier='http'), SUM(tier='browser'), AVG(tier='http') FROM fetch_tiers"
+             + (" WHERE site=?" if site else "") + " GROUP BY site ORDER BY site")
+        return db.execute(q, [site] if site else []).fetchall()
+    except sqlite3.OperationalError:
+        return []
+    finally:
+        db.close()
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="계층형 페처 적중률")
+    ap.add_argument("command", choices=["stats", "missing"])
+    ap.add_argument("--site", default=None)
+    ap.add_argument("--db", default=DEFAULT_STATE_DB)
+    args = ap.parse_args()
+
+    if args.command == "stats":
+        rows = tier_stats(args.db, args.site)
+        if not rows:
+            print("기록 없음")
+        for site, n_http, n_browser, rate in rows:
+            print(f"{site:<10} 정적 HTML {n_http:>6}  브라우저 {n_browser:>6}  적중률 {rate:.1%}")
+        return
+
+    # 브라우저로 넘어간 이유(비어 있던 필드) 집계
+    db = sqlite3.connect(args.db)
+    q = ("SELECT site, missing, COUNT(*) FROM fetch_tiers WHERE tier='browser'"
+         + (" AND site=?" if args.site else "") + " GROUP BY site, missing ORDER BY COUNT(*) DESC")
+    for site, missing, n in db.execute(q, [args.site] if args.site else []):
+        print(f"{site:<10} {n:>6}건  비어 있음: {missing or '-'}")
+    db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 동시출현 벤치마크: 합성 코퍼스(기본 100만 문서)로 희소 행렬 방식과 문서별 쌍 루프 비교
+
+- 키워드 빈도는 Zipf 분포(실제 저널 키워드처럼 소수 키워드가 대부분을 차지)
+- 쌍 루프는 sample개 문서로만 재고 전체 문서 수로 환산 (100만 건 전체는 너무 느림)
+- 증분: 코퍼스 90%로 만든 그래프에 나머지 10%를 update()로 더하는 시간
+
+사용 예:
+python bench_cooccurrence.py
+python bench_cooccurrence.py --docs 200000 --vocab 20000
+"""
+
+import time, argparse, itertools
+from collections import Counter
+
+import numpy as np
+
+from keywords import KeywordIndex
+from cooccurrence import CooccurrenceGraph
+
+def synthetic_corpus(n_docs: int, vocab: int, seed: int = 0):
+    """(keywords 문자열 목록, 연도, source) — 문서당 키워드 3~8개"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"keyword {i}" for i in range(vocab)], dtype=object)
+    lengths = rng.integers(3, 9, n_docs)
+    picks = np.minimum(rng.zipf(1.3, lengths.sum()) - 1, vocab - 1)
+    bounds = np.concatenate([[0], np.cumsum(lengths)])
+    docs = [", ".join(names[picks[a:b]]) for a, b in zip(bounds[:-1], bounds[1:])]
+    years = rng.integers(2015, 2026, n_docs)
+    sources = rng.choice(np.array(["jmis", "isr", "misq", "techcrunch", "theverge"], dtype=object), n_docs)
+    return docs, years, sources
+
+def pairwise_loop(docs) -> Counter:
+    """비교 기준: 노트북식 행 단위 루프 (문자열 분리 → 정규화 → 쌍 카운트)"""
+    cnt = Counter()
+    for kw in docs:
+        words = sorted({k.strip().lower().replace(" ", "") for k in kw.split(",") if k.strip()})
+        cnt.update(itertools.combinations(words, 2))
+    return cnt
+
+def main():
+    ap = argparse.ArgumentParser(description="키워드 동시출현 벤치마크")
+    ap.add_argument("--docs", type=int, default=1_000_000)
+    ap.add_argument("--vocab", type=int, default=50_000)
+    ap.add_argument("--sample", type=int, default=50_000, help="쌍 루프 측정 문서 수")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    docs, years, sources = synthetic_corpus(args.docs, args.vocab)
+    print(f"합성 코퍼스 {args.docs:,}개 문서 생성 {time.perf_counter() - t0:.1f}s")
+
+    t0 = time.perf_counter()
+    idx = KeywordIndex().add(docs, years=years, sources=sources)
+    t_index = time.perf_counter() - t0
+    print(f"KeywordIndex 구축 {t_index:.2f}s (키워드 인스턴스 {len(idx.codes):,}개, 고유 {idx.n_keywords:,}개)")
+
+    t0 = time.perf_counter()
+    g = CooccurrenceGraph().update(idx)
+    t_sparse = time.perf_counter() - t0
+    C, _ = g.matrix()
+    print(f"희소 XᵀX (source×year {len(g.parts)}개 파티션) {t_sparse:.2f}s, 엣지 {C.nnz:,}개")
+
+    t0 = time.perf_counter()
+    edges = g.edges(idx.vocab, sources=["jmis", "isr", "misq"], years=range(2020, 2026), min_count=5)
+    print(f"엣지 리스트(저널, 2020~2025, min_count=5) {time.perf_counter() - t0:.2f}s → {len(edges):,}개")
+
+    # 증분: 90% 그래프 + 10% 추가
+    cut = int(args.docs * 0.9)
+    base = KeywordIndex().add(docs[:cut], years=years[:cut], sources=sources[:cut])
+    g2 = CooccurrenceGraph().update(base)
+    t0 = time.perf_counter()
+    base.add(docs[cut:], years=years[cut:], sources=sources[cut:])
+    g2.update(base)
+    t_inc = time.perf_counter() - t0
+    same = (g2.matrix()[0] != C).nnz == 0 if base.vocab == idx.vocab else None
+    print(f"증분 update (새 문서 {args.docs - cut:,}개, 인덱스 추가 포함) {t_inc:.2f}s, 전체 재계산과 동일: {same}")
+
+    n = min(args.sample, args.docs)
+    t0 = time.perf_counter()
+    cnt = pairwise_loop(docs[:n])
+    t_loop = time.perf_counter() - t0
+    est = t_loop * args.docs / n
+    print(f"쌍 루프 {n:,}개 문서 {t_loop:.2f}s → {args.docs:,}개 환산 약 {est:.0f}s "
+          f"(희소 대비 {est / t_sparse:.0f}배)")
+
+    # 표본 결과 검증
+    sub = CooccurrenceGraph()
+    sub.add_matrix(idx.doc_term_matrix()[:n], ("all", 0))
+    M = sub.parts[("all", 0)].tocoo()
+    vocab = idx.vocab
+    ok = len(cnt) == M.nnz and all(cnt[tuple(sorted((vocab[r], vocab[c])))] == v
+                                   for r, c, v in zip(M.row[:1000], M.col[:1000], M.data[:1000]))
+    print(f"표본 {n:,}개 문서 결과 일치: {ok}")
+
+if __name__ == "__main__":
+    main()
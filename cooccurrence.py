@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 동시출현(co-occurrence) 희소 그래프 (학계 vs 업계 주제 비교용)
+
+- keywords.KeywordIndex의 문서 × 키워드 0/1 행렬 X로 C = XᵀX 계산 (문서별 쌍 루프 없음)
+- (source, year) 파티션별로 상삼각 희소 행렬을 따로 누적 → 저널/뉴스, 연도별로 골라 합산
+- 증분: 인덱스에 새로 추가된 문서만 계산해 더함 (기존 결과 재계산 없음)
+- 가지치기한 엣지 리스트(min_count, 상위 N개)로 내보내기 → Gephi/networkx
+
+사용 예:
+from keywords import KeywordIndex
+from cooccurrence import CooccurrenceGraph
+idx = KeywordIndex.from_store("corpus")
+g = CooccurrenceGraph().update(idx)
+g.edges(idx.vocab, sources=["jmis", "isr", "misq"], years=range(2020, 2026), min_count=3)
+
+python cooccurrence.py --store corpus --category industry --min-count 5 --out industry_edges.csv
+"""
+
+import json, argparse
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+class CooccurrenceGraph:
+    def __init__(self):
+        self.parts = {}           # (source, year) → 상삼각 CSR (키워드 쌍 공동 문서 수)
+        self.node_counts = {}     # (source, year) → 키워드별 문서 수
+        self.n_keywords = 0
+        self.n_seen = 0           # 지금까지 반영한 인덱스 문서 수
+
+    # ---------- 누적 ----------
+    def _resize(self, n: int):
+        if n <= self.n_keywords:
+            return
+        for k, m in self.parts.items():
+            m = m.tocsr()
+            m.resize((n, n))
+            self.parts[k] = m
+        for k, c in self.node_counts.items():
+            self.node_counts[k] = np.concatenate([c, np.zeros(n - len(c), dtype=c.dtype)])
+        self.n_keywords = n
+
+    def add_matrix(self, X: sp.csr_matrix, key):
+        """문서 × 키워드 0/1 행렬 한 묶음을 파티션 key에 더함"""
+        X = X.tocsr().astype(np.int32)
+        self._resize(X.shape[1])
+        if X.shape[1] < self.n_keywords:
+            X.resize((X.shape[0], self.n_keywords))
+        C = sp.triu(X.T @ X, k=1, format="csr")
+        counts = np.asarray(X.sum(axis=0)).ravel().astype(np.int64)
+        if key in self.parts:
+            self.parts[key] = self.parts[key] + C
+            self.node_counts[key] = self.node_counts[key] + counts
+        else:
+            self.parts[key] = C
+            self.node_counts[key] = counts
+
+    def update(self, index, batch_docs: int = 200_000):
+        """
+        KeywordIndex에서 아직 반영하지 않은 문서(n_seen 이후)만 파티션별로 더함.
+        batch_docs: 한 번에 곱할 문서 수 (중간 행렬 메모리 상한)
+        """
+        self._resize(index.n_keywords)
+        X_all = index.doc_term_matrix()
+        for start in range(self.n_seen, index.n_docs, batch_docs):
+            stop = min(start + batch_docs, index.n_docs)
+            X = X_all[start:stop]
+            # (source, year) 그룹을 한 번에 인코딩해 행 번호를 그룹별로 모음
+            src_codes, src_names = pd.factorize(pd.Series(index.sources[start:stop]).fillna(""))
+            years = index.years[start:stop].astype(np.int64)
+            group = src_codes.astype(np.int64) * 100_000 + (years + 50_000)
+            order = np.argsort(group, kind="stable")
+            uniq, first = np.unique(group[order], return_index=True)
+            for g, rows in zip(uniq, np.split(order, first[1:])):
+                key = (str(src_names[g // 100_000]), int(g % 100_000 - 50_000))
+                self.add_matrix(X[rows], key)
+        self.n_seen = index.n_docs
+        return self
+
+    # ---------- 조회 ----------
+    def keys(self, sources=None, years=None) -> list:
+        srcs = None if sources is None else ({sources} if isinstance(sources, str) else set(sources))
+        yrs = None if years is None else {int(y) for y in years}
+        return [k for k in self.parts if (srcs is None or k[0] in srcs) and (yrs is None or k[1] in yrs)]
+
+    def matrix(self, sources=None, years=None):
+        """선택한 파티션 합계 → (상삼각 CSR, 키워드별 문서 수)"""
+        keys = self.keys(sources, years)
+        C = sp.csr_matrix((self.n_keywords, self.n_keywords), dtype=np.int64)
+        counts = np.zeros(self.n_keywords, dtype=np.int64)
+        for k in keys:
+            C = C + self.parts[k]
+            counts += self.node_counts[k]
+        return C, counts
+
+    def edges(self, vocab, sources=None, years=None, min_count: int = 2, top: int = None) -> pd.DataFrame:
+        """
+        엣지 리스트: source, target, weight(공동 문서 수), jaccard
+        min_count 미만은 버리고, top을 주면 weight 상위 top개만.
+        """
+        C, counts = self.matrix(sources, years)
+        C = C.tocoo()
+        keep = C.data >= min_count
+        r, c, w = C.row[keep], C.col[keep], C.data[keep]
+        if top and len(w) > top:
+            sel = np.argpartition(-w, top - 1)[:top]
+            r, c, w = r[sel], c[sel], w[sel]
+        order = np.lexsort((c, r, -w))
+        r, c, w = r[order], c[order], w[order]
+        vocab = np.asarray(vocab, dtype=object)
+        return pd.DataFrame({
+            "source": vocab[r],
+            "target": vocab[c],
+            "weight": w,
+            "jaccard": w / (counts[r] + counts[c] - w),
+        })
+
+    # ---------- 저장 ----------
+    def save(self, path: str):
+        arrays = {}
+        keys = list(self.parts)
+        for i, k in enumerate(keys):
+            m = self.parts[k].tocsr()
+            arrays[f"p{i}_data"], arrays[f"p{i}_indices"], arrays[f"p{i}_indptr"] = m.data, m.indices, m.indptr
+            arrays[f"p{i}_counts"] = self.node_counts[k]
+        meta = {"keys": keys, "n_keywords": self.n_keywords, "n_seen": self.n_seen}
+        np.savez_compressed(path, meta=np.asarray(json.dumps(meta, ensure_ascii=False)), **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "CooccurrenceGraph":
+        z = np.load(path, allow_pickle=False)
+        meta = json.loads(str(z["meta"]))
+        g = cls()
+        g.n_keywords, g.n_seen = meta["n_keywords"], meta["n_seen"]
+        n = g.n_keywords
+        for i, (src, year) in enumerate(meta["keys"]):
+            g.parts[(src, year)] = sp.csr_matrix(
+                (z[f"p{i}_data"], z[f"p{i}_indices"], z[f"p{i}_indptr"]), shape=(n, n))
+            g.node_counts[(src, year)] = z[f"p{i}_counts"]
+        return g
+
+# =========================
+# CLI
+# =========================
+def main():
+    from keywords import KeywordIndex
+
+    ap = argparse.ArgumentParser(description="키워드 동시출현 엣지 리스트 내보내기")
+    ap.add_argument("--store", default=None, help="corpus_store Parquet 디렉터리")
+    ap.add_argument("--index", default=None, help="저장된 KeywordIndex(.npz) 사용")
+    ap.add_argument("--category", default=None, help="journal / industry")
+    ap.add_argument("--sources", nargs="*", default=None, help="엣지에 포함할 source")
+    ap.add_argument("--years", nargs="*", type=int, default=None, help="엣지에 포함할 연도")
+    ap.add_argument("--min-count", type=int, default=2)
+    ap.add_argument("--top", type=int, default=None)
+    ap.add_argument("--graph", default=None,
+                    help="그래프 누적 파일(.npz): 있으면 이어서 새 문서만 반영 (--index와 함께, 인덱스는 add()로만 늘어나야 함)")
+    ap.add_argument("--out", default="cooccurrence_edges.csv")
+    args = ap.parse_args()
+
+    if args.graph and not args.index:
+        ap.error("--graph는 --index와 함께 사용 (문서 순서가 고정된 인덱스 필요)")
+    idx = KeywordIndex.load(args.index) if args.index else KeywordIndex.from_store(args.store, category=args.category)
+    try:
+        g = CooccurrenceGraph.load(args.graph) if args.graph else CooccurrenceGraph()
+    except FileNotFoundError:
+        g = CooccurrenceGraph()
+    before = g.n_seen
+    g.update(idx)
+    print(f"문서 {idx.n_docs}개 (새로 반영 {idx.n_docs - before}개), 키워드 {idx.n_keywords}개")
+    if args.graph:
+        g.save(args.graph)
+
+    edges = g.edges(idx.vocab, sources=args.sources, years=args.years, min_count=args.min_count, top=args.top)
+    edges.to_csv(args.out, index=False, encoding="utf-8-sig")
+    print(f"✅ 엣지 {len(edges)}개 → {args.out}")
+
+if __name__ == "__main__":
+    main()
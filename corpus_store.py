@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+코퍼스 저장소: 크롤러 CSV들을 하나의 스키마로 통합해 Parquet 데이터셋(source/year/volume 파티션)으로 저장
+
+- 저널마다 다른 열 구성(JMIS: title/abstract/keywords/url, ISR: + volume/issue/authors/date,
+  TheVerge: date/title/abstract/keywords/url, TechCrunch: + content)을 UNIFIED_COLUMNS로 맞춤
+- source/category/issue는 사전 인코딩(dictionary) → 파일 크기·메모리 절약
+- 분석 노트북은 필요한 열과 파티션만 읽음 (전체 CSV read_csv 대신)
+
+사용 예:
+python corpus_store.py build Crawler/Data/JMIS/*.csv Crawler/theverge.csv --out corpus
+python corpus_store.py build 08_journal.csv --source-column affiliations --out corpus
+python corpus_store.py info --out corpus
+
+from corpus_store import load_corpus
+df = load_corpus("corpus", columns=["title", "abstract"], category="journal", years=range(2020, 2026))
+"""
+
+import os, re, glob, hashlib, argparse
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# =========================
+# 스키마
+# =========================
+DEFAULT_STORE = "corpus"
+PARTITION_COLS = ["source", "year", "volume"]
+ROW_GROUP_ROWS = 8192  # 행 그룹 크기 = 스트리밍 읽기 시 한 번에 올라오는 최대 행 수
+
+SCHEMA = pa.schema([
+    ("doc_id", pa.string()),                                  # url 해시 (url 없으면 제목 해시)
+    ("source", pa.dictionary(pa.int32(), pa.string())),       # jmis, isr, theverge ...
+    ("category", pa.dictionary(pa.int8(), pa.string())),      # journal / industry
+    ("year", pa.int16()),
+    ("volume", pa.int32()),
+    ("issue", pa.dictionary(pa.int32(), pa.string())),        # "3", "suppl/C" 등
+    ("date", pa.string()),                                    # ISO (YYYY-MM-DD), 모르면 null
+    ("title", pa.string()),
+    ("authors", pa.string()),
+    ("abstract", pa.string()),
+    ("keywords", pa.string()),
+    ("content", pa.string()),                                 # 뉴스 본문 (저널은 null)
+    ("url", pa.string()),
+])
+UNIFIED_COLUMNS = SCHEMA.names
+
+INDUSTRY_SOURCES = {"techcrunch", "theverge"}
+
+# 날짜 열이 없는 저널: 출판 연도 = 권 + 오프셋 (1권 발행 연도 - 1)
+# JMIS 42권=2025, EJIS 34권=2025, JAIS 26권=2025, MISQ 49권=2025, JIT 40권=2025, I&M 62권=2025, JSIS 34권=2025
+VOLUME_YEAR_OFFSET = {
+    "jmis": 1983,
+    "ejis": 1991,
+    "jais": 1999,
+    "misq": 1976,
+    "jit": 1985,
+    "iam": 1963,
+    "jsis": 1991,
+}
+
+# 출력 파일명 → source (크롤러별 저장 파일명 규칙)
+SOURCE_PATTERNS = [
+    (re.compile(r"informs_isre|(^|[_/])isr", re.I), "isr"),
+    (re.compile(r"techcrunch", re.I), "techcrunch"),
+    (re.compile(r"theverge", re.I), "theverge"),
+    (re.compile(r"(^|[_/])(iam|dss|jsis|jmis|ejis|jais|misq|jit)[_/]", re.I), None),  # 그룹 2가 source
+]
+
+# 기존 열 이름 → 통합 열 이름
+COLUMN_ALIASES = {
+    "vol": "volume",
+    "iss": "issue",
+    "pub_date": "date",
+    "published": "date",
+    "body": "content",
+    "text": "content",
+    "keyword": "keywords",
+    "author": "authors",
+}
+
+# =========================
+# 정규화
+# =========================
+def infer_source(path: str):
+    """파일 경로에서 source 추정 (못 찾으면 None)"""
+    name = os.path.basename(path).lower()
+    for pat, src in SOURCE_PATTERNS:
+        m = pat.search(name) or pat.search(path.lower())
+        if m:
+            return src or m.group(2).lower()
+    return None
+
+VOL_ISS_PAT = re.compile(r"_vol(\d+)(?:to\d+)?(?:_iss(?:ue)?(\d+)(?:to\d+)?)?", re.I)
+
+def infer_vol_iss(path: str):
+    """JMIS_vol42_iss1.csv → (42, "1"). 권호 열이 없는 크롤러 출력용"""
+    m = VOL_ISS_PAT.search(os.path.basename(path))
+    return (int(m.group(1)), m.group(2)) if m else (None, None)
+
+def make_doc_id(url, title) -> str:
+    key = url if isinstance(url, str) and url else f"title:{title}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+def _nullify(s: pd.Series) -> pd.Series:
+    # 크롤러가 빈 값 대신 넣던 "N/A", "제목 없음" 등을 null로
+    s = s.astype("string").str.strip()
+    return s.mask(s.isin(["", "N/A", "nan", "None", "제목 없음"]))
+
+def normalize_frame(df: pd.DataFrame, source: str) -> pd.DataFrame:
+    """크롤러 CSV 한 개 → UNIFIED_COLUMNS 순서의 DataFrame"""
+    df = df.rename(columns={c: COLUMN_ALIASES.get(c.strip().lower(), c.strip().lower()) for c in df.columns})
+    out = pd.DataFrame(index=df.index)
+    for col in ("date", "title", "authors", "abstract", "keywords", "content", "url", "issue"):
+        out[col] = _nullify(df[col]) if col in df.columns else pd.Series(pd.NA, index=df.index, dtype="string")
+
+    out["volume"] = pd.to_numeric(df["volume"], errors="coerce").astype("Int32") if "volume" in df.columns \
+        else pd.Series(pd.NA, index=df.index, dtype="Int32")
+    parsed = pd.to_datetime(out["date"], errors="coerce", utc=True, format="mixed")
+    out["year"] = parsed.dt.year.astype("Int16")
+    if source in VOLUME_YEAR_OFFSET:
+        # 날짜가 없으면 권 번호로 연도 추정 (null 연도 파티션에 들어가 years= 필터에서 빠지지 않게)
+        out["year"] = out["year"].fillna((out["volume"] + VOLUME_YEAR_OFFSET[source]).astype("Int16"))
+    out["date"] = parsed.dt.strftime("%Y-%m-%d").astype("string").where(parsed.notna(), out["date"])
+
+    out["source"] = source
+    out["category"] = "industry" if source in INDUSTRY_SOURCES else "journal"
+    out["doc_id"] = [make_doc_id(u, t) for u, t in zip(out["url"].tolist(), out["title"].tolist())]
+    return out[UNIFIED_COLUMNS]
+
+def read_source_csv(path: str, source: str = None, source_column: str = None) -> pd.DataFrame:
+    """
+    크롤러 출력(utf-8-sig CSV / JSONL) 읽기 → 통합 스키마.
+    source_column: 병합 CSV(08_journal.csv 등)처럼 행마다 출처 열이 있을 때 그 열 이름
+    """
+    df = pd.read_json(path, lines=True) if path.endswith(".jsonl") else pd.read_csv(path, encoding="utf-8-sig")
+    if source_column:
+        if source_column not in df.columns:
+            raise KeyError(f"{path}: '{source_column}' 열이 없습니다")
+        keys = df[source_column].astype("string").str.strip().str.lower().fillna("unknown")
+        return pd.concat([normalize_frame(g, src) for src, g in df.groupby(keys, sort=False)])
+    source = source or infer_source(path)
+    if source is None:
+        raise ValueError(f"source를 알 수 없습니다: {path} (--source로 지정)")
+    vol, iss = infer_vol_iss(path)
+    if "volume" not in df.columns and vol is not None and "to" not in os.path.basename(path).lower():
+        df["volume"] = vol
+        if iss is not None and "issue" not in df.columns:
+            df["issue"] = iss
+    return normalize_frame(df, source)
+
+def to_table(df: pd.DataFrame) -> pa.Table:
+    return pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+
+# =========================
+# 저장 / 로드
+# =========================
+def _partition_keys(df: pd.DataFrame) -> pd.Series:
+    return df["source"].astype(str) + "|" + df["year"].astype("string").fillna("") + "|" \
+        + df["volume"].astype("string").fillna("")
+
+def read_partitions(df: pd.DataFrame, out_dir: str = DEFAULT_STORE) -> pd.DataFrame:
+    """df가 걸친 source/year/volume 파티션의 기존 행 (저장소가 없으면 빈 DataFrame)"""
+    if not os.path.isdir(out_dir) or not glob.glob(os.path.join(out_dir, "**", "*.parquet"), recursive=True):
+        return df.iloc[0:0]
+    old = load_corpus(out_dir, sources=sorted(df["source"].astype(str).unique()))
+    if old.empty:
+        return df.iloc[0:0]
+    old["source"] = old["source"].astype(str)
+    old["year"] = old["year"].astype("Int16")
+    old["volume"] = old["volume"].astype("Int32")
+    old = old[_partition_keys(old).isin(set(_partition_keys(df)))]
+    return old[UNIFIED_COLUMNS]
+
+def write_store(df: pd.DataFrame, out_dir: str = DEFAULT_STORE):
+    """
+    통합 DataFrame → source/year/volume 파티션 Parquet.
+    파티션은 통째로 교체(delete_matching)되므로 먼저 그 파티션의 기존 행을 읽어 doc_id 기준으로 합침
+    → 같은 권의 다른 호를 따로 build해도 앞서 넣은 호가 지워지지 않음 (같은 문서는 새 행이 우선).
+    """
+    old = read_partitions(df, out_dir)
+    if len(old):
+        df = pd.concat([old.astype({c: "string" for c in ("source", "issue", "category")}),
+                        df.astype({c: "string" for c in ("source", "issue", "category")})], ignore_index=True)
+    df = df.drop_duplicates(subset=["doc_id"], keep="last")
+    ds.write_dataset(
+        to_table(df), out_dir, format="parquet",
+        partitioning=ds.partitioning(pa.schema([SCHEMA.field(c) for c in PARTITION_COLS]), flavor="hive"),
+        existing_data_behavior="delete_matching",
+        basename_template="part-{i}.parquet",
+        max_rows_per_group=ROW_GROUP_ROWS, min_rows_per_group=min(ROW_GROUP_ROWS, 1024),
+    )
+    return len(df)
+
+def build_store(paths, out_dir: str = DEFAULT_STORE, source: str = None, source_column: str = None) -> int:
+    frames = []
+    for path in paths:
+        df = read_source_csv(path, source=source, source_column=source_column)
+        print(f"📄 {path}: {len(df)}행 ({', '.join(sorted(df['source'].unique()))})")
+        frames.append(df)
+    if not frames:
+        return 0
+    return write_store(pd.concat(frames, ignore_index=True), out_dir)
+
+def open_store(out_dir: str = DEFAULT_STORE) -> ds.Dataset:
+    partitioning = ds.HivePartitioning.discover(
+        schema=pa.schema([("source", pa.string()), SCHEMA.field("year"), SCHEMA.field("volume")])
+    )
+    return ds.dataset(out_dir, format="parquet", partitioning=partitioning)
+
+def build_filter(sources=None, category=None, years=None):
+    """파티션 필터 식 (source/year는 디렉터리 단위로 걸러져 해당 파일만 읽음)"""
+    expr = None
+    def _and(a, b):
+        return b if a is None else a & b
+    if sources:
+        expr = _and(expr, ds.field("source").isin([sources] if isinstance(sources, str) else list(sources)))
+    if category:
+        expr = _and(expr, ds.field("category") == category)
+    if years is not None:
+        expr = _and(expr, ds.field("year").isin([int(y) for y in years]))
+    return expr
+
+def load_corpus(out_dir: str = DEFAULT_STORE, columns=None, sources=None, category=None, years=None) -> pd.DataFrame:
+    """필요한 열/파티션만 읽어 DataFrame으로 (source, category는 pandas category 타입)"""
+    table = open_store(out_dir).to_table(columns=columns, filter=build_filter(sources, category, years))
+    df = table.to_pandas()
+    if "source" in df.columns:  # 파티션 열은 디렉터리 이름에서 문자열로 복원됨
+        df["source"] = df["source"].astype("category")
+    return df
+
+def iter_batches(out_dir: str = DEFAULT_STORE, columns=None, sources=None, category=None, years=None,
+                 batch_size: int = 4096):
+    """레코드 배치 단위 스트리밍 (전체를 메모리에 올리지 않음)"""
+    scanner = open_store(out_dir).scanner(columns=columns, filter=build_filter(sources, category, years),
+                                          batch_size=batch_size, batch_readahead=2, fragment_readahead=1)
+    for batch in scanner.to_batches():
+        if batch.num_rows:
+            yield batch
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="크롤러 CSV → 통합 Parquet 코퍼스")
+    ap.add_argument("command", choices=["build", "info"])
+    ap.add_argument("inputs", nargs="*", help="CSV/JSONL 경로 (glob 허용)")
+    ap.add_argument("--out", default=DEFAULT_STORE, help="Parquet 데이터셋 디렉터리")
+    ap.add_argument("--source", default=None, help="source 강제 지정 (기본: 파일명에서 추정)")
+    ap.add_argument("--source-column", default=None, help="병합 CSV의 출처 열 이름 (예: affiliations)")
+    args = ap.parse_args()
+
+    if args.command == "build":
+        paths = sorted({p for pat in args.inputs for p in glob.glob(pat, recursive=True)})
+        if not paths:
+            ap.error("입력 파일이 없습니다")
+        n = build_store(paths, args.out, source=args.source, source_column=args.source_column)
+        print(f"\n✅ {n}개 문서 → {os.path.abspath(args.out)}")
+        return
+
+    counts = load_corpus(args.out, columns=["source", "category", "year"]) \
+        .groupby(["category", "source", "year"], observed=True, dropna=False).size()
+    print(counts.to_string())
+    print(f"\n총 {int(counts.sum())}개 문서")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+키워드 정규화 + 정수 코드 어휘 인덱스 (keywords 열 전용)
+
+- 크롤러마다 다른 keywords 문자열(", " 결합, 세미콜론, JSON-LD 목록 결합 등)을
+  pyarrow 문자열 커널로 한 번에 분리 → 소문자 → 공백 정리 → 단수화 → 띄어쓰기 제거
+  (단수화 규칙은 preprocess.singularize와 동일, 행 단위 파이썬 루프 없음)
+- 전역 어휘: 키워드 문자열 ↔ int32 코드. 문서별 키워드는 offsets + codes 배열(CSR과 같은 구조)
+- 빈도 / 연도별 추이 / 문서-키워드 행렬은 NumPy·scipy 연산으로 계산
+
+사용 예:
+from keywords import KeywordIndex
+idx = KeywordIndex.from_store("corpus", category="journal")
+idx.frequency(top=30)
+idx.trend(["machinelearning", "blockchain"])
+idx.save("keywords_journal.npz")
+"""
+
+import json, argparse
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import scipy.sparse as sp
+
+# =========================
+# 정규화 (벡터화)
+# =========================
+SEPARATORS = (";", "|", "\n")  # 모두 ","로 바꾼 뒤 분리 (정규식 분리보다 빠름)
+KEEP_PAT = r"(ss|us|is|ics)$"
+
+def singularize_words(words: pa.Array) -> pa.Array:
+    """단어 배열 단수화 (preprocess.singularize와 같은 규칙을 정규식 커널로)"""
+    keep = pc.or_(pc.less_equal(pc.utf8_length(words), 3), pc.match_substring_regex(words, KEEP_PAT))
+    rules = [
+        ("ies$", "y"),
+        ("yses$", "ysis"),
+        ("(ss|ch|sh|x)es$", r"\1"),
+        ("s$", ""),
+    ]
+    out = words
+    done = keep
+    for pat, repl in rules:
+        hit = pc.and_(pc.invert(done), pc.match_substring_regex(words, pat))
+        out = pc.if_else(hit, pc.replace_substring_regex(words, pat, repl, max_replacements=1), out)
+        done = pc.or_(done, hit)
+    return out
+
+def split_keywords(values) -> tuple:
+    """
+    keywords 문자열 배열 → (doc_index, keyword) 인스턴스 배열.
+    doc_index: 키워드가 속한 입력 행 번호 (int64), keyword: 정규화된 키워드 (빈 값 제외)
+    """
+    arr = pa.array(values, type=pa.string(), from_pandas=True) if not isinstance(values, pa.Array) else values
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    arr = pc.fill_null(arr, "")
+    for sep in SEPARATORS:
+        arr = pc.replace_substring(arr, sep, ",")
+    lists = pc.split_pattern(arr, ",")
+    parents = pc.list_parent_indices(lists)
+
+    # 같은 키워드가 수없이 반복되므로 고유 문자열만 정규화한 뒤 인덱스로 펼침
+    enc = pc.dictionary_encode(pc.list_flatten(lists))
+    uniq = pc.utf8_trim_whitespace(pc.utf8_lower(enc.dictionary))
+    # 키워드 안의 단어 단위로 단수화 후 이어 붙임 ("information systems" → "informationsystem")
+    words = pc.split_pattern_regex(uniq, r"\s+")
+    flat = singularize_words(pc.list_flatten(words))
+    normalized = pc.binary_join(pa.ListArray.from_arrays(words.offsets, flat), "")
+    joined = pc.take(normalized, enc.indices)
+
+    keep = pc.greater(pc.utf8_length(joined), 0)
+    return pc.filter(parents, keep).to_numpy(), pc.filter(joined, keep)
+
+# =========================
+# 인덱스
+# =========================
+class KeywordIndex:
+    """
+    vocab: 코드 → 키워드 (list), offsets: 문서 i의 키워드는 codes[offsets[i]:offsets[i+1]]
+    years / sources: 문서별 연도(int, 없으면 -1), source 이름 배열
+    """
+
+    def __init__(self):
+        self.vocab = []
+        self._vocab_arr = pa.array([], pa.string())
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.codes = np.zeros(0, dtype=np.int32)
+        self.years = np.zeros(0, dtype=np.int16)
+        self.sources = np.zeros(0, dtype=object)
+        self.doc_ids = np.zeros(0, dtype=object)
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def n_keywords(self) -> int:
+        return len(self.vocab)
+
+    # ---------- 구축 ----------
+    def encode(self, keywords: pa.Array) -> np.ndarray:
+        """키워드 → 코드 (처음 보는 키워드는 어휘 끝에 추가)"""
+        codes = pc.index_in(keywords, value_set=self._vocab_arr)
+        missing = pc.is_null(codes)
+        if pc.any(missing).as_py():
+            new = pc.unique(pc.filter(keywords, missing))
+            self.vocab.extend(new.to_pylist())
+            self._vocab_arr = pa.concat_arrays([self._vocab_arr, new])
+            codes = pc.index_in(keywords, value_set=self._vocab_arr)
+        return codes.to_numpy().astype(np.int32)
+
+    def add(self, keywords, years=None, sources=None, doc_ids=None):
+        """
+        문서 배치 추가 (증분). keywords: 문서별 키워드 문자열, years/sources/doc_ids: 같은 길이(선택)
+        문서 안 중복 키워드는 한 번만 센다.
+        """
+        n = len(keywords)
+        parents, kws = split_keywords(keywords)
+        codes = self.encode(kws).astype(np.int64)
+
+        # (문서, 코드) 중복 제거 + 문서 순 정렬을 한 번에 (정렬 후 이웃 비교, 해시 없음)
+        v = max(self.n_keywords, 1)
+        key = np.sort(parents * v + codes)
+        if len(key):
+            key = key[np.concatenate(([True], key[1:] != key[:-1]))]
+        parents, codes = key // v, (key % v).astype(np.int32)
+
+        counts = np.bincount(parents, minlength=n)
+        self.offsets = np.concatenate([self.offsets, self.offsets[-1] + np.cumsum(counts)])
+        self.codes = np.concatenate([self.codes, codes])
+        yrs = np.full(n, -1, dtype=np.int16) if years is None else \
+            pd.Series(years).fillna(-1).to_numpy().astype(np.int16)
+        self.years = np.concatenate([self.years, yrs])
+        self.sources = np.concatenate([self.sources, np.full(n, None, dtype=object) if sources is None
+                                       else np.asarray(sources, dtype=object)])
+        self.doc_ids = np.concatenate([self.doc_ids, np.full(n, None, dtype=object) if doc_ids is None
+                                       else np.asarray(doc_ids, dtype=object)])
+        return self
+
+    def add_frame(self, df: pd.DataFrame, keyword_col: str = "keywords"):
+        return self.add(
+            df[keyword_col],
+            years=df["year"] if "year" in df.columns else None,
+            sources=df["source"].astype(str) if "source" in df.columns else None,
+            doc_ids=df["doc_id"] if "doc_id" in df.columns else None,
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, keyword_col: str = "keywords") -> "KeywordIndex":
+        return cls().add_frame(df, keyword_col)
+
+    @classmethod
+    def from_store(cls, store: str = None, **filters) -> "KeywordIndex":
+        """corpus_store에서 keywords/year/source/doc_id 열만 배치로 읽어 구축"""
+        from corpus_store import DEFAULT_STORE, iter_batches
+        idx = cls()
+        for batch in iter_batches(store or DEFAULT_STORE, columns=["doc_id", "source", "year", "keywords"], **filters):
+            idx.add(batch.column("keywords"),
+                    years=batch.column("year").to_pandas(),
+                    sources=batch.column("source").to_pandas().astype(str),
+                    doc_ids=batch.column("doc_id").to_numpy(zero_copy_only=False))
+        return idx
+
+    # ---------- 조회 ----------
+    def encode_existing(self, keywords) -> np.ndarray:
+        """정규화 후 코드 조회 (어휘에 없으면 -1)"""
+        _, kws = split_keywords(pa.array(list(keywords), pa.string()))
+        codes = pc.index_in(kws, value_set=self._vocab_arr)
+        return pc.fill_null(codes, -1).to_numpy()
+
+    def doc_index(self) -> np.ndarray:
+        """키워드 인스턴스별 문서 번호"""
+        return np.repeat(np.arange(self.n_docs), np.diff(self.offsets))
+
+    def mask_docs(self, sources=None, years=None) -> np.ndarray:
+        mask = np.ones(self.n_docs, dtype=bool)
+        if sources is not None:
+            mask &= np.isin(self.sources, [sources] if isinstance(sources, str) else list(sources))
+        if years is not None:
+            mask &= np.isin(self.years, list(years))
+        return mask
+
+    def doc_term_matrix(self, doc_mask=None) -> sp.csr_matrix:
+        """문서 × 키워드 0/1 CSR (offsets/codes를 그대로 indptr/indices로 사용)"""
+        X = sp.csr_matrix(
+            (np.ones(len(self.codes), dtype=np.float32), self.codes, self.offsets),
+            shape=(self.n_docs, self.n_keywords),
+        )
+        return X[doc_mask] if doc_mask is not None else X
+
+    def frequency(self, top: int = None, sources=None, years=None) -> pd.DataFrame:
+        """키워드별 문서 빈도 (내림차순)"""
+        codes = self.codes
+        if sources is not None or years is not None:
+            codes = codes[self.mask_docs(sources, years)[self.doc_index()]]
+        counts = np.bincount(codes, minlength=self.n_keywords)
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0][:top] if top else order[counts[order] > 0]
+        return pd.DataFrame({"keyword": np.asarray(self.vocab, dtype=object)[order], "count": counts[order]})
+
+    def trend(self, keywords=None, top: int = 20, sources=None) -> pd.DataFrame:
+        """연도 × 키워드 문서 수 (keywords 미지정 시 전체 상위 top개)"""
+        doc = self.doc_index()
+        valid = self.years[doc] >= 0
+        if sources is not None:
+            valid &= self.mask_docs(sources=sources)[doc]
+        yrs, codes = self.years[doc][valid], self.codes[valid]
+        if keywords is None:
+            cols = np.argsort(-np.bincount(codes, minlength=self.n_keywords), kind="stable")[:top]
+        else:
+            cols = self.encode_existing(keywords)
+            cols = cols[cols >= 0]
+        uniq_years, yi = np.unique(yrs, return_inverse=True)
+        table = np.bincount(yi * self.n_keywords + codes, minlength=len(uniq_years) * self.n_keywords) \
+            .reshape(len(uniq_years), self.n_keywords)
+        return pd.DataFrame(table[:, cols], index=uniq_years, columns=np.asarray(self.vocab, dtype=object)[cols])
+
+    def keywords_of(self, i: int) -> list:
+        return [self.vocab[c] for c in self.codes[self.offsets[i]:self.offsets[i + 1]]]
+
+    # ---------- 저장 ----------
+    def save(self, path: str):
+        np.savez_compressed(
+            path, offsets=self.offsets, codes=self.codes, years=self.years,
+            sources=np.where(self.sources == None, "", self.sources).astype(str),  # noqa: E711
+            doc_ids=np.where(self.doc_ids == None, "", self.doc_ids).astype(str),  # noqa: E711
+            vocab=np.asarray(json.dumps(self.vocab, ensure_ascii=False)),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "KeywordIndex":
+        z = np.load(path, allow_pickle=False)
+        idx = cls()
+        idx.vocab = json.loads(str(z["vocab"]))
+        idx._vocab_arr = pa.array(idx.vocab, pa.string())
+        idx.offsets, idx.codes, idx.years = z["offsets"], z["codes"], z["years"]
+        idx.sources, idx.doc_ids = z["sources"].astype(object), z["doc_ids"].astype(object)
+        return idx
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="키워드 어휘 인덱스 구축/조회")
+    ap.add_argument("--store", default=None, help="corpus_store Parquet 디렉터리")
+    ap.add_argument("--category", default=None, help="journal / industry")
+    ap.add_argument("--sources", nargs="*", default=None)
+    ap.add_argument("--save", default=None, help="인덱스 저장 경로 (.npz)")
+    ap.add_argument("--load", default=None, help="저장된 인덱스 사용")
+    ap.add_argument("--top", type=int, default=30)
+    ap.add_argument("--trend", nargs="*", default=None, help="연도별 추이를 볼 키워드 (인자 없으면 상위 10개)")
+    args = ap.parse_args()
+
+    idx = KeywordIndex.load(args.load) if args.load else \
+        KeywordIndex.from_store(args.store, category=args.category, sources=args.sources)
+    print(f"문서 {idx.n_docs}개, 키워드 인스턴스 {len(idx.codes)}개, 고유 키워드 {idx.n_keywords}개\n")
+    print(idx.frequency(top=args.top).to_string(index=False))
+    if args.trend is not None:
+        print()
+        print(idx.trend(args.trend or None, top=10).to_string())
+    if args.save:
+        idx.save(args.save)
+        print(f"\n💾 {args.save}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+LDA 전처리 파이프라인 (01_LDA_Academia 노트북 1.1 전처리 규칙)
+
+- NER로 사람 이름(PERSON) 검출 후 제거 — spaCy nlp.pipe로 배치 + n_process 병렬
+- 불용어 제거: 영어 불용어 + 도메인 불용어(Information System, Research, Study ...)
+- 소문자 변환, 복수형 통일(단수화) — keywords 열 정규화는 keywords.split_keywords (같은 단수화 규칙)
+- 결과는 문서 내용 해시 기준으로 디스크 캐시(SQLite) → 새로 수집했거나 바뀐 문서만 다시 처리
+
+사용 예:
+python preprocess.py --store corpus --category journal --n-process 4     # 캐시 채우기
+python topic_model.py train --store corpus --category journal --preprocess --model lda_academia.joblib
+
+from preprocess import Preprocessor
+pre = Preprocessor()
+token_lists = pre.process(texts)   # 캐시 미스만 NER 실행
+"""
+
+import os, re, time, sqlite3, hashlib, argparse
+
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+try:
+    import spacy  # 선택 의존성: 없으면 NER(사람 이름 제거)는 건너뜀
+except ImportError:
+    spacy = None
+
+# =========================
+# 설정
+# =========================
+DEFAULT_CACHE = os.environ.get(
+    "PREPROCESS_CACHE", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".preprocess_cache.sqlite")
+)
+DEFAULT_MODEL = "en_core_web_sm"
+PIPELINE_VERSION = "1"  # 규칙을 바꾸면 올려서 기존 캐시를 무효화
+
+DOMAIN_STOP_PHRASES = ["information systems", "information system", "research", "study", "studies", "paper"]
+STOP_WORDS = frozenset(ENGLISH_STOP_WORDS) | {"abstract", "et", "al"}
+TOKEN_PAT = re.compile(r"[a-z][a-z0-9\-]+")
+_PHRASE_PAT = re.compile(r"\b(?:" + "|".join(re.escape(p) for p in DOMAIN_STOP_PHRASES) + r")\b", re.I)
+
+# =========================
+# 정규화 규칙
+# =========================
+_SINGULAR_KEEP = ("ss", "us", "is", "ics")
+
+def singularize(word: str) -> str:
+    """간단한 규칙 기반 단수화 (systems→system, technologies→technology, analyses→analysis)"""
+    if len(word) <= 3 or word.endswith(_SINGULAR_KEEP):
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith("yses"):
+        return word[:-2] + "is"
+    if word.endswith(("sses", "ches", "shes", "xes")):
+        return word[:-2]
+    if word.endswith("s"):
+        return word[:-1]
+    return word
+
+def tokenize(text: str) -> list:
+    """이름 제거가 끝난 텍스트 → 토큰 (도메인 불용어 구 → 소문자 → 불용어 → 단수화)"""
+    text = _PHRASE_PAT.sub(" ", text)
+    out = []
+    for t in TOKEN_PAT.findall(text.lower()):
+        if t in STOP_WORDS:
+            continue
+        t = singularize(t)
+        if t not in STOP_WORDS:
+            out.append(t)
+    return out
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(f"{PIPELINE_VERSION}\0{text}".encode("utf-8")).hexdigest()
+
+# =========================
+# 캐시
+# =========================
+class TokenCache:
+    """content_hash → 토큰(공백 구분 문자열). ner 열로 NER 적용 여부를 구분."""
+
+    def __init__(self, path: str = DEFAULT_CACHE):
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS tokens (
+                hash TEXT NOT NULL,
+                ner INTEGER NOT NULL,
+                tokens TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (hash, ner)
+            )
+        """)
+        self._db.commit()
+
+    def get_many(self, hashes, ner: bool) -> dict:
+        out = {}
+        hashes = list(set(hashes))
+        for i in range(0, len(hashes), 500):
+            part = hashes[i:i + 500]
+            q = f"SELECT hash, tokens FROM tokens WHERE ner=? AND hash IN ({','.join('?' * len(part))})"
+            for h, toks in self._db.execute(q, [int(ner), *part]):
+                out[h] = toks.split() if toks else []
+        return out
+
+    def put_many(self, items, ner: bool):
+        now = time.time()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO tokens (hash, ner, tokens, created_at) VALUES (?, ?, ?, ?)",
+            [(h, int(ner), " ".join(toks), now) for h, toks in items],
+        )
+        self._db.commit()
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    def close(self):
+        self._db.close()
+
+# =========================
+# 파이프라인
+# =========================
+class Preprocessor:
+    def __init__(self, cache_path: str = DEFAULT_CACHE, model: str = DEFAULT_MODEL, use_ner: bool = True,
+                 n_process: int = 1, batch_size: int = 256):
+        """
+        use_ner: 사람 이름 제거 여부 (spaCy/모델이 없으면 경고 후 자동으로 False)
+        n_process, batch_size: nlp.pipe 병렬 프로세스 수와 배치 크기
+        """
+        self.cache = TokenCache(cache_path)
+        self.model = model
+        self.n_process = n_process
+        self.batch_size = batch_size
+        self._nlp = None
+        self.use_ner = use_ner and self._load_nlp()
+        self.hits = self.misses = 0
+
+    def _load_nlp(self) -> bool:
+        """spaCy 모델을 미리 로드 — 캐시 조회 전에 NER 사용 여부(캐시의 ner 열)를 확정하기 위해"""
+        if spacy is None:
+            print("⚠️ spaCy가 없어 NER(사람 이름 제거)을 건너뜁니다 (pip install spacy)")
+            return False
+        try:
+            # NER만 쓰므로 나머지 컴포넌트는 끔
+            self._nlp = spacy.load(self.model, disable=["tagger", "parser", "lemmatizer", "attribute_ruler"])
+        except OSError:
+            print(f"⚠️ spaCy 모델 {self.model}이 없어 NER(사람 이름 제거)을 건너뜁니다 "
+                  f"(python -m spacy download {self.model})")
+            return False
+        return True
+
+    @property
+    def nlp(self):
+        return self._nlp
+
+    def _strip_names(self, texts) -> list:
+        """PERSON 엔티티 구간을 지운 텍스트 목록"""
+        out = []
+        for doc in self.nlp.pipe(texts, n_process=self.n_process, batch_size=self.batch_size):
+            text, last = [], 0
+            for ent in doc.ents:
+                if ent.label_ == "PERSON":
+                    text.append(doc.text[last:ent.start_char])
+                    last = ent.end_char
+            text.append(doc.text[last:])
+            out.append(" ".join(text))
+        return out
+
+    def process(self, texts) -> list:
+        """문서 목록 → 토큰 리스트 목록 (캐시 미스만 NER·토큰화)"""
+        texts = list(texts)
+        hashes = [content_hash(t) for t in texts]
+        cached = self.cache.get_many(hashes, self.use_ner)
+        todo = {}
+        for h, t in zip(hashes, texts):
+            if h not in cached and h not in todo:
+                todo[h] = t
+        self.hits += len(texts) - len(todo)
+        self.misses += len(todo)
+
+        if todo:
+            raw = list(todo.values())
+            cleaned = self._strip_names(raw) if self.use_ner else raw
+            fresh = [(h, tokenize(t)) for h, t in zip(todo.keys(), cleaned)]
+            self.cache.put_many(fresh, self.use_ner)
+            cached.update(fresh)
+        return [cached[h] for h in hashes]
+
+    def warm(self, docs, chunk_size: int = 2000) -> int:
+        """문서 스트림을 chunk_size개씩 처리해 캐시를 채움 (토큰은 메모리에 남기지 않음)"""
+        n = 0
+        chunk = []
+        for text in docs:
+            chunk.append(text)
+            if len(chunk) >= chunk_size:
+                self.process(chunk)
+                n += len(chunk)
+                chunk = []
+        if chunk:
+            self.process(chunk)
+            n += len(chunk)
+        return n
+
+    def __call__(self, text: str) -> list:
+        """단일 문서 토크나이저 (topic_model.StreamingLDA의 tokenizer로 사용, warm() 후에는 캐시 조회만)"""
+        return self.process([text])[0]
+
+# =========================
+# CLI
+# =========================
+def main():
+    from corpus_store import DEFAULT_STORE
+    from topic_model import corpus_documents, DEFAULT_FIELDS
+
+    ap = argparse.ArgumentParser(description="LDA 전처리 캐시 채우기 (새/변경 문서만 NER)")
+    ap.add_argument("--store", default=DEFAULT_STORE, help="corpus_store Parquet 디렉터리")
+    ap.add_argument("--category", default=None, help="journal / industry")
+    ap.add_argument("--sources", nargs="*", default=None)
+    ap.add_argument("--years", nargs="*", type=int, default=None)
+    ap.add_argument("--fields", nargs="+", default=list(DEFAULT_FIELDS))
+    ap.add_argument("--cache", default=DEFAULT_CACHE, help="전처리 캐시 경로")
+    ap.add_argument("--model", default=DEFAULT_MODEL, help="spaCy 모델")
+    ap.add_argument("--no-ner", action="store_true", help="사람 이름 제거 생략")
+    ap.add_argument("--n-process", type=int, default=max(1, (os.cpu_count() or 2) - 1))
+    ap.add_argument("--batch-size", type=int, default=256)
+    args = ap.parse_args()
+
+    pre = Preprocessor(args.cache, model=args.model, use_ner=not args.no_ner,
+                       n_process=args.n_process, batch_size=args.batch_size)
+    t0 = time.perf_counter()
+    n = pre.warm(corpus_documents(args.store, fields=args.fields, category=args.category,
+                                  sources=args.sources, years=args.years))
+    print(f"✅ 문서 {n}개 (캐시 적중 {pre.hits}, 새로 처리 {pre.misses}) — {time.perf_counter() - t0:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
+
+from cooccurrence import CooccurrenceGraph
+from keywords import KeywordIndex
+
+BATCH1 = ["ai, blockchain, privacy", "ai, privacy", "blockchain, cloud", "ai, cloud, privacy", None]
+BATCH2 = ["ai, metaverse", "metaverse, privacy, ai", "cloud, edge"]
+SOURCES1 = ["jmis", "jmis", "techcrunch", "misq", "jmis"]
+YEARS1 = [2021, 2022, 2022, 2022, 2021]
+SOURCES2 = ["techcrunch", "jmis", "techcrunch"]
+YEARS2 = [2023, 2023, 2022]
+
+def _brute(idx, sources=None, years=None):
+    """문서별 키워드 쌍을 직접 세는 기준 구현"""
+    pairs, nodes = Counter(), Counter()
+    for i in range(idx.n_docs):
+        if sources is not None and idx.sources[i] not in sources:
+            continue
+        if years is not None and idx.years[i] not in years:
+            continue
+        kws = sorted(set(idx.keywords_of(i)))
+        nodes.update(kws)
+        pairs.update(combinations(kws, 2))
+    return pairs, nodes
+
+def _as_counter(edges):
+    return Counter({tuple(sorted((s, t))): w for s, t, w in zip(edges["source"], edges["target"], edges["weight"])})
+
+def _index():
+    return KeywordIndex().add(BATCH1, years=YEARS1, sources=SOURCES1).add(BATCH2, years=YEARS2, sources=SOURCES2)
+
+def test_update_matches_brute_force_pairs():
+    idx = _index()
+    g = CooccurrenceGraph().update(idx)
+    pairs, _ = _brute(idx)
+
+    assert _as_counter(g.edges(idx.vocab, min_count=1)) == pairs
+
+def test_incremental_update_with_new_keywords_equals_rebuild():
+    idx = KeywordIndex().add(BATCH1, years=YEARS1, sources=SOURCES1)
+    g = CooccurrenceGraph().update(idx)
+    n_before = idx.n_keywords
+    idx.add(BATCH2, years=YEARS2, sources=SOURCES2)   # metaverse, edge → 어휘가 늘어남
+    assert idx.n_keywords > n_before
+    g.update(idx)
+
+    full = CooccurrenceGraph().update(idx)
+    assert g.n_seen == full.n_seen == idx.n_docs
+    assert sorted(g.parts) == sorted(full.parts)
+    for k in full.parts:
+        assert (g.parts[k] != full.parts[k]).nnz == 0
+        assert np.array_equal(g.node_counts[k], full.node_counts[k])
+
+def test_save_load_round_trip(tmp_path):
+    idx = _index()
+    g = CooccurrenceGraph().update(idx)
+    path = str(tmp_path / "graph.npz")
+    g.save(path)
+    back = CooccurrenceGraph.load(path)
+
+    assert back.n_keywords == g.n_keywords and back.n_seen == g.n_seen
+    assert back.edges(idx.vocab, min_count=1).equals(g.edges(idx.vocab, min_count=1))
+
+def test_edges_filters_and_jaccard():
+    idx = _index()
+    g = CooccurrenceGraph().update(idx)
+
+    edges = g.edges(idx.vocab, sources=["jmis", "misq"], years=[2021, 2022, 2023], min_count=2)
+    pairs, nodes = _brute(idx, sources={"jmis", "misq"}, years={2021, 2022, 2023})
+    expected = {p: w for p, w in pairs.items() if w >= 2}
+    assert _as_counter(edges) == expected
+    for s, t, w, j in edges[["source", "target", "weight", "jaccard"]].itertuples(index=False):
+        assert j == w / (nodes[s] + nodes[t] - w)
+
+    top = g.edges(idx.vocab, min_count=1, top=2)
+    assert len(top) == 2
+    assert top["weight"].tolist() == sorted(_brute(idx)[0].values(), reverse=True)[:2]
+    assert top.iloc[0][["source", "target"]].tolist() == ["ai", "privacy"]
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import pandas as pd
+
+from corpus_store import build_store, load_corpus
+
+def _write_csv(path, rows):
+    pd.DataFrame(rows, columns=["title", "abstract", "keywords", "url"]).to_csv(path, index=False, encoding="utf-8-sig")
+    return str(path)
+
+def test_second_issue_of_same_volume_keeps_first(tmp_path):
+    store = str(tmp_path / "corpus")
+    iss1 = _write_csv(tmp_path / "JMIS_vol42_iss1.csv", [("A", "a", "k", "https://x/1"), ("B", "b", "k", "https://x/2")])
+    iss2 = _write_csv(tmp_path / "JMIS_vol42_iss2.csv", [("C", "c", "k", "https://x/3")])
+
+    build_store([iss1], store)
+    build_store([iss2], store)
+
+    df = load_corpus(store, columns=["title", "issue", "url"])
+    assert sorted(df["title"]) == ["A", "B", "C"]
+    assert sorted(df["issue"].astype(str)) == ["1", "1", "2"]
+
+def test_rebuild_same_issue_replaces_rows_by_url(tmp_path):
+    store = str(tmp_path / "corpus")
+    build_store([_write_csv(tmp_path / "JMIS_vol42_iss1.csv", [("old", "a", "k", "https://x/1")])], store)
+    build_store([_write_csv(tmp_path / "JMIS_vol42_iss1.csv", [("new", "a", "k", "https://x/1")])], store)
+
+    assert load_corpus(store, columns=["title"])["title"].tolist() == ["new"]
+
+def test_journal_without_date_gets_year_from_volume(tmp_path):
+    store = str(tmp_path / "corpus")
+    build_store([_write_csv(tmp_path / "JMIS_vol42_iss1.csv", [("A", "a", "k", "https://x/1")])], store)
+
+    df = load_corpus(store, columns=["title", "year"], years=[2025])
+    assert df["title"].tolist() == ["A"]
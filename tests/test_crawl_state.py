@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from crawl_state import CrawlState, MAX_ATTEMPTS
+
+def test_commit_deferred_records_all_rows(tmp_path):
+    state = CrawlState(str(tmp_path / "state.db"))
+    state.defer_parsed("https://x/1", "s", fetch_ms=10.0, parse_ms=1.0)
+    state.defer_parsed("https://x/2", "s")
+    state.commit_deferred()
+
+    assert state.done_urls("s") == {"https://x/1", "https://x/2"}
+    assert state.stats("s")[0][:3] == ("s", "parsed", 2)
+    state.close()
+
+def test_failed_url_skipped_after_max_attempts_until_retry(tmp_path):
+    state = CrawlState(str(tmp_path / "state.db"))
+    url = "https://x/bad"
+    state.mark_failed(url, "s", "HTTP 500")
+    assert not state.should_skip(url)
+
+    for _ in range(MAX_ATTEMPTS - 1):
+        state.mark_failed(url, "s", "HTTP 500")
+    assert state.should_skip(url)
+    assert state.skip_urls("s") == {url}
+
+    assert state.retry_failed("s") == 1
+    assert not state.should_skip(url)
+    state.close()
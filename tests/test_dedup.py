@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from dedup import Deduper
+
+BODY = "OpenAI released a new reasoning model for developers with longer context and cheaper tokens today"
+
+def test_empty_documents_are_not_clustered(tmp_path):
+    dd = Deduper(str(tmp_path / "dedup.db"))
+    rows = [
+        {"url": "https://x/1", "title": "제목 없음", "content": "본문 없음"},
+        {"url": "https://x/2", "title": "제목 없음", "content": "본문 없음"},
+        {"url": "https://x/3", "title": "N/A", "abstract": "N/A"},
+        {"url": "https://x/4", "title": None, "abstract": ""},
+    ]
+    assert all(dd.add_row(row, "techcrunch") == [] for row in rows)
+    assert dd.add("https://x/5", "제목 없음 본문 없음") == []
+    assert len(dd) == 0
+    assert dd.clusters() == []
+    dd.close()
+
+def test_near_duplicates_still_match(tmp_path):
+    dd = Deduper(str(tmp_path / "dedup.db"))
+    assert dd.add_row({"url": "https://a/1", "title": "New model", "abstract": BODY}, "theverge") == []
+    matches = dd.add_row({"url": "https://b/1", "title": "New model", "content": BODY}, "techcrunch")
+
+    assert [k for k, _ in matches] == ["https://a/1"]
+    assert len(dd.clusters()) == 1
+    dd.close()
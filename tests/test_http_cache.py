@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import requests
+
+from http_cache import CachedSession, HttpCache
+
+def _fake_request(self, method, url, *args, **kwargs):
+    r = requests.Response()
+    r.status_code = 200
+    r.request = requests.Request(method, url, params=kwargs.get("params")).prepare()
+    r.url = r.request.url
+    r._content = r.url.encode("utf-8")
+    return r
+
+def test_params_are_part_of_cache_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(requests.Session, "request", _fake_request)
+    sess = CachedSession(cache=HttpCache(str(tmp_path / "cache")))
+    url = "https://example.com/search"
+
+    first = sess.get(url, params={"page": 1})
+    second = sess.get(url, params={"page": 2})
+    again = sess.get(url, params={"page": 1})
+
+    assert not second.from_cache and second.text.endswith("page=2")
+    assert again.from_cache and again.text == first.text
+    assert sess.get(url + "?page=2").from_cache
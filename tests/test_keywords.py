@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import re
+
+import numpy as np
+import pyarrow as pa
+
+from keywords import KeywordIndex, singularize_words, split_keywords
+from preprocess import singularize
+
+ROWS = [
+    "Information Systems; Analyses | Studies",
+    "Technologies, Switches,  Business Processes\nClasses",
+    None,
+    "",
+    "Crises, Bus, Statistics, IS, Churches, Boxes, Wishes",
+    "Blockchain, blockchains, BLOCKCHAIN",
+]
+
+def _reference(values):
+    """행 단위 파이썬 구현 (벡터화 버전과 같은 규칙)"""
+    out = []
+    for i, text in enumerate(values):
+        for kw in re.split(r"[,;|\n]", text or ""):
+            k = "".join(singularize(w) for w in kw.lower().split())
+            if k:
+                out.append((i, k))
+    return out
+
+def test_singularize_words_matches_python_rules():
+    words = ["systems", "technologies", "analyses", "churches", "classes", "boxes", "wishes",
+             "bus", "crisis", "statistics", "is", "gas", "data", "process"]
+    got = singularize_words(pa.array(words)).to_pylist()
+    assert got == [singularize(w) for w in words]
+
+def test_split_keywords_matches_reference():
+    parents, kws = split_keywords(ROWS)
+    assert list(zip(parents.tolist(), kws.to_pylist())) == _reference(ROWS)
+    assert kws.to_pylist()[:3] == ["informationsystem", "analysis", "study"]
+
+def test_add_dedups_within_doc_and_keeps_empty_rows():
+    idx = KeywordIndex().add(ROWS, years=[2020, 2021, None, 2021, 2022, 2022])
+
+    assert idx.n_docs == len(ROWS)
+    assert idx.keywords_of(2) == [] and idx.keywords_of(3) == []
+    assert idx.keywords_of(5) == ["blockchain"]
+    assert sorted(idx.keywords_of(1)) == ["businessprocess", "class", "switch", "technology"]
+    for i, row in enumerate(ROWS):
+        assert sorted(idx.keywords_of(i)) == sorted({k for d, k in _reference(ROWS) if d == i})
+    assert idx.years.tolist() == [2020, 2021, -1, 2021, 2022, 2022]
+
+def test_incremental_add_matches_single_batch():
+    one = KeywordIndex().add(ROWS)
+    two = KeywordIndex().add(ROWS[:3]).add(ROWS[3:])
+
+    assert one.n_docs == two.n_docs
+    for i in range(one.n_docs):
+        assert sorted(one.keywords_of(i)) == sorted(two.keywords_of(i))
+
+def test_save_load_round_trip(tmp_path):
+    idx = KeywordIndex().add(ROWS, years=[2020, 2021, None, 2021, 2022, 2022],
+                             sources=["jmis", "misq", "jmis", "jais", "misq", "jmis"],
+                             doc_ids=[f"d{i}" for i in range(len(ROWS))])
+    path = str(tmp_path / "kw.npz")
+    idx.save(path)
+    back = KeywordIndex.load(path)
+
+    assert back.vocab == idx.vocab
+    assert np.array_equal(back.offsets, idx.offsets) and np.array_equal(back.codes, idx.codes)
+    assert back.years.tolist() == idx.years.tolist()
+    assert back.sources.tolist() == idx.sources.tolist()
+    assert back.doc_ids.tolist() == idx.doc_ids.tolist()
+    assert back.frequency().equals(idx.frequency())
+    assert back.encode_existing(["Blockchains"]).tolist() == idx.encode_existing(["blockchain"]).tolist()
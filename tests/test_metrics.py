@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import re
+
+import numpy as np
+import pytest
+
+from metrics import QUANTILES, Histogram, Metrics
+
+@pytest.mark.parametrize("seed,sigma", [(0, 0.5), (1, 1.5)])
+def test_percentiles_match_numpy(seed, sigma):
+    values = np.random.default_rng(seed).lognormal(mean=5.0, sigma=sigma, size=20_000)  # 약 150ms 중심 ms 값
+    h = Histogram()
+    for v in values:
+        h.record(v)
+
+    assert h.count == len(values)
+    assert h.sum_ms == pytest.approx(values.sum())
+    for q in (1, 10, 50, 90, 95, 99, 99.9, 100):
+        expected = np.percentile(values, q, method="inverted_cdf")
+        assert h.percentile(q) == pytest.approx(expected, rel=1 / 64, abs=0.002)
+    assert h.max_ms == pytest.approx(values.max())
+
+def test_merge_and_dict_round_trip():
+    a, b = Histogram(), Histogram()
+    for v in range(1, 501):
+        (a if v % 2 else b).record(v * 0.7)
+    merged = Histogram().merge(a).merge(b)
+    back = Histogram.from_dict(merged.to_dict())
+
+    assert back.count == 500 and back.min_ms == pytest.approx(0.7)
+    assert back.percentile(90) == merged.percentile(90)
+
+PROM_LINE = re.compile(
+    r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{([a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\]|\\.)*",?)*\})? -?[0-9.e+-]+$'
+)
+
+def test_prometheus_export_format(tmp_path):
+    m = Metrics()
+    for ms in (10, 20, 30, 40):
+        m.observe("ttfb", ms, site='we"ird\\host')
+    m.observe("parse", 1.5, site="theverge")
+    m.incr("pages", 3, site="theverge")
+    path = tmp_path / "m.prom"
+    m.to_prometheus(str(path))
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    samples = [l for l in lines if not l.startswith("#")]
+    assert all(PROM_LINE.match(l) for l in samples), [l for l in samples if not PROM_LINE.match(l)]
+    assert "# TYPE crawler_stage_ms summary" in lines
+    assert "# TYPE crawler_events_total counter" in lines
+
+    ttfb = [l for l in samples if 'stage="ttfb"' in l]
+    assert 'site="we\\"ird\\\\host"' in ttfb[0]
+    assert sum('quantile="' in l for l in ttfb) == len(QUANTILES)
+    assert any(l.startswith("crawler_stage_ms_count{") and l.endswith(" 4") for l in ttfb)
+    assert any(l.startswith("crawler_stage_ms_sum{") and l.endswith(" 100.0") for l in ttfb)
+    assert 'crawler_events_total{name="pages",site="theverge"} 3' in samples
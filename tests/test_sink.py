@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from sink import RowSink, UrlIndex, compact_output, read_output
+
+COLUMNS = ["title", "url"]
+
+def _write(path, rows, **kw):
+    with RowSink(str(path), columns=kw.pop("columns", COLUMNS), **kw) as sink:
+        sink.write_many(rows)
+
+def test_csv_append_reuses_existing_header(tmp_path):
+    path = tmp_path / "out.csv"
+    _write(path, [{"title": "A", "url": "u1"}])
+    # 열 순서를 다르게 줘도 기존 헤더를 따르고 헤더·BOM을 다시 쓰지 않음
+    _write(path, [{"url": "u2", "title": "B", "extra": "x"}], columns=["url", "title", "extra"], append=True)
+
+    text = path.read_text(encoding="utf-8")
+    assert text.count("title,url") == 1 and text.count("\ufeff") == 1
+    assert read_output(str(path)).values.tolist() == [["A", "u1"], ["B", "u2"]]
+
+@pytest.mark.parametrize("ext", ["jsonl", "parquet"])
+def test_round_trip(tmp_path, ext):
+    path = str(tmp_path / f"out.{ext}")
+    rows = [{"title": "A", "url": "u1", "n": None}, {"title": "B", "url": "u2", "n": "2"}]
+    _write(path, rows, columns=["title", "url", "n"], buffer_rows=1)
+
+    df = read_output(path)
+    assert df.columns.tolist() == ["title", "url", "n"]
+    assert df["url"].tolist() == ["u1", "u2"]
+    assert df["n"].isna().tolist() == [True, False]
+
+def test_jsonl_append(tmp_path):
+    path = str(tmp_path / "out.jsonl")
+    _write(path, [{"title": "A", "url": "u1"}])
+    _write(path, [{"title": "B", "url": "u2"}], append=True)
+    assert read_output(path)["url"].tolist() == ["u1", "u2"]
+
+def test_url_index_persists_only_committed(tmp_path):
+    out, db = str(tmp_path / "out.csv"), str(tmp_path / "state.db")
+    _write(out, [{"title": "A", "url": "u1"}])
+
+    idx = UrlIndex(out, db_path=db)          # 기존 출력에서 채움
+    assert "u1" in idx
+    idx.add("u2")
+    assert "u2" in idx                        # 이번 실행 안에서는 바로 보임
+    idx.close()
+
+    idx = UrlIndex(out, db_path=db)           # commit 전 종료 → 다시 열면 없음
+    assert "u2" not in idx and len(idx) == 1
+    idx.add("u2")
+    idx.commit()
+    idx.close()
+
+    idx = UrlIndex(out, db_path=db)
+    assert "u2" in idx and len(idx) == 2
+    idx.close()
+
+@pytest.mark.parametrize("keep,title", [("first", "old"), ("last", "new")])
+def test_compact_output_keep(tmp_path, keep, title):
+    path = str(tmp_path / "out.csv")
+    _write(path, [{"title": "old", "url": "u1"}, {"title": "B", "url": "u2"}, {"title": "new", "url": "u1"}])
+
+    assert compact_output(path, keep=keep) == (3, 2)
+    df = read_output(path)
+    assert sorted(df["url"]) == ["u1", "u2"]
+    assert df.loc[df["url"] == "u1", "title"].tolist() == [title]
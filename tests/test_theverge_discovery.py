@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import TheVerge
+
+class _Resp:
+    def __init__(self, status, text=""):
+        self.status_code = status
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise TheVerge.requests.HTTPError(f"HTTP {self.status_code}")
+
+def _page(n, total=3):
+    items = "".join(f'<a href="/news/{n}{i}/story-{n}-{i}">s</a>' for i in range(2))
+    return f"<html><body><p>Page {n} of {total}</p>{items}</body></html>"
+
+class _FakeSession:
+    def __init__(self, statuses):
+        self.statuses = statuses  # 페이지 번호 → HTTP 상태
+        self.calls = []
+
+    def get(self, url, timeout=None):
+        page = int(url.rstrip("/").rsplit("/", 1)[1])
+        self.calls.append(page)
+        status = self.statuses.get(page, 200)
+        return _Resp(status, _page(page) if status == 200 else "")
+
+def test_rate_limited_page_leaves_month_incomplete():
+    sess = _FakeSession({2: 429})
+    links, pages, complete = TheVerge.discover_month(sess, "ai", 2024, 1)
+
+    assert complete is False
+    assert pages == 1
+    assert len(links) == 2
+    assert sess.calls == [1, 2]
+
+def test_missing_page_ends_month_as_complete():
+    sess = _FakeSession({3: 404})
+    links, pages, complete = TheVerge.discover_month(sess, "ai", 2024, 1)
+
+    assert complete is True
+    assert len(links) == 4
+
+def test_incomplete_month_is_not_cached(tmp_path, monkeypatch):
+    db = str(tmp_path / "state.db")
+    cache_cls = TheVerge.MonthLinkCache
+    monkeypatch.setattr(TheVerge, "MonthLinkCache", lambda: cache_cls(db))
+    monkeypatch.setattr(TheVerge, "get_session", lambda limiter=None: _FakeSession({2: 503}))
+
+    links = TheVerge.collect_theverge_links("2024-01-01", "2024-01-31", section="ai", workers=1)
+
+    assert len(links) == 2
+    cache = TheVerge.MonthLinkCache()
+    assert cache.get("ai", 2024, 1) is None
+    cache.close()
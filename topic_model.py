@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 LDA 토픽 모델링 (01_LDA_Academia / 01_LDA_Industry 노트북용)
+
+- 문서는 corpus_store(Parquet)에서 배치 단위로 읽고, 제너레이터 토크나이저로 토큰화
+- 1차 패스: 어휘 사전 구축(min_df/max_df로 가지치기) → 2차 패스: chunk_size개씩 CSR 문서-단어 행렬 생성
+- 온라인(미니배치) LDA를 청크마다 partial_fit → 최대 메모리는 청크 크기·어휘 크기로 고정(코퍼스 크기 무관)
+- 새 크롤 배치는 저장된 모델에 partial_fit으로 이어서 학습 (어휘는 고정, 새 단어는 무시)
+
+사용 예:
+python topic_model.py train --store corpus --category journal --topics 10 --model lda_academia.joblib
+python topic_model.py train --store corpus --category industry --fields title content --model lda_industry.joblib
+python topic_model.py update --store corpus --category journal --years 2025 --model lda_academia.joblib
+python topic_model.py topics --model lda_academia.joblib
+
+from topic_model import StreamingLDA, corpus_documents
+lda = StreamingLDA(n_topics=10)
+lda.fit(lambda: corpus_documents("corpus", category="journal"))
+"""
+
+import os, re, argparse
+from collections import Counter
+from itertools import islice
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.decomposition import LatentDirichletAllocation
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from corpus_store import DEFAULT_STORE, iter_batches
+
+# =========================
+# 설정
+# =========================
+DEFAULT_FIELDS = ("title", "abstract")   # 뉴스는 ("title", "content")
+CHUNK_SIZE = 2000                        # CSR 청크(=partial_fit 미니배치) 문서 수
+MAX_VOCAB = 20000
+TOKEN_PAT = re.compile(r"[a-z][a-z0-9\-]+")
+
+# =========================
+# 문서 / 토큰 스트림
+# =========================
+def corpus_documents(store: str = DEFAULT_STORE, fields=DEFAULT_FIELDS, **filters):
+    """코퍼스 저장소 → 문서 텍스트 제너레이터 (fields를 공백으로 이어 붙임)"""
+    for batch in iter_batches(store, columns=list(fields), **filters):
+        cols = [batch.column(f).to_pylist() for f in fields]
+        for values in zip(*cols):
+            text = " ".join(v for v in values if v)
+            if text:
+                yield text
+
+def simple_tokenize(text: str) -> list:
+    """기본 토크나이저: 소문자 + 영문 토큰 + 불용어 제거 (preprocess.py 파이프라인으로 교체 가능)"""
+    return [t for t in TOKEN_PAT.findall(text.lower()) if t not in ENGLISH_STOP_WORDS]
+
+def chunked(iterable, size: int):
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+# =========================
+# 모델
+# =========================
+class StreamingLDA:
+    def __init__(self, n_topics: int = 10, max_vocab: int = MAX_VOCAB, min_df: int = 5, max_df: float = 0.5,
+                 chunk_size: int = CHUNK_SIZE, n_jobs: int = -1, random_state: int = 42, tokenizer=None):
+        """
+        min_df: 최소 문서 빈도(개수), max_df: 최대 문서 빈도(비율) — 어휘 가지치기 기준
+        n_jobs: E-step 병렬 프로세스 수 (-1 = 전체 코어)
+        tokenizer: 텍스트 → 토큰 리스트 (None이면 simple_tokenize)
+        """
+        self.n_topics = n_topics
+        self.max_vocab = max_vocab
+        self.min_df = min_df
+        self.max_df = max_df
+        self.chunk_size = chunk_size
+        self.tokenizer = tokenizer or simple_tokenize
+        self.vocab = None          # {단어: 열 번호}
+        self.n_docs = 0            # 지금까지 학습한 문서 수
+        self.lda = LatentDirichletAllocation(
+            n_components=n_topics, learning_method="online", batch_size=chunk_size,
+            n_jobs=n_jobs, random_state=random_state,
+        )
+
+    # ---------- 어휘 ----------
+    def build_vocabulary(self, docs):
+        """1차 패스: 문서 빈도만 세고 텍스트는 버림 (메모리 = 고유 단어 수)"""
+        df_counts = Counter()
+        n = 0
+        for text in docs:
+            df_counts.update(set(self.tokenizer(text)))
+            n += 1
+        if n == 0:
+            raise ValueError("학습할 문서가 없습니다")
+        max_count = self.max_df * n
+        kept = [(w, c) for w, c in df_counts.items() if c >= self.min_df and c <= max(max_count, 1)]
+        kept.sort(key=lambda wc: (-wc[1], wc[0]))
+        self.vocab = {w: i for i, (w, _) in enumerate(kept[: self.max_vocab])}
+        if not self.vocab:
+            raise ValueError("어휘가 비었습니다 (min_df/max_df 조정 필요)")
+        return n
+
+    @property
+    def feature_names(self) -> list:
+        names = [None] * len(self.vocab)
+        for w, i in self.vocab.items():
+            names[i] = w
+        return names
+
+    # ---------- 문서-단어 행렬 ----------
+    def to_csr(self, texts) -> sp.csr_matrix:
+        """문서 목록 → CSR (어휘 밖 단어는 무시)"""
+        indptr, indices, data = [0], [], []
+        vocab = self.vocab
+        for text in texts:
+            counts = Counter(vocab[t] for t in self.tokenizer(text) if t in vocab)
+            indices.extend(counts.keys())
+            data.extend(counts.values())
+            indptr.append(len(indices))
+        return sp.csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(vocab)),
+        )
+
+    def iter_chunks(self, docs):
+        for texts in chunked(docs, self.chunk_size):
+            yield self.to_csr(texts)
+
+    # ---------- 학습 ----------
+    def partial_fit(self, docs):
+        """
+        새 문서 배치로 이어서 학습
+        docs: 문서 이터러블, 또는 호출할 때마다 새 이터레이터를 주는 함수
+        어휘가 없으면 함수로 받아 1차 패스(어휘)와 2차 패스(학습)를 따로 스트리밍 — 문서를 메모리에 모으지 않음
+        """
+        if self.vocab is None:
+            if not callable(docs):
+                raise TypeError("어휘가 없으면 docs는 문서 이터레이터를 돌려주는 함수여야 합니다 (두 번 스트리밍)")
+            self.build_vocabulary(docs())
+        if callable(docs):
+            docs = docs()
+        for X in self.iter_chunks(docs):
+            if X.nnz:
+                self.lda.partial_fit(X)
+                self.n_docs += X.shape[0]
+        return self
+
+    def fit(self, doc_factory, passes: int = 1):
+        """
+        doc_factory: 호출할 때마다 새 문서 이터레이터를 돌려주는 함수 (패스마다 다시 스트리밍)
+        passes: 전체 코퍼스 반복 횟수
+        """
+        n = self.build_vocabulary(doc_factory())
+        print(f"📚 문서 {n}개, 어휘 {len(self.vocab)}개")
+        self.lda.set_params(total_samples=n)
+        for p in range(passes):
+            self.partial_fit(doc_factory())
+            print(f"🔁 패스 {p + 1}/{passes} 완료")
+        return self
+
+    # ---------- 결과 ----------
+    def transform(self, docs) -> np.ndarray:
+        """문서별 토픽 분포 (청크 단위로 계산해 이어 붙임)"""
+        out = [self.lda.transform(X) for X in self.iter_chunks(docs)]
+        return np.vstack(out) if out else np.empty((0, self.n_topics))
+
+    def top_words(self, n: int = 10) -> list:
+        names = np.asarray(self.feature_names)
+        return [names[np.argsort(-comp)[:n]].tolist() for comp in self.lda.components_]
+
+    def perplexity(self, docs) -> float:
+        """
+        청크별 로그 우도 하한(score)을 누적해 계산 — 전체 행렬을 쌓지 않음
+        score = 문서 항(청크별로 더해짐) + 토픽-단어 항(모델 상수)이므로 빈 문서 하나의 score로 상수를 빼서 합산
+        """
+        n_features = len(self.vocab)
+        const = self.lda.score(sp.csr_matrix((1, n_features), dtype=np.float32))
+        bound, words = const, 0.0
+        for X in self.iter_chunks(docs):
+            if X.nnz:
+                bound += self.lda.score(X) - const
+                words += X.sum()
+        if words == 0:
+            raise ValueError("어휘에 해당하는 단어가 없습니다")
+        return float(np.exp(-bound / words))
+
+    # ---------- 저장 ----------
+    def save(self, path: str):
+        import joblib
+        tokenizer = self.tokenizer
+        self.tokenizer = None  # 토크나이저(캐시 연결 포함)는 저장하지 않음 → load 시 다시 지정
+        try:
+            joblib.dump(self, path)
+        finally:
+            self.tokenizer = tokenizer
+
+    @staticmethod
+    def load(path: str, tokenizer=None) -> "StreamingLDA":
+        import joblib
+        model = joblib.load(path)
+        model.tokenizer = tokenizer or model.tokenizer or simple_tokenize
+        return model
+
+# =========================
+# CLI
+# =========================
+def main():
+    ap = argparse.ArgumentParser(description="코퍼스 저장소 기반 스트리밍 LDA")
+    ap.add_argument("command", choices=["train", "update", "topics"])
+    ap.add_argument("--model", required=True, help="모델 파일 경로 (.joblib)")
+    ap.add_argument("--store", default=DEFAULT_STORE, help="corpus_store Parquet 디렉터리")
+    ap.add_argument("--category", default=None, help="journal / industry")
+    ap.add_argument("--sources", nargs="*", default=None, help="source 필터 (예: jmis misq)")
+    ap.add_argument("--years", nargs="*", type=int, default=None, help="연도 필터")
+    ap.add_argument("--fields", nargs="+", default=list(DEFAULT_FIELDS), help="토픽 모델링에 쓸 열")
+    ap.add_argument("--topics", type=int, default=10)
+    ap.add_argument("--passes", type=int, default=1)
+    ap.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    ap.add_argument("--min-df", type=int, default=5)
+    ap.add_argument("--max-df", type=float, default=0.5)
+    ap.add_argument("--n-jobs", type=int, default=-1)
+    ap.add_argument("--top", type=int, default=10, help="토픽별 출력 단어 수")
+    ap.add_argument("--preprocess", action="store_true",
+                    help="preprocess.py 파이프라인(NER 이름 제거·도메인 불용어·단수화, 캐시 사용)으로 토큰화")
+    ap.add_argument("--n-process", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                    help="--preprocess의 NER(nlp.pipe) 병렬 프로세스 수")
+    args = ap.parse_args()
+
+    filters = {"category": args.category, "sources": args.sources, "years": args.years}
+    docs = lambda: corpus_documents(args.store, fields=args.fields, **filters)
+    tokenizer = None
+    if args.preprocess and args.command in ("train", "update"):  # topics는 토큰화하지 않음
+        from preprocess import Preprocessor
+        tokenizer = Preprocessor(n_process=args.n_process)
+        tokenizer.warm(docs())  # 새/변경 문서만 NER 배치 처리 → 이후 패스는 캐시 조회
+
+    if args.command == "train":
+        model = StreamingLDA(n_topics=args.topics, min_df=args.min_df, max_df=args.max_df,
+                             chunk_size=args.chunk_size, n_jobs=args.n_jobs, tokenizer=tokenizer)
+        model.fit(docs, passes=args.passes)
+        model.save(args.model)
+    elif args.command == "update":
+        model = StreamingLDA.load(args.model, tokenizer=tokenizer)
+        before = model.n_docs
+        model.partial_fit(docs())
+        model.save(args.model)
+        print(f"➕ {model.n_docs - before}개 문서로 추가 학습")
+    else:
+        model = StreamingLDA.load(args.model)
+
+    for i, words in enumerate(model.top_words(args.top)):
+        print(f"Topic {i:>2}: {' '.join(words)}")
+
+if __name__ == "__main__":
+    main()